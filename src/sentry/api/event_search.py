@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import functools
 import re
+import threading
 from collections.abc import Callable, Generator, Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeIs, cast, overload
 
+from cachetools import LRUCache
 from django.utils.functional import cached_property
 from parsimonious.exceptions import IncompleteParseError
 from parsimonious.grammar import Grammar
@@ -37,6 +39,7 @@ from sentry.search.utils import (
     parse_size,
 )
 from sentry.snuba.dataset import Dataset
+from sentry.utils import metrics
 from sentry.utils.snuba import is_duration_measurement, is_measurement, is_span_op_breakdown
 from sentry.utils.validators import is_event_id, is_span_id
 
@@ -1691,6 +1694,58 @@ default_config = SearchConfig(
 )
 
 
+# Parse trees only depend on the query string, so they are shared process-wide. The cache is
+# bounded by an estimate of the memory held by the cached trees: a parsimonious node, its slot
+# in the parent's children list and its own children list take roughly this many bytes.
+PARSE_TREE_NODE_BYTES = 150
+PARSE_TREE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _parse_tree_size(tree: Node) -> int:
+    """
+    Estimates the memory held by ``tree`` from its number of nodes.
+    """
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count * PARSE_TREE_NODE_BYTES
+
+
+_parse_tree_cache: LRUCache[str, Node] = LRUCache(
+    maxsize=PARSE_TREE_CACHE_MAX_BYTES, getsizeof=_parse_tree_size
+)
+_parse_tree_cache_lock = threading.Lock()
+
+
+def _parse_query_tree(query: str) -> Node:
+    """
+    Returns the parse tree for ``query``, parsing it only if it isn't cached yet.
+
+    Only the tree is cached, not the visited tokens: those also depend on the config, field type
+    resolvers and params, and relative dates in them resolve against the current time.
+    """
+    with _parse_tree_cache_lock:
+        tree = _parse_tree_cache.get(query)
+
+    if tree is not None:
+        metrics.incr("event_search.parse_tree_cache", tags={"result": "hit"}, sample_rate=0.1)
+        return tree
+
+    metrics.incr("event_search.parse_tree_cache", tags={"result": "miss"}, sample_rate=0.1)
+    tree = event_search_grammar.parse(query)
+    with _parse_tree_cache_lock:
+        try:
+            _parse_tree_cache[query] = tree
+        except ValueError:
+            # The query alone exceeds the whole budget
+            pass
+
+    return tree
+
+
 @overload
 def parse_search_query(
     query: str,
@@ -1725,7 +1780,7 @@ def parse_search_query(
         config = default_config
 
     try:
-        tree = event_search_grammar.parse(query)
+        tree = _parse_query_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
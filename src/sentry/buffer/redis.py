@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import pickle
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from enum import Enum
@@ -58,6 +61,8 @@ def _validate_json_roundtrip(value: dict[str, Any], model: type[models.Model]) -
 
 class BufferHookEvent(Enum):
     FLUSH = "flush"
+    # Fired after locally aggregated increments have been written to Redis.
+    INCR_FLUSH = "incr_flush"
 
 
 class BufferHookRegistry:
@@ -221,17 +226,68 @@ class PendingBuffer:
         return rv
 
 
+@dataclass
+class PendingIncr:
+    """
+    Increments for a single buffer key that have been aggregated in-process
+    and not been written to Redis yet.
+    """
+
+    model: type[models.Model]
+    filters: dict[str, BufferField]
+    columns: dict[str, int]
+    extra: dict[str, Any]
+    signal_only: bool | None
+    calls: int = 1
+
+
 class RedisBuffer(Buffer):
     key_expire = 60 * 60  # 1 hour
     pending_key = "b:p"
 
-    def __init__(self, incr_batch_size: int = 2, **options: object):
+    def __init__(
+        self,
+        incr_batch_size: int = 2,
+        incr_aggregation_window: float = 0,
+        incr_aggregation_max_keys: int = 1000,
+        max_incr_batch_size: int | None = None,
+        pending_target_tasks: int = 1000,
+        pending_chunk_size: int = 10000,
+        pending_drain_workers: int = 8,
+        **options: object,
+    ):
+        """
+        :param incr_aggregation_window: When larger than zero, `incr` calls
+            are summed up in-process for up to this many seconds (or until
+            `incr_aggregation_max_keys` distinct keys are pending) and then
+            written to Redis together. Disabled by default.
+        :param max_incr_batch_size: Upper bound for the `process_incr` batch
+            size when it is grown with the backlog, aiming for
+            `pending_target_tasks` tasks per drain. Defaults to
+            `incr_batch_size`, i.e. fixed-size batches.
+        :param pending_chunk_size: How many pending keys to read and remove
+            per round-trip while draining.
+        :param pending_drain_workers: How many hosts to drain concurrently.
+        """
         self.is_redis_cluster, self.cluster, options = get_dynamic_cluster_from_options(
             "SENTRY_BUFFER_OPTIONS", options
         )
         self.incr_batch_size = incr_batch_size
         assert self.incr_batch_size > 0
 
+        self.max_incr_batch_size = max_incr_batch_size or incr_batch_size
+        self.pending_target_tasks = pending_target_tasks
+        self.pending_chunk_size = pending_chunk_size
+        self.pending_drain_workers = pending_drain_workers
+
+        self.incr_aggregation_window = incr_aggregation_window
+        self.incr_aggregation_max_keys = incr_aggregation_max_keys
+        self._pending_incrs: dict[str, PendingIncr] = {}
+        self._pending_incrs_lock = threading.Lock()
+        self._pending_incrs_timer: threading.Timer | None = None
+        if self.incr_aggregation_window > 0:
+            atexit.register(self.flush_pending_incrs)
+
     def validate(self) -> None:
         validate_dynamic_cluster(self.is_redis_cluster, self.cluster)
 
@@ -465,9 +521,33 @@ class RedisBuffer(Buffer):
         - Add hashmap key to pending flushes
         """
         key = self._make_key(model, filters)
+
+        metrics.incr(
+            "buffer.incr",
+            skip_internal=True,
+            tags={"module": model.__module__, "model": model.__name__},
+        )
+
+        if self.incr_aggregation_window > 0:
+            self._aggregate_incr(key, model, columns, filters, extra, signal_only)
+            return
+
         # We can't use conn.map() due to wanting to support multiple pending
         # keys (one per Redis partition)
         pipe = self.get_redis_connection(key)
+        self._add_incr_to_pipeline(pipe, key, model, columns, filters, extra, signal_only)
+        pipe.execute()
+
+    def _add_incr_to_pipeline(
+        self,
+        pipe: Pipeline,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, BufferField],
+        extra: dict[str, Any] | None,
+        signal_only: bool | None,
+    ) -> None:
         pipe.hsetnx(key, "m", f"{model.__module__}.{model.__name__}")
         _validate_json_roundtrip(filters, model)
 
@@ -495,22 +575,165 @@ class RedisBuffer(Buffer):
 
         pipe.expire(key, self.key_expire)
         pipe.zadd(self.pending_key, {key: time()})
-        pipe.execute()
 
-        metrics.incr(
-            "buffer.incr",
-            skip_internal=True,
-            tags={"module": model.__module__, "model": model.__name__},
+    def _aggregate_incr(
+        self,
+        key: str,
+        model: type[models.Model],
+        columns: dict[str, int],
+        filters: dict[str, BufferField],
+        extra: dict[str, Any] | None,
+        signal_only: bool | None,
+    ) -> None:
+        """
+        Merge an increment into the in-process pending increments: counters
+        are summed, `extra` values are last-write-wins and `signal_only` is
+        set if any of the merged calls set it.
+        """
+        with self._pending_incrs_lock:
+            pending = self._pending_incrs.get(key)
+            if pending is None:
+                self._pending_incrs[key] = PendingIncr(
+                    model=model,
+                    filters=filters,
+                    columns=dict(columns),
+                    extra=dict(extra or {}),
+                    signal_only=signal_only,
+                )
+            else:
+                for column, amount in columns.items():
+                    pending.columns[column] = pending.columns.get(column, 0) + amount
+                if extra:
+                    pending.extra.update(extra)
+                if signal_only is True:
+                    pending.signal_only = True
+                pending.calls += 1
+
+            should_flush = len(self._pending_incrs) >= self.incr_aggregation_max_keys
+            if not should_flush and self._pending_incrs_timer is None:
+                # Make sure increments never wait for longer than the window,
+                # even if no further increments come in.
+                self._pending_incrs_timer = threading.Timer(
+                    self.incr_aggregation_window, self.flush_pending_incrs
+                )
+                self._pending_incrs_timer.daemon = True
+                self._pending_incrs_timer.start()
+
+        if should_flush:
+            self.flush_pending_incrs()
+
+    def flush_pending_incrs(self) -> None:
+        """
+        Write all increments aggregated in this process to Redis, with one
+        pipeline per Redis host.
+        """
+        with self._pending_incrs_lock:
+            pending_incrs, self._pending_incrs = self._pending_incrs, {}
+            if self._pending_incrs_timer is not None:
+                self._pending_incrs_timer.cancel()
+                self._pending_incrs_timer = None
+
+        if not pending_incrs:
+            return
+
+        pipes: dict[Any, Pipeline] = {}
+        for key, pending in pending_incrs.items():
+            if is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+                host_id = self.cluster.get_router().get_host_for_key(key)
+            else:
+                host_id = None
+
+            pipe = pipes.get(host_id)
+            if pipe is None:
+                pipe = pipes[host_id] = self.get_redis_connection(key)
+
+            self._add_incr_to_pipeline(
+                pipe,
+                key,
+                pending.model,
+                pending.columns,
+                pending.filters,
+                pending.extra,
+                pending.signal_only,
+            )
+
+        for pipe in pipes.values():
+            pipe.execute()
+
+        metrics.distribution("buffer.incr.aggregated_keys", len(pending_incrs))
+        metrics.distribution(
+            "buffer.incr.aggregated_calls", sum(pending.calls for pending in pending_incrs.values())
         )
 
+        if redis_buffer_registry.has(BufferHookEvent.INCR_FLUSH):
+            try:
+                redis_buffer_registry.callback(BufferHookEvent.INCR_FLUSH)
+            except Exception:
+                logger.exception("flush_pending_incrs.hook_error")
+
     def process_pending(self) -> None:
         client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
         lock_key = self._lock_key(client, self.pending_key, ex=60)
         if not lock_key:
             return
 
+        try:
+            if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+                keycount = self._drain_pending(self.cluster)
+            elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+                # Every host has its own pending set, drain them concurrently.
+                host_ids = list(self.cluster.hosts)
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(len(host_ids), self.pending_drain_workers)),
+                    thread_name_prefix=__name__,
+                ) as executor:
+                    keycount = sum(
+                        executor.map(
+                            lambda host_id: self._drain_pending(
+                                self.cluster.get_local_client(host_id)
+                            ),
+                            host_ids,
+                        )
+                    )
+            else:
+                raise AssertionError("unreachable")
+
+            metrics.distribution("buffer.pending-size", keycount)
+        finally:
+            client.delete(lock_key)
+
+    def _get_incr_batch_size(self, pending_count: int) -> int:
+        """
+        Grow `process_incr` batches with the backlog, so that draining a large
+        backlog does not enqueue a flood of tiny tasks.
+        """
+        if self.max_incr_batch_size <= self.incr_batch_size:
+            return self.incr_batch_size
+
+        return min(
+            self.max_incr_batch_size,
+            max(self.incr_batch_size, pending_count // self.pending_target_tasks),
+        )
+
+    def _drain_pending(self, conn: Any) -> int:
+        """
+        Drain the pending set on `conn` oldest-first, in chunks of
+        `pending_chunk_size` keys, and dispatch `process_incr` tasks for
+        them. Only as many keys as were pending when draining started are
+        drained, keys added in the meantime are left for the next run.
+        """
+        pending_count = conn.zcard(self.pending_key)
+        if not pending_count:
+            return 0
+
+        oldest = conn.zrange(self.pending_key, 0, 0, withscores=True)
+        if oldest:
+            metrics.distribution("buffer.pending-age", time() - oldest[0][1], unit="second")
+
+        incr_batch_size = self._get_incr_batch_size(pending_count)
+        metrics.distribution("buffer.process-incr-batch-size", incr_batch_size)
         pending_buffers_router = redis_buffer_router.create_pending_buffers_router(
-            incr_batch_size=self.incr_batch_size
+            incr_batch_size=incr_batch_size
         )
 
         def _generate_process_incr_kwargs(model_key: str | None) -> dict[str, Any]:
@@ -535,60 +758,20 @@ class RedisBuffer(Buffer):
                 metrics.incr("buffer.process-incr-default-queue")
             return process_incr_kwargs
 
-        try:
-            keycount = 0
-            if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-                keys: list[str] = self.cluster.zrange(self.pending_key, 0, -1)
-                keycount += len(keys)
-
-                for key in keys:
-                    model_key = self._extract_model_from_key(key=key)
-                    pending_buffer = pending_buffers_router.get_pending_buffer(model_key=model_key)
-                    pending_buffer.append(item=key)
-                    if pending_buffer.full():
-                        process_incr_kwargs = _generate_process_incr_kwargs(model_key=model_key)
-                        process_incr.apply_async(
-                            kwargs={"batch_keys": pending_buffer.flush()},
-                            headers={"sentry-propagate-traces": False},
-                            **process_incr_kwargs,
-                        )
-
-                self.cluster.zrem(self.pending_key, *keys)
-            elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
-                with self.cluster.all() as conn:
-                    results = conn.zrange(self.pending_key, 0, -1)
-
-                with self.cluster.all() as conn:
-                    for host_id, keysb in results.value.items():
-                        if not keysb:
-                            continue
-                        keycount += len(keysb)
-                        for keyb in keysb:
-                            key = keyb.decode("utf-8")
-                            model_key = self._extract_model_from_key(key=key)
-                            pending_buffer = pending_buffers_router.get_pending_buffer(
-                                model_key=model_key
-                            )
-                            pending_buffer.append(item=key)
-                            if pending_buffer.full():
-                                process_incr_kwargs = _generate_process_incr_kwargs(
-                                    model_key=model_key
-                                )
-                                process_incr.apply_async(
-                                    kwargs={"batch_keys": pending_buffer.flush()},
-                                    headers={"sentry-propagate-traces": False},
-                                    **process_incr_kwargs,
-                                )
-                        conn.target([host_id]).zrem(self.pending_key, *keysb)
-            else:
-                raise AssertionError("unreachable")
-
-            # process any non-empty pending buffers
-            for pending_buffer_value in pending_buffers_router.pending_buffers():
-                pending_buffer = pending_buffer_value.pending_buffer
-                model_key = pending_buffer_value.model_key
-
-                if not pending_buffer.empty():
+        keycount = 0
+        while keycount < pending_count:
+            chunk = conn.zrange(
+                self.pending_key, 0, min(self.pending_chunk_size, pending_count - keycount) - 1
+            )
+            if not chunk:
+                break
+
+            for raw_key in chunk:
+                key = force_str(raw_key)
+                model_key = self._extract_model_from_key(key=key)
+                pending_buffer = pending_buffers_router.get_pending_buffer(model_key=model_key)
+                pending_buffer.append(item=key)
+                if pending_buffer.full():
                     process_incr_kwargs = _generate_process_incr_kwargs(model_key=model_key)
                     process_incr.apply_async(
                         kwargs={"batch_keys": pending_buffer.flush()},
@@ -596,9 +779,23 @@ class RedisBuffer(Buffer):
                         **process_incr_kwargs,
                     )
 
-            metrics.distribution("buffer.pending-size", keycount)
-        finally:
-            client.delete(lock_key)
+            conn.zrem(self.pending_key, *chunk)
+            keycount += len(chunk)
+
+        # process any non-empty pending buffers
+        for pending_buffer_value in pending_buffers_router.pending_buffers():
+            pending_buffer = pending_buffer_value.pending_buffer
+            model_key = pending_buffer_value.model_key
+
+            if not pending_buffer.empty():
+                process_incr_kwargs = _generate_process_incr_kwargs(model_key=model_key)
+                process_incr.apply_async(
+                    kwargs={"batch_keys": pending_buffer.flush()},
+                    headers={"sentry-propagate-traces": False},
+                    **process_incr_kwargs,
+                )
+
+        return keycount
 
     def process(self, key: str | None = None, batch_keys: list[str] | None = None, **kwargs: Any) -> None:  # type: ignore[override]
         # NOTE: This method has a totally different signature than the base class
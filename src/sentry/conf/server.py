@@ -2336,6 +2336,20 @@ SENTRY_OPTIONS: dict[str, Any] = {}
 SENTRY_DEFAULT_OPTIONS: dict[str, Any] = {}
 # Raise an error in dev on failed lookups
 SENTRY_OPTIONS_COMPLAIN_ON_ERRORS = True
+# Serve stored options from an in-process snapshot of the options table
+# instead of looking up keys one by one through the cache. The snapshot is
+# refreshed in the background from the `last_updated` watermark, and changed
+# keys are pushed to every process over a redis pubsub channel. Reads fall
+# back to the cache and the store when the snapshot is older than `max_age`.
+# See sentry/options/snapshot.py.
+SENTRY_OPTIONS_SNAPSHOT: dict[str, Any] = {
+    "enabled": False,
+    "cluster": "default",
+    "channel": "sentry-options",
+    "refresh_interval": 10,
+    "full_refresh_interval": 300,
+    "max_age": 300,
+}
 
 # Delay (in ms) to induce on API responses
 #
@@ -113,6 +113,31 @@ def ingest_monitors_options() -> list[click.Option]:
     return options
 
 
+def monitors_clock_tasks_options() -> list[click.Option]:
+    """Return a list of monitors-clock-tasks options."""
+    options = [
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["serial", "batched"]),
+            default="serial",
+            help="The mode to process clock tasks in. Batched handles missed monitors in bulk.",
+        ),
+        click.Option(
+            ["--max-batch-size", "max_batch_size"],
+            type=int,
+            default=500,
+            help="Maximum number of clock tasks to batch before processing them.",
+        ),
+        click.Option(
+            ["--max-batch-time", "max_batch_time"],
+            type=int,
+            default=1,
+            help="Maximum time spent batching clock tasks before processing them.",
+        ),
+    ]
+    return options
+
+
 def uptime_options() -> list[click.Option]:
     """Return a list of uptime-results options."""
     options = [
@@ -262,6 +287,7 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
     "monitors-clock-tasks": {
         "topic": Topic.MONITORS_CLOCK_TASKS,
         "strategy_factory": "sentry.monitors.consumers.clock_tasks_consumer.MonitorClockTasksStrategyFactory",
+        "click_options": monitors_clock_tasks_options(),
     },
     "monitors-incident-occurrences": {
         "topic": Topic.MONITORS_INCIDENT_OCCURRENCES,
@@ -424,6 +450,18 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
                 default=100,
                 help="The number of segments to download from redis at once. Defaults to 100.",
             ),
+            click.Option(
+                ["--max-segment-spans", "max_segment_spans"],
+                type=int,
+                default=1001,
+                help="Flush a segment as soon as it holds this many spans. Defaults to 1001.",
+            ),
+            click.Option(
+                ["--flusher-processes", "flusher_processes"],
+                type=int,
+                default=1,
+                help="The number of processes the assigned shards are flushed from. Defaults to 1.",
+            ),
             *multiprocessing_options(default_max_batch_size=100),
         ],
     },
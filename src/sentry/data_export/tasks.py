@@ -2,14 +2,18 @@ import codecs
 import csv
 import logging
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from hashlib import sha1
 
 import sentry_sdk
 from celery.exceptions import MaxRetriesExceededError
 from django.core.files.base import ContentFile
-from django.db import IntegrityError, router
+from django.db import IntegrityError, connections, router
 from django.utils import timezone
 
+from sentry import options
 from sentry.models.files.file import File
 from sentry.models.files.fileblob import FileBlob
 from sentry.models.files.fileblobindex import FileBlobIndex
@@ -122,23 +126,22 @@ def assemble_download(
 
                 rows = []
 
-                for _ in range(MAX_FRAGMENTS_PER_BATCH):
-                    # the number of rows to export in the next batch fragment
-                    fragment_row_count = min(batch_size, max(export_limit - next_offset, 1))
+                with closing(
+                    iter_fragment_rows(processor, data_export, batch_size, offset, export_limit)
+                ) as fragments:
+                    for rows in fragments:
+                        writer.writerows(rows)
 
-                    rows = process_rows(processor, data_export, fragment_row_count, next_offset)
-                    writer.writerows(rows)
+                        fragment_offset += len(rows)
+                        next_offset = offset + fragment_offset
 
-                    fragment_offset += len(rows)
-                    next_offset = offset + fragment_offset
-
-                    if (
-                        not rows
-                        or len(rows) < batch_size
-                        # the batch may exceed MAX_BATCH_SIZE but immediately stops
-                        or tf.tell() - starting_pos >= MAX_BATCH_SIZE
-                    ):
-                        break
+                        if (
+                            not rows
+                            or len(rows) < batch_size
+                            # the batch may exceed MAX_BATCH_SIZE but immediately stops
+                            or tf.tell() - starting_pos >= MAX_BATCH_SIZE
+                        ):
+                            break
 
                 tf.seek(0)
                 new_bytes_written = store_export_chunk_as_blob(data_export, bytes_written, tf)
@@ -202,6 +205,13 @@ def assemble_download(
                 merge_export_blobs.delay(data_export_id)
 
 
+def report_export_error(error):
+    error_str = str(error)
+    metrics.incr("dataexport.error", tags={"error": error_str}, sample_rate=1.0)
+    logger.info("dataexport.error: %s", error_str)
+    capture_exception(error)
+
+
 def get_processor(data_export, environment_id):
     try:
         if data_export.query_type == ExportQueryType.ISSUES_BY_TAG:
@@ -221,13 +231,56 @@ def get_processor(data_export, environment_id):
         else:
             raise ExportError(f"No processor found for this query type: {data_export.query_type}")
     except ExportError as error:
-        error_str = str(error)
-        metrics.incr("dataexport.error", tags={"error": error_str}, sample_rate=1.0)
-        logger.info("dataexport.error: %s", error_str)
-        capture_exception(error)
+        report_export_error(error)
         raise
 
 
+def iter_fragment_rows(processor, data_export, batch_size, offset, export_limit):
+    """
+    Yields the rows of up to MAX_FRAGMENTS_PER_BATCH successive batch fragments,
+    starting at `offset`.
+
+    The caller stops at the first fragment that is not full, so the offset of
+    every fragment is known before the rows of the previous one arrive. This
+    lets Discover fragments be fetched from Snuba ahead of time, up to
+    `data-export.fetch-concurrency` at once. Fragments fetched ahead are
+    thrown away when the caller stops early.
+    """
+
+    def get_fragment(index):
+        fragment_offset = offset + index * batch_size
+        # the number of rows to export in this batch fragment
+        fragment_row_count = min(batch_size, max(export_limit - fragment_offset, 1))
+        return fragment_row_count, fragment_offset
+
+    concurrency = options.get("data-export.fetch-concurrency")
+    if concurrency <= 1 or data_export.query_type != ExportQueryType.DISCOVER:
+        for index in range(MAX_FRAGMENTS_PER_BATCH):
+            yield process_rows(processor, data_export, *get_fragment(index))
+        return
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="data-export")
+    try:
+        pending = deque()
+        next_index = 0
+        for _ in range(MAX_FRAGMENTS_PER_BATCH):
+            while next_index < MAX_FRAGMENTS_PER_BATCH and len(pending) < concurrency:
+                pending.append(
+                    executor.submit(fetch_discover_in_thread, processor, *get_fragment(next_index))
+                )
+                next_index += 1
+
+            try:
+                raw_data_unicode = pending.popleft().result()
+            except ExportError as error:
+                report_export_error(error)
+                raise
+
+            yield processor.handle_fields(raw_data_unicode)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def process_rows(processor, data_export, batch_size, offset):
     try:
         if data_export.query_type == ExportQueryType.ISSUES_BY_TAG:
@@ -238,10 +291,7 @@ def process_rows(processor, data_export, batch_size, offset):
             raise ExportError(f"No processor found for this query type: {data_export.query_type}")
         return rows
     except ExportError as error:
-        error_str = str(error)
-        metrics.incr("dataexport.error", tags={"error": error_str}, sample_rate=1.0)
-        logger.info("dataexport.error: %s", error_str)
-        capture_exception(error)
+        report_export_error(error)
         raise
 
 
@@ -251,9 +301,21 @@ def process_issues_by_tag(processor, limit, offset):
 
 
 @handle_snuba_errors(logger)
+def fetch_discover(processor, limit, offset):
+    return processor.data_fn(limit=limit, offset=offset)["data"]
+
+
+def fetch_discover_in_thread(processor, limit, offset):
+    try:
+        return fetch_discover(processor, limit, offset)
+    finally:
+        # Building the query can hit the database. Connections are per thread,
+        # don't leave them behind with the thread.
+        connections.close_all()
+
+
 def process_discover(processor, limit, offset):
-    raw_data_unicode = processor.data_fn(limit=limit, offset=offset)["data"]
-    return processor.handle_fields(raw_data_unicode)
+    return processor.handle_fields(fetch_discover(processor, limit, offset))
 
 
 class ExportDataFileTooBig(Exception):
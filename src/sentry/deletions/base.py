@@ -3,8 +3,12 @@ from __future__ import annotations
 import logging
 import re
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from django.db import connections
+
+from sentry import options
 from sentry.constants import ObjectStatus
 from sentry.db.models.base import Model
 from sentry.users.services.user.model import RpcUser
@@ -19,29 +23,121 @@ if TYPE_CHECKING:
     from sentry.deletions.manager import DeletionTaskManager
 
 
+def _delete_relation(
+    manager: DeletionTaskManager,
+    relation: BaseRelation,
+    transaction_id: str | None = None,
+    actor_id: int | None = None,
+) -> None:
+    # Ideally this runs through the deletion manager
+    task = manager.get(
+        transaction_id=transaction_id,
+        actor_id=actor_id,
+        task=relation.task,
+        **relation.params,
+    )
+
+    # If we want smaller tasks then this also has to return when has_more is true.
+    # This could significant increase the number of tasks we spawn. Get better estimates
+    # by collecting metrics.
+    has_more = True
+    while has_more:
+        has_more = task.chunk()
+        if has_more:
+            metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
+
+
+def _models_reference(model: type[Model], other: type[Model]) -> bool:
+    def references(m1: type[Model], m2: type[Model]) -> bool:
+        return any(
+            field.is_relation and field.related_model is m2 for field in m1._meta.concrete_fields
+        )
+
+    return references(model, other) or references(other, model)
+
+
+def _plan_relation_stages(relations: Sequence[BaseRelation]) -> list[list[BaseRelation]]:
+    """
+    Splits relations into stages that have to run one after the other, while
+    the relations within a stage may run concurrently.
+
+    Only relations deleted by a `BulkModelDeletionTask` share stages. These
+    delete rows with plain SQL, without cascades or signals, so the order
+    within a run of them only matters for models which reference each other.
+    A relation is placed in the stage after the last one holding such a model.
+    Every other relation is a stage of its own, after everything before it.
+    """
+    stages: list[list[BaseRelation]] = []
+    run_start = 0
+    run_models: list[tuple[type[Model], int]] = []
+    for relation in relations:
+        model = relation.params.get("model")
+        if (
+            model is None
+            or relation.task is None
+            or not issubclass(relation.task, BulkModelDeletionTask)
+        ):
+            stages.append([relation])
+            run_start = len(stages)
+            run_models = []
+            continue
+
+        stage = run_start
+        for other, other_stage in run_models:
+            if _models_reference(model, other):
+                stage = max(stage, other_stage + 1)
+
+        if stage == len(stages):
+            stages.append([])
+        stages[stage].append(relation)
+        run_models.append((model, stage))
+
+    return stages
+
+
+def _delete_relations_concurrently(
+    manager: DeletionTaskManager,
+    relations: Sequence[BaseRelation],
+    transaction_id: str | None,
+    actor_id: int | None,
+    max_workers: int,
+) -> None:
+    def delete_relation(relation: BaseRelation) -> None:
+        try:
+            _delete_relation(manager, relation, transaction_id, actor_id)
+        finally:
+            # Connections are per thread, don't leave them behind with the thread.
+            connections.close_all()
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(relations)), thread_name_prefix="deletions"
+    ) as executor:
+        for _ in executor.map(delete_relation, relations):
+            pass
+
+
 def _delete_children(
     manager: DeletionTaskManager,
     relations: Sequence[BaseRelation],
     transaction_id: str | None = None,
     actor_id: int | None = None,
 ) -> bool:
-    # Ideally this runs through the deletion manager
-    for relation in relations:
-        task = manager.get(
-            transaction_id=transaction_id,
-            actor_id=actor_id,
-            task=relation.task,
-            **relation.params,
-        )
+    """
+    Deletes all child relations, up to `deletions.child-relations.concurrency`
+    independent ones at a time.
+    """
+    concurrency = options.get("deletions.child-relations.concurrency")
+    if concurrency > 1:
+        stages = _plan_relation_stages(relations)
+    else:
+        stages = [[relation] for relation in relations]
+
+    for stage in stages:
+        if len(stage) == 1:
+            _delete_relation(manager, stage[0], transaction_id, actor_id)
+        else:
+            _delete_relations_concurrently(manager, stage, transaction_id, actor_id, concurrency)
 
-        # If we want smaller tasks then this also has to return when has_more is true.
-        # This could significant increase the number of tasks we spawn. Get better estimates
-        # by collecting metrics.
-        has_more = True
-        while has_more:
-            has_more = task.chunk()
-            if has_more:
-                metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
     return False
 
 
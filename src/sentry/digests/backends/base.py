@@ -66,7 +66,16 @@ class Backend(Service):
     be transitioned to "waiting" instead.)
     """
 
-    __all__ = ("add", "delete", "digest", "enabled", "maintenance", "schedule", "validate")
+    __all__ = (
+        "add",
+        "delete",
+        "digest",
+        "digest_many",
+        "enabled",
+        "maintenance",
+        "schedule",
+        "validate",
+    )
 
     def __init__(self, **options: Any) -> None:
         # The ``minimum_delay`` option defines the default minimum amount of
@@ -176,6 +185,24 @@ class Backend(Service):
         """
         raise NotImplementedError
 
+    def digest_many(self, keys: Iterable[str], minimum_delay: int | None = None) -> Any:
+        """
+        Extract records from several timelines for processing at once.
+
+        This method acts as a context manager like ``digest``. The target of
+        the ``as`` clause is a dictionary of the records of every timeline that
+        could be digested, keyed by timeline. Timelines that are not in the
+        ready state or are being digested elsewhere are left out instead of
+        raising ``InvalidState``.
+
+        If the context manager successfully exits, every timeline still in the
+        dictionary is closed like ``digest`` would. Removing a timeline from
+        the dictionary preserves its records, like raising an exception does
+        for a single digest, so that one failed delivery does not hold back
+        the rest of the batch.
+        """
+        raise NotImplementedError
+
     def schedule(self, deadline: float, timestamp: float | None = None) -> Iterable[ScheduleEntry]:
         """
         Identify timelines that are ready for processing.
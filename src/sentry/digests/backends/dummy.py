@@ -27,6 +27,10 @@ class DummyBackend(Backend):
     def digest(self, key: str, minimum_delay: int | None = None) -> Any:
         yield []
 
+    @contextmanager
+    def digest_many(self, keys: Iterable[str], minimum_delay: int | None = None) -> Any:
+        yield {key: [] for key in keys}
+
     def schedule(
         self, deadline: float, timestamp: float | None = None
     ) -> Iterable["ScheduleEntry"]:
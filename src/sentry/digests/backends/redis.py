@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import defaultdict
 from collections.abc import Generator, Iterable
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from typing import Any
 
 from rb.clients import LocalClient
@@ -11,6 +12,7 @@ from redis.exceptions import ResponseError
 
 from sentry.digests.backends.base import Backend, InvalidState, ScheduleEntry
 from sentry.digests.types import Record
+from sentry.utils.locking import UnableToAcquireLock
 from sentry.utils.locking.backends.redis import RedisLockBackend
 from sentry.utils.locking.lock import Lock
 from sentry.utils.locking.manager import LockManager
@@ -219,26 +221,8 @@ class RedisBackend(Backend):
                 else:
                     raise
 
-            records = [
-                Record(key.decode(), self.codec.decode(value), float(timestamp))
-                for key, value, timestamp in response
-                if value is not None
-            ]
-
-            # If the record value is `None`, this means the record data was
-            # missing (it was presumably evicted by Redis) so we don't need to
-            # return it here.
-            filtered_records = [record for record in records if record.value is not None]
-            if len(records) != len(filtered_records):
-                logger.warning(
-                    "Filtered out missing records when fetching digest",
-                    extra={
-                        "key": key,
-                        "record_count": len(records),
-                        "filtered_record_count": len(filtered_records),
-                    },
-                )
-            yield filtered_records
+            records = self.__decode_records(key, response)
+            yield [record for record in records if record.value is not None]
 
             script(
                 [key],
@@ -247,6 +231,91 @@ class RedisBackend(Backend):
                 connection,
             )
 
+    def __decode_records(self, key: str, response: Iterable[list[Any]]) -> list[Record]:
+        records = [
+            Record(record_key.decode(), self.codec.decode(value), float(timestamp))
+            for record_key, value, timestamp in response
+            if value is not None
+        ]
+
+        # If the record value is `None`, this means the record data was
+        # missing (it was presumably evicted by Redis) so we don't need to
+        # return it here.
+        filtered_records = [record for record in records if record.value is not None]
+        if len(records) != len(filtered_records):
+            logger.warning(
+                "Filtered out missing records when fetching digest",
+                extra={
+                    "key": key,
+                    "record_count": len(records),
+                    "filtered_record_count": len(filtered_records),
+                },
+            )
+        return records
+
+    @contextmanager
+    def digest_many(
+        self,
+        keys: Iterable[str],
+        minimum_delay: int | None = None,
+        timestamp: float | None = None,
+    ) -> Generator[dict[str, list[Record]]]:
+        if minimum_delay is None:
+            minimum_delay = self.minimum_delay
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        router = self.cluster.get_router()
+        keys_by_host: dict[int, list[str]] = defaultdict(list)
+        for key in keys:
+            keys_by_host[router.get_host_for_key(f"{self.namespace}:t:{key}")].append(key)
+
+        digests: dict[str, list[Record]] = {}
+        record_keys: dict[str, list[str]] = {}
+        with ExitStack() as stack:
+            for host, host_keys in keys_by_host.items():
+                locked_keys = []
+                for key in host_keys:
+                    try:
+                        stack.enter_context(self._get_timeline_lock(key, duration=30).acquire())
+                    except UnableToAcquireLock:
+                        logger.info("Skipped digest %s as its timeline is locked.", key)
+                    else:
+                        locked_keys.append(key)
+
+                if not locked_keys:
+                    continue
+
+                # All timelines of a host are opened by a single script call.
+                response = script(
+                    ["-"],
+                    [
+                        "DIGEST_OPEN_MANY",
+                        self.namespace,
+                        self.ttl,
+                        timestamp,
+                        self.capacity if self.capacity else -1,
+                        *locked_keys,
+                    ],
+                    self.cluster.get_local_client(host),
+                )
+                for raw_key, response_records in response:
+                    key = raw_key.decode("utf-8")
+                    records = self.__decode_records(key, response_records)
+                    digests[key] = [record for record in records if record.value is not None]
+                    record_keys[key] = [record.key for record in records]
+
+            yield digests
+
+            for key in digests:
+                script(
+                    [key],
+                    ["DIGEST_CLOSE", self.namespace, self.ttl, timestamp, key, minimum_delay]
+                    + record_keys[key],
+                    self._get_connection(key),
+                )
+
     def delete(self, key: str, timestamp: float | None = None) -> None:
         if timestamp is None:
             timestamp = time.time()
@@ -226,17 +226,9 @@ def get_rules_from_workflows(project: Project, workflow_ids: set[int]) -> dict[i
     return rules
 
 
-def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
-    if not records:
-        return DigestInfo({}, {}, {})
-
-    # This reads a little strange, but remember that records are returned in
-    # reverse chronological order, and we query the database in chronological
-    # order.
-    # NOTE: This doesn't account for any issues that are filtered out later.
-    start = records[-1].datetime
-    end = records[0].datetime
-
+def _get_groups_and_rules(
+    project: Project, records: Sequence[Record]
+) -> tuple[dict[int, Group], dict[int, Rule]]:
     rule_ids: set[int] = set()
     workflow_ids: set[int] = set()
 
@@ -250,7 +242,6 @@ def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
             workflow_ids.update(ids_to_add)
 
     groups = Group.objects.in_bulk(record.value.event.group_id for record in records)
-    group_ids = list(groups)
     rules = Rule.objects.in_bulk(rule_ids)
 
     if features.has("organizations:workflow-engine-trigger-actions", project.organization):
@@ -264,6 +255,31 @@ def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
     for rule_id, rule in rules.items():
         assert rule.project_id == project.id, "Rule must belong to Project"
 
+    return groups, rules
+
+
+def _build_digest_info(
+    project: Project,
+    records: Sequence[Record],
+    groups: dict[int, Group],
+    rules: dict[int, Rule],
+) -> DigestInfo:
+    if not records:
+        return DigestInfo({}, {}, {})
+
+    # This reads a little strange, but remember that records are returned in
+    # reverse chronological order, and we query the database in chronological
+    # order.
+    # NOTE: This doesn't account for any issues that are filtered out later.
+    start = records[-1].datetime
+    end = records[0].datetime
+
+    group_ids = [
+        group_id
+        for group_id in dict.fromkeys(record.value.event.group_id for record in records)
+        if group_id in groups
+    ]
+
     tenant_ids = {"organization_id": project.organization_id}
     event_counts = tsdb.backend.get_timeseries_sums(
         TSDBModel.group,
@@ -282,3 +298,29 @@ def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
     digest = _build_digest_impl(records, groups, rules, event_counts, user_counts)
 
     return DigestInfo(digest, event_counts, user_counts)
+
+
+def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
+    if not records:
+        return DigestInfo({}, {}, {})
+
+    groups, rules = _get_groups_and_rules(project, records)
+    return _build_digest_info(project, records, groups, rules)
+
+
+def build_digests(
+    project: Project, records_by_key: Mapping[str, Sequence[Record]]
+) -> dict[str, DigestInfo]:
+    """
+    Builds the digests of several timelines of the same project, looking up
+    the groups and rules of all of them at once.
+    """
+    all_records = [record for records in records_by_key.values() for record in records]
+    if not all_records:
+        return {key: DigestInfo({}, {}, {}) for key in records_by_key}
+
+    groups, rules = _get_groups_and_rules(project, all_records)
+    return {
+        key: _build_digest_info(project, records, groups, rules)
+        for key, records in records_by_key.items()
+    }
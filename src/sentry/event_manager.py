@@ -681,7 +681,7 @@ def _get_or_create_release_many(jobs: Sequence[Job], projects: ProjectsMapping)
     for job in jobs:
         data = job["data"]
         if not data.get("release"):
-            return
+            continue
 
         project = projects[job["project_id"]]
         date = job["event"].datetime
@@ -701,7 +701,7 @@ def _get_or_create_release_many(jobs: Sequence[Job], projects: ProjectsMapping)
 
         job["release"] = release
         if not release:
-            return
+            continue
 
         # Don't allow a conflicting 'release' tag
         pop_tag(data, "release")
@@ -3,16 +3,18 @@ from __future__ import annotations
 import base64
 import logging
 import os
+import threading
 import zlib
 from collections import Counter
 from collections.abc import Sequence
-from functools import cached_property
+from functools import cached_property, lru_cache
 from random import random
 from typing import Any, Literal
 
 import msgpack
 import sentry_sdk
 import zstandard
+from cachetools import LRUCache
 from sentry_ophio.enhancers import AssembleResult as RustStacktraceResult
 from sentry_ophio.enhancers import Cache as RustCache
 from sentry_ophio.enhancers import Component as RustFrame
@@ -36,6 +38,11 @@ logger = logging.getLogger(__name__)
 # So this leaves quite a bit of headroom for custom enhancement rules as well.
 RUST_CACHE = RustCache(1_000)
 
+# The number of distinct enhancements configs (bases plus project rules) kept compiled per process,
+# and the number of distinct stacktraces whose in-app/category results each of them remembers.
+ENHANCEMENTS_CACHE_SIZE = 200
+FRAME_RESULTS_CACHE_SIZE = 100
+
 # TODO: Move 3 to the end when we're ready for it to be the default
 VERSIONS = [
     3,  # Enhancements with this version run the split enhancements experiment
@@ -426,6 +433,13 @@ class Enhancements:
 
         self.rust_enhancements = merge_rust_enhancements(self.bases, rust_enhancements)
 
+        # Results of `apply_modifications_to_frames`, keyed by the normalized frames and exception
+        # data they were computed from
+        self._frame_results_cache: LRUCache[Any, Sequence[tuple[str | None, bool | None]]] = (
+            LRUCache(maxsize=FRAME_RESULTS_CACHE_SIZE)
+        )
+        self._frame_results_cache_lock = threading.Lock()
+
         self.run_split_enhancements = version == 3
         if self.run_split_enhancements:
             (
@@ -445,6 +459,45 @@ class Enhancements:
                 self.bases, contributes_rust_enhancements, type="contributes"
             )
 
+    def _apply_modifications_to_frames(
+        self,
+        rust_enhancements: RustEnhancements,
+        match_frames: list[Any],
+        rust_exception_data: RustExceptionData,
+        split: bool,
+    ) -> Sequence[tuple[str | None, bool | None]]:
+        """
+        Memoized `apply_modifications_to_frames`. Rules can look at neighboring frames and the
+        exception, so results are remembered per stacktrace rather than per frame.
+        """
+        try:
+            key = (
+                split,
+                tuple(tuple(match_frame.values()) for match_frame in match_frames),
+                tuple(rust_exception_data.values()),
+            )
+            hash(key)
+        except TypeError:
+            return rust_enhancements.apply_modifications_to_frames(
+                match_frames, rust_exception_data
+            )
+
+        with self._frame_results_cache_lock:
+            results = self._frame_results_cache.get(key)
+
+        if results is not None:
+            metrics.incr("grouping.enhancements.frame_results_cache", tags={"result": "hit"})
+            return results
+
+        metrics.incr("grouping.enhancements.frame_results_cache", tags={"result": "miss"})
+        results = tuple(
+            rust_enhancements.apply_modifications_to_frames(match_frames, rust_exception_data)
+        )
+        with self._frame_results_cache_lock:
+            self._frame_results_cache[key] = results
+
+        return results
+
     def apply_category_and_updated_in_app_to_frames(
         self,
         frames: Sequence[dict[str, Any]],
@@ -465,17 +518,15 @@ class Enhancements:
 
         with metrics.timer("grouping.enhancements.get_in_app") as metrics_timer_tags:
             metrics_timer_tags["split"] = False
-            category_and_in_app_results = self.rust_enhancements.apply_modifications_to_frames(
-                match_frames, rust_exception_data
+            category_and_in_app_results = self._apply_modifications_to_frames(
+                self.rust_enhancements, match_frames, rust_exception_data, split=False
             )
 
         if self.run_split_enhancements:
             with metrics.timer("grouping.enhancements.get_in_app") as metrics_timer_tags:
                 metrics_timer_tags["split"] = True
-                category_and_in_app_results_split = (
-                    self.classifier_rust_enhancements.apply_modifications_to_frames(
-                        match_frames, rust_exception_data
-                    )
+                category_and_in_app_results_split = self._apply_modifications_to_frames(
+                    self.classifier_rust_enhancements, match_frames, rust_exception_data, split=True
                 )
             split_enhancement_misses: list[Any] = []
         else:
@@ -727,8 +778,19 @@ class Enhancements:
 
     @classmethod
     def from_base64_string(cls, base64_string: str | bytes) -> Enhancements:
-        """Convert a base64 string into an `Enhancements` object"""
+        """
+        Convert a base64 string into an `Enhancements` object.
 
+        The string encodes the bases as well as the project's own rules, so compiled objects are
+        shared process-wide for as long as the config doesn't change. They must not be mutated.
+        """
+        if isinstance(base64_string, bytes):
+            base64_string = base64_string.decode("ascii", "ignore")
+
+        return _get_cached_enhancements(cls, base64_string)
+
+    @classmethod
+    def _from_base64_string_uncached(cls, base64_string: str | bytes) -> Enhancements:
         with metrics.timer("grouping.enhancements.creation") as metrics_timer_tags:
             bytes_str = (
                 base64_string.encode("ascii", "ignore")
@@ -782,6 +844,12 @@ class Enhancements:
             )
 
 
+@lru_cache(maxsize=ENHANCEMENTS_CACHE_SIZE)
+def _get_cached_enhancements(cls: type[Enhancements], base64_string: str) -> Enhancements:
+    metrics.incr("grouping.enhancements.compiled_cache_miss")
+    return cls._from_base64_string_uncached(base64_string)
+
+
 def _load_configs() -> dict[str, Enhancements]:
     enhancement_bases = {}
     configs_dir = os.path.join(os.path.abspath(os.path.dirname(__file__)), "enhancement-configs")
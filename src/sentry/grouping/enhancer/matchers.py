@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, Literal, Self, TypedDict
 
 from sentry.grouping.utils import bool_from_string
@@ -104,17 +105,58 @@ def _get_function_name(frame_data: dict[str, Any], platform: str | None) -> str:
     return function_name or "<unknown>"
 
 
+# The number of distinct frames whose `MatchFrame` is kept around per process
+MATCH_FRAME_CACHE_SIZE = 10_000
+
+
 def create_match_frame(frame_data: dict[str, Any], platform: str | None) -> MatchFrame:
     """Create flat dict of values relevant to matchers"""
+    # Everything a `MatchFrame` is derived from. Most frames of a project repeat from one event to
+    # the next, so the (comparatively expensive) function name trimming and normalization below is
+    # memoized on this fingerprint.
+    fingerprint = (
+        get_path(frame_data, "data", "category"),
+        frame_data.get("platform") or platform,
+        frame_data.get("function"),
+        bool(frame_data.get("raw_function")),
+        frame_data.get("in_app"),
+        get_path(frame_data, "data", "orig_in_app"),
+        get_path(frame_data, "module"),
+        frame_data.get("package"),
+        frame_data.get("abs_path") or frame_data.get("filename"),
+    )
+
+    try:
+        match_frame = _create_match_frame_cached(*fingerprint)
+    except TypeError:  # Unhashable garbage in the frame
+        match_frame = _create_match_frame(*fingerprint)
+
+    # Hand out a copy, so callers can't alter the memoized value
+    return MatchFrame(**match_frame)
+
+
+def _create_match_frame(
+    category: Any,
+    platform: str | None,
+    function: Any,
+    has_raw_function: bool,
+    in_app: Any,
+    orig_in_app: Any,
+    module: Any,
+    package: Any,
+    path: Any,
+) -> MatchFrame:
+    function_data = {"function": function, "raw_function": has_raw_function, "platform": platform}
+
     match_frame = dict(
-        category=get_path(frame_data, "data", "category"),
-        family=get_behavior_family_for_platform(frame_data.get("platform") or platform),
-        function=_get_function_name(frame_data, platform),
-        in_app=frame_data.get("in_app"),
-        orig_in_app=get_path(frame_data, "data", "orig_in_app"),
-        module=get_path(frame_data, "module"),
-        package=frame_data.get("package"),
-        path=frame_data.get("abs_path") or frame_data.get("filename"),
+        category=category,
+        family=get_behavior_family_for_platform(platform),
+        function=_get_function_name(function_data, platform),
+        in_app=in_app,
+        orig_in_app=orig_in_app,
+        module=module,
+        package=package,
+        path=path,
     )
 
     for key in list(match_frame.keys()):
@@ -141,6 +183,11 @@ def create_match_frame(frame_data: dict[str, Any], platform: str | None) -> Matc
     )
 
 
+_create_match_frame_cached = lru_cache(maxsize=MATCH_FRAME_CACHE_SIZE, typed=True)(
+    _create_match_frame
+)
+
+
 class EnhancementMatch:
     key: str
     pattern: str
@@ -212,6 +212,10 @@ class ParameterizationRegexExperiment(ParameterizationRegex):
         return self.compiled_pattern.sub(callback, content)
 
 
+# The number of distinct tokens whose unique id verdict is kept around per process
+UNIQ_ID_CACHE_SIZE = 50_000
+
+
 class _UniqueId:
     # just a namespace for the uniq_id logic, no need to instantiate
 
@@ -245,6 +249,15 @@ class _UniqueId:
             token_str[0] == "<" and token_str[-1] == ">"
         ):  # Don't replace already-parameterized tokens
             return False
+        return _UniqueId.has_uniq_id_token_ratio(token_str)
+
+    @staticmethod
+    @lru_cache(maxsize=UNIQ_ID_CACHE_SIZE)
+    def has_uniq_id_token_ratio(token_str: str) -> bool:
+        """
+        Tokenizing is by far the most expensive part of the check, and the same tokens show up in
+        message after message, so verdicts are remembered per process.
+        """
         token_length_ratio = _UniqueId.num_tokens_from_string(token_str) / len(token_str)
         if (
             len(token_str) > _UniqueId.TOKEN_LENGTH_LONG
@@ -275,6 +288,13 @@ UniqueIdExperiment = ParameterizationCallableExperiment(
 ParameterizationExperiment = ParameterizationCallableExperiment | ParameterizationRegexExperiment
 
 
+@lru_cache(maxsize=16)
+def _compile_regex_from_patterns(pattern_keys: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile(
+        rf"(?x){'|'.join(DEFAULT_PARAMETERIZATION_REGEXES_MAP[k] for k in pattern_keys)}"
+    )
+
+
 class Parameterizer:
     def __init__(
         self,
@@ -299,9 +319,22 @@ class Parameterizer:
         so we can use newlines and indentation for better legibility in patterns above.
         """
 
-        return re.compile(
-            rf"(?x){'|'.join(DEFAULT_PARAMETERIZATION_REGEXES_MAP[k] for k in pattern_keys)}"
-        )
+        return _compile_regex_from_patterns(tuple(pattern_keys))
+
+    def _handle_regex_match(self, match: re.Match[str]) -> str:
+        # Each pattern is wrapped in a single named group, and that group closes after any groups
+        # nested in it, so it's the match's `lastgroup`. For example, a match of the `hex` pattern
+        # on '0x40000015' is replaced with '<hex>'.
+        key = match.lastgroup
+        if key is None:
+            # Only possible if a pattern's lookahead captures. Find the first (should be only)
+            # non-None named group instead.
+            key = next((k for k, v in match.groupdict().items() if v is not None), None)
+            if key is None:
+                return ""
+
+        self.matches_counter[key] += 1
+        return f"<{key}>"
 
     def parametrize_w_regex(self, content: str) -> str:
         """
@@ -314,17 +347,7 @@ class Parameterizer:
         @returns: The content with all matches replaced with placeholders.
         """
 
-        def _handle_regex_match(match: re.Match[str]) -> str:
-            # Find the first (should be only) non-None match entry, and sub in the placeholder. For
-            # example, given the groupdict item `('hex', '0x40000015')`, this returns '<hex>' as a
-            # replacement for the original value in the string.
-            for key, value in match.groupdict().items():
-                if value is not None:
-                    self.matches_counter[key] += 1
-                    return f"<{key}>"
-            return ""
-
-        return self._parameterization_regex.sub(_handle_regex_match, content)
+        return self._parameterization_regex.sub(self._handle_regex_match, content)
 
     def parametrize_w_experiments(
         self, content: str, should_run: Callable[[str], bool] = lambda _: True
@@ -339,23 +362,13 @@ class Parameterizer:
         def _incr_counter(key: str, count: int) -> None:
             self.matches_counter[key] += count
 
-        def _handle_regex_match(match: re.Match[str]) -> str:
-            # Find the first (should be only) non-None match entry, and sub in the placeholder. For
-            # example, given the groupdict item `('hex', '0x40000015')`, this returns '<hex>' as a
-            # replacement for the original value in the string.
-            for key, value in match.groupdict().items():
-                if value is not None:
-                    self.matches_counter[key] += 1
-                    return f"<{key}>"
-            return ""
-
         for experiment in self._experiments:
             if not should_run(experiment.name):
                 continue
             if isinstance(experiment, ParameterizationCallableExperiment):
                 content = experiment.run(content, _incr_counter)
             else:
-                content = experiment.run(content, _handle_regex_match)
+                content = experiment.run(content, self._handle_regex_match)
 
         return content
 
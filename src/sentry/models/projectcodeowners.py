@@ -55,11 +55,15 @@ class ProjectCodeOwners(Model):
         a pile of read queries in post_processing as most projects
         don't have CODEOWNERS.
         """
+        from sentry.models.projectownership import set_schema_key
+
         cache_key = self.get_cache_key(project_id)
         code_owners = cache.get(cache_key)
         if code_owners is None:
             query = self.objects.filter(project_id=project_id).order_by("-date_added") or ()
             code_owners = self.merge_code_owners_list(code_owners_list=query) if query else query
+            if code_owners:
+                set_schema_key(code_owners)
             cache.set(cache_key, code_owners, READ_CACHE_DURATION)
 
         return code_owners or None
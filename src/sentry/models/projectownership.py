@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
+from cachetools import LRUCache
 from django.db import models
 from django.db.models.signals import post_delete, post_save
 from django.utils import timezone
@@ -17,11 +19,12 @@ from sentry.eventstore.models import Event, GroupEvent
 from sentry.models.activity import Activity
 from sentry.models.group import Group
 from sentry.models.groupowner import OwnerRuleType
-from sentry.ownership.grammar import Matcher, Rule, load_schema, resolve_actors
+from sentry.ownership.grammar import Matcher, MatcherIndex, Rule, resolve_actors
 from sentry.types.activity import ActivityType
 from sentry.types.actor import Actor
-from sentry.utils import metrics
+from sentry.utils import json, metrics
 from sentry.utils.cache import cache
+from sentry.utils.hashlib import md5_text
 
 if TYPE_CHECKING:
     from sentry.models.projectcodeowners import ProjectCodeOwners
@@ -33,6 +36,27 @@ __all__ = ("ProjectOwnership",)
 logger = logging.getLogger(__name__)
 READ_CACHE_DURATION = 3600
 
+# Compiled matcher indexes, keyed by the hash of the schema they were compiled from, so they are
+# rebuilt whenever the ownership rules or CODEOWNERS change.
+MATCHER_INDEX_CACHE_SIZE = 100
+_matcher_index_cache: LRUCache[Any, MatcherIndex] = LRUCache(maxsize=MATCHER_INDEX_CACHE_SIZE)
+_matcher_index_cache_lock = threading.Lock()
+
+# The schema hash is stored on ownership and CODEOWNERS instances before they are cached, so it is
+# read back with them instead of being computed for every event.
+SCHEMA_KEY_ATTR = "_schema_key"
+
+
+def get_schema_key(instance: ProjectOwnership | ProjectCodeOwners) -> str:
+    key = getattr(instance, SCHEMA_KEY_ATTR, None)
+    if key is None:
+        key = md5_text(json.dumps(instance.schema)).hexdigest()
+    return key
+
+
+def set_schema_key(instance: ProjectOwnership | ProjectCodeOwners) -> None:
+    setattr(instance, SCHEMA_KEY_ATTR, md5_text(json.dumps(instance.schema)).hexdigest())
+
 
 @region_silo_model
 class ProjectOwnership(Model):
@@ -95,11 +119,37 @@ class ProjectOwnership(Model):
         if ownership is None:
             try:
                 ownership = cls.objects.get(project_id=project_id)
+                set_schema_key(ownership)
             except cls.DoesNotExist:
                 ownership = False
             cache.set(cache_key, ownership, READ_CACHE_DURATION)
         return ownership or None
 
+    @classmethod
+    def get_matcher_index(cls, schema: Mapping[str, Any], key: Any = None) -> MatcherIndex:
+        """
+        Process-local cached access to the compiled form of an ownership schema.
+
+        Schemas are cached as JSON by `get_ownership_cached` and
+        `ProjectCodeOwners.get_codeowners_cached`, so compiling them is the only
+        per-event cost left. Rules and their matches are kept per schema version,
+        identified by `key`, which defaults to a hash of the schema.
+        """
+        if key is None:
+            key = md5_text(json.dumps(schema)).hexdigest()
+        with _matcher_index_cache_lock:
+            index = _matcher_index_cache.get(key)
+
+        if index is None:
+            metrics.incr("projectownership.matcher_index_cache", tags={"result": "miss"})
+            index = MatcherIndex.from_schema(schema)
+            with _matcher_index_cache_lock:
+                _matcher_index_cache[key] = index
+        else:
+            metrics.incr("projectownership.matcher_index_cache", tags={"result": "hit"})
+
+        return index
+
     @classmethod
     def get_owners(
         cls, project_id: int, data: Mapping[str, Any]
@@ -121,9 +171,13 @@ class ProjectOwnership(Model):
             ownership = cls(project_id=project_id)
 
         codeowners = ProjectCodeOwners.get_codeowners_cached(project_id)
+        schema_key = (
+            get_schema_key(ownership),
+            get_schema_key(codeowners) if codeowners and codeowners.schema else None,
+        )
         ownership.schema = cls.get_combined_schema(ownership, codeowners)
 
-        rules = cls._matching_ownership_rules(ownership, data)
+        rules = cls._matching_ownership_rules(ownership, data, schema_key)
 
         if not rules:
             return [], None
@@ -363,6 +417,7 @@ class ProjectOwnership(Model):
         cls,
         ownership: ProjectOwnership | ProjectCodeOwners,
         data: Mapping[str, Any],
+        schema_key: Any = None,
     ) -> list[Rule]:
         if ownership.schema is None:
             return []
@@ -377,20 +432,24 @@ class ProjectOwnership(Model):
             tags={"ownership_type": ownership_type},
         )
 
-        rules = load_schema(ownership.schema)
+        if schema_key is None:
+            schema_key = get_schema_key(ownership)
+        index = cls.get_matcher_index(ownership.schema, schema_key)
         metrics.distribution(
             key="projectownership.matching_ownership_rules.rules",
-            value=len(rules),
+            value=len(index.rules),
             tags={"ownership_type": ownership_type},
         )
 
-        return [rule for rule in rules if rule.test(data, munged_data)]
+        return index.matching_rules(data, munged_data)
 
 
 def process_resource_change(instance, change, **kwargs):
     from sentry.models.groupowner import GroupOwner
     from sentry.models.projectownership import ProjectOwnership
 
+    if change == "updated":
+        set_schema_key(instance)
     cache.set(
         ProjectOwnership.get_cache_key(instance.project_id),
         instance if change == "updated" else None,
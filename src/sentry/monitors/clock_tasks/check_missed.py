@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 
 from arroyo.backends.kafka import KafkaPayload
@@ -24,6 +25,10 @@ logger = logging.getLogger(__name__)
 # monitors the larger the number of checkins to check will exist.
 MONITOR_LIMIT = 10_000
 
+# The number of missed monitor environments loaded per query. Pages are
+# produced as they are loaded rather than after loading all of them.
+CHECK_MISSING_PAGE_SIZE = 1_000
+
 # re-use the monitor exclusion query node across dispatch_check_missing and
 # mark_environment_missing.
 IGNORE_MONITORS = ~Q(
@@ -49,79 +54,136 @@ def dispatch_check_missing(ts: datetime):
 
     This will dispatch MarkMissing messages into monitors-clock-tasks.
     """
-    missed_envs = list(
-        MonitorEnvironment.objects.filter(
-            IGNORE_MONITORS,
-            next_checkin_latest__lte=ts,
-        ).values(
-            "id"
-        )[:MONITOR_LIMIT]
-    )
+    base_query = MonitorEnvironment.objects.filter(
+        IGNORE_MONITORS,
+        next_checkin_latest__lte=ts,
+    ).order_by("next_checkin_latest", "id")
+
+    # Page through the missed environments, most overdue first, using a
+    # keyset cursor on (next_checkin_latest, id) so that every page is a
+    # cheap index range scan no matter how deep into the results it is.
+    count = 0
+    cursor: tuple[datetime, int] | None = None
+    while count < MONITOR_LIMIT:
+        query = base_query
+        if cursor is not None:
+            cursor_ts, cursor_id = cursor
+            query = query.filter(
+                Q(next_checkin_latest__gt=cursor_ts)
+                | Q(next_checkin_latest=cursor_ts, id__gt=cursor_id)
+            )
+
+        page = list(
+            query.values_list("next_checkin_latest", "id")[
+                : min(CHECK_MISSING_PAGE_SIZE, MONITOR_LIMIT - count)
+            ]
+        )
+        if not page:
+            break
+
+        for _, monitor_environment_id in page:
+            message: MarkMissing = {
+                "type": "mark_missing",
+                "ts": ts.timestamp(),
+                "monitor_environment_id": monitor_environment_id,
+            }
+            # XXX(epurkhiser): Partitioning by monitor_environment.id is important
+            # here as these task messages will be consumed in a multi-consumer
+            # setup. If we backlogged clock-ticks we may produce multiple missed
+            # tasks for the same monitor_environment. These MUST happen in-order.
+            payload = KafkaPayload(
+                str(monitor_environment_id).encode(),
+                MONITORS_CLOCK_TASKS_CODEC.encode(message),
+                [],
+            )
+            produce_task(payload)
+
+        count += len(page)
+        cursor = page[-1]
 
     metrics.gauge(
         "sentry.monitors.tasks.check_missing.count",
-        len(missed_envs),
+        count,
         sample_rate=1.0,
     )
 
-    for monitor_environment in missed_envs:
-        message: MarkMissing = {
-            "type": "mark_missing",
-            "ts": ts.timestamp(),
-            "monitor_environment_id": monitor_environment["id"],
-        }
-        # XXX(epurkhiser): Partitioning by monitor_environment.id is important
-        # here as these task messages will be consumed in a multi-consumer
-        # setup. If we backlogged clock-ticks we may produce multiple missed
-        # tasks for the same monitor_environment. These MUST happen in-order.
-        payload = KafkaPayload(
-            str(monitor_environment["id"]).encode(),
-            MONITORS_CLOCK_TASKS_CODEC.encode(message),
-            [],
-        )
-        produce_task(payload)
-
 
 def mark_environment_missing(monitor_environment_id: int, ts: datetime):
     logger.info("mark_missing", extra={"monitor_environment_id": monitor_environment_id})
 
-    try:
-        monitor_environment = MonitorEnvironment.objects.select_related("monitor").get(
-            IGNORE_MONITORS,
-            id=monitor_environment_id,
-            # XXX(epurkhiser): Ensure a previous dispatch_check_missing task did
-            # not already move the next_checkin_latest forward. This can happen
-            # when the clock-ticks happen rapidly and we fire off
-            # dispatch_check_missing rapidly (due to a backlog in the
-            # ingest-monitors topic)
-            next_checkin_latest__lte=ts,
-        )
-    except MonitorEnvironment.DoesNotExist:
-        # Nothing to do. We already handled this miss in an earlier tasks
-        # (or the environment was deleted)
-        return
-
-    monitor = monitor_environment.monitor
-    # next_checkin must be set, since detecting this monitor as missed means
-    # there must have been an initial user check-in.
-    assert monitor_environment.next_checkin is not None
-    expected_time = monitor_environment.next_checkin
-
-    # add missed checkin.
-    #
-    # XXX(epurkhiser): The date_added is backdated so that this missed
-    # check-in correctly reflects the time of when the checkin SHOULD
-    # have happened. It is the same as the expected_time.
-    checkin = MonitorCheckIn.objects.create(
-        project_id=monitor_environment.monitor.project_id,
-        monitor=monitor_environment.monitor,
-        monitor_environment=monitor_environment,
-        status=CheckInStatus.MISSED,
-        date_added=expected_time,
-        date_clock=ts,
-        expected_time=expected_time,
-        monitor_config=monitor.get_validated_config(),
+    for checkin in _create_missed_checkins([monitor_environment_id], ts):
+        _mark_checkin_failed(checkin, ts)
+
+
+def mark_environments_missing(monitor_environment_ids: Sequence[int], ts: datetime):
+    """
+    Batched variant of `mark_environment_missing`. The environments are
+    loaded and their missed check-ins inserted with one query each. A
+    failure to mark one environment does not affect the others.
+    """
+    logger.info("mark_missing", extra={"monitor_environment_ids": monitor_environment_ids})
+
+    for checkin in _create_missed_checkins(monitor_environment_ids, ts):
+        try:
+            _mark_checkin_failed(checkin, ts)
+        except Exception:
+            logger.exception(
+                "Failed to mark monitor environment missing",
+                extra={"monitor_environment_id": checkin.monitor_environment_id},
+            )
+
+
+def _create_missed_checkins(
+    monitor_environment_ids: Sequence[int], ts: datetime
+) -> list[MonitorCheckIn]:
+    monitor_environments = MonitorEnvironment.objects.select_related("monitor").filter(
+        IGNORE_MONITORS,
+        id__in=monitor_environment_ids,
+        # XXX(epurkhiser): Ensure a previous dispatch_check_missing task did
+        # not already move the next_checkin_latest forward. This can happen
+        # when the clock-ticks happen rapidly and we fire off
+        # dispatch_check_missing rapidly (due to a backlog in the
+        # ingest-monitors topic)
+        next_checkin_latest__lte=ts,
     )
+    # Environments which are not returned have nothing to do. We already
+    # handled their miss in an earlier task (or they were deleted)
+
+    checkins = []
+    for monitor_environment in monitor_environments:
+        monitor = monitor_environment.monitor
+        # next_checkin must be set, since detecting this monitor as missed means
+        # there must have been an initial user check-in.
+        assert monitor_environment.next_checkin is not None
+        expected_time = monitor_environment.next_checkin
+
+        # add missed checkin.
+        #
+        # XXX(epurkhiser): The date_added is backdated so that this missed
+        # check-in correctly reflects the time of when the checkin SHOULD
+        # have happened. It is the same as the expected_time.
+        checkins.append(
+            MonitorCheckIn(
+                project_id=monitor.project_id,
+                monitor=monitor,
+                monitor_environment=monitor_environment,
+                status=CheckInStatus.MISSED,
+                date_added=expected_time,
+                date_clock=ts,
+                expected_time=expected_time,
+                monitor_config=monitor.get_validated_config(),
+            )
+        )
+
+    if checkins:
+        MonitorCheckIn.objects.bulk_create(checkins)
+    return checkins
+
+
+def _mark_checkin_failed(checkin: MonitorCheckIn, ts: datetime):
+    monitor = checkin.monitor
+    assert checkin.expected_time is not None
+    expected_time = checkin.expected_time
 
     # Compute when the check-in *should* have happened given the current
     # reference timestamp. This is different from the expected_time usage above
@@ -3,10 +3,12 @@ from __future__ import annotations
 import logging
 from collections.abc import Mapping
 from datetime import datetime, timezone
-from typing import TypeGuard
+from itertools import groupby
+from typing import Literal, TypeGuard
 
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.processing.strategies.abstract import ProcessingStrategy, ProcessingStrategyFactory
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.processing.strategies.commit import CommitOffsets
 from arroyo.processing.strategies.run_task import RunTask
 from arroyo.types import BrokerValue, Commit, FilteredPayload, Message, Partition
@@ -19,7 +21,10 @@ from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import (
 )
 
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
-from sentry.monitors.clock_tasks.check_missed import mark_environment_missing
+from sentry.monitors.clock_tasks.check_missed import (
+    mark_environment_missing,
+    mark_environments_missing,
+)
 from sentry.monitors.clock_tasks.check_timeout import mark_checkin_timeout
 from sentry.monitors.clock_tasks.mark_unknown import mark_checkin_unknown
 
@@ -47,27 +52,72 @@ def process_clock_task(message: Message[KafkaPayload | FilteredPayload]):
     try:
         wrapper = MONITORS_CLOCK_TASKS_CODEC.decode(message.payload.value)
         ts = datetime.fromtimestamp(wrapper["ts"], tz=timezone.utc)
-
-        if is_mark_timeout(wrapper):
-            mark_checkin_timeout(int(wrapper["checkin_id"]), ts)
-            return
-
-        if is_mark_unknown(wrapper):
-            mark_checkin_unknown(int(wrapper["checkin_id"]), ts)
-            return
-
-        if is_mark_missing(wrapper):
-            mark_environment_missing(int(wrapper["monitor_environment_id"]), ts)
-            return
-
-        logger.error("Unsupported clock-tick task type: %s", wrapper["type"])
+        _process_task(wrapper, ts)
     except Exception:
         logger.exception("Failed to process clock tick task")
 
 
+def _process_task(wrapper: MonitorsClockTasks, ts: datetime):
+    if is_mark_timeout(wrapper):
+        mark_checkin_timeout(int(wrapper["checkin_id"]), ts)
+        return
+
+    if is_mark_unknown(wrapper):
+        mark_checkin_unknown(int(wrapper["checkin_id"]), ts)
+        return
+
+    if is_mark_missing(wrapper):
+        mark_environment_missing(int(wrapper["monitor_environment_id"]), ts)
+        return
+
+    logger.error("Unsupported clock-tick task type: %s", wrapper["type"])
+
+
+def process_clock_task_batch(message: Message[ValuesBatch[KafkaPayload]]):
+    """
+    Processes a batch of clock tasks in order. Consecutive mark_missing tasks
+    of the same clock tick are handled together, so that a tick which finds
+    many monitors missed does not cost a round of queries per monitor.
+    """
+    tasks: list[tuple[MonitorsClockTasks, datetime]] = []
+    for item in message.payload:
+        try:
+            wrapper = MONITORS_CLOCK_TASKS_CODEC.decode(item.payload.value)
+        except Exception:
+            logger.exception("Failed to process clock tick task")
+            continue
+        tasks.append((wrapper, datetime.fromtimestamp(wrapper["ts"], tz=timezone.utc)))
+
+    for (missing, ts), group in groupby(
+        tasks, key=lambda task: (is_mark_missing(task[0]), task[1])
+    ):
+        if missing:
+            monitor_environment_ids = [
+                int(wrapper["monitor_environment_id"]) for wrapper, _ in group
+            ]
+            try:
+                mark_environments_missing(monitor_environment_ids, ts)
+            except Exception:
+                logger.exception("Failed to process clock tick task")
+            continue
+
+        for wrapper, _ in group:
+            try:
+                _process_task(wrapper, ts)
+            except Exception:
+                logger.exception("Failed to process clock tick task")
+
+
 class MonitorClockTasksStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
-    def __init__(self) -> None:
-        pass
+    def __init__(
+        self,
+        mode: Literal["serial", "batched"] | None = None,
+        max_batch_size: int | None = None,
+        max_batch_time: int | None = None,
+    ) -> None:
+        self.batched = mode == "batched"
+        self.max_batch_size = max_batch_size or 500
+        self.max_batch_time = max_batch_time or 1
 
     def create_with_partitions(
         self,
@@ -77,6 +127,16 @@ class MonitorClockTasksStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         # XXX(epurkihser): We're going to want to add some form of parallelism
         # here, but we'll need to be careful that we keep tasks grouped by
         # their partitions.
+        if self.batched:
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(
+                    function=process_clock_task_batch,
+                    next_step=CommitOffsets(commit),
+                ),
+            )
+
         return RunTask(
             function=process_clock_task,
             next_step=CommitOffsets(commit),
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import logging
 import uuid
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor, wait
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from functools import partial
 from typing import Any, Literal, NotRequired, TypedDict
@@ -22,11 +23,12 @@ from sentry_kafka_schemas.codecs import Codec
 from sentry_kafka_schemas.schema_types.ingest_monitors_v1 import IngestMonitorMessage
 from sentry_sdk.tracing import Span, Transaction
 
-from sentry import quotas, ratelimits
+from sentry import options, quotas, ratelimits
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.killswitches import killswitch_matches_context
+from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.monitors.clock_dispatch import try_monitor_clock_tick
 from sentry.monitors.constants import PermitCheckInStatus
@@ -86,19 +88,147 @@ CHECKIN_QUOTA_LIMIT = 6
 CHECKIN_QUOTA_WINDOW = 60
 
 
+@dataclass(frozen=True)
+class PrefetchedCheckin:
+    """
+    Lookups done for a check-in up front, together with the rest of its batch.
+    See `prefetch_checkins`.
+    """
+
+    is_ratelimited: bool
+    """
+    Result of the check-in rate limit, already counted against the quota.
+    """
+
+    monitor: Monitor | None = None
+    """
+    The existing monitor of the check-in. Only resolved for the first check-in
+    of each group, as processing a check-in may create or modify its monitor.
+    """
+
+    monitor_environment: MonitorEnvironment | None = None
+    """
+    The existing monitor environment of the check-in. Only resolved alongside
+    the monitor.
+    """
+
+
+def _get_ratelimit_key(item: CheckinItem) -> str:
+    # Use the kafka message timestamp as part of the key to ensure we do not
+    # rate-limit during backlog processing.
+    ts = item.ts.replace(second=0, microsecond=0)
+    return f"monitor-checkins:{item.processing_key}:{ts}"
+
+
+def prefetch_checkins(
+    checkin_mapping: Mapping[str, list[CheckinItem]],
+) -> dict[str, list[PrefetchedCheckin]]:
+    """
+    Resolve the rate limits of every check-in in the batch with a single
+    pipeline and the existing monitors and monitor environments of every
+    check-in group with a handful of queries, instead of doing so for each
+    check-in individually.
+
+    Returns the prefetched values for each check-in, in the same order as
+    the check-ins of each group.
+    """
+    first_items = [group[0] for group in checkin_mapping.values()]
+
+    monitors = Monitor.objects.filter(
+        project_id__in={int(item.message["project_id"]) for item in first_items},
+        slug__in={item.valid_monitor_slug for item in first_items},
+    )
+    monitors_by_key = {(monitor.project_id, monitor.slug): monitor for monitor in monitors}
+
+    def get_environment_name(item: CheckinItem) -> str:
+        return item.payload.get("environment") or "production"
+
+    # Groups of the same monitor in different environments are processed in
+    # parallel, they must not share a monitor instance.
+    group_monitor_keys = {
+        processing_key: (int(group[0].message["project_id"]), group[0].valid_monitor_slug)
+        for processing_key, group in checkin_mapping.items()
+    }
+    groups_per_monitor = Counter(group_monitor_keys.values())
+
+    monitor_by_processing_key: dict[str, Monitor] = {}
+    for processing_key, monitor_key in group_monitor_keys.items():
+        monitor = monitors_by_key.get(monitor_key)
+        if monitor is not None and groups_per_monitor[monitor_key] == 1:
+            monitor_by_processing_key[processing_key] = monitor
+
+    environments = Environment.objects.filter(
+        organization_id__in={
+            monitor.organization_id for monitor in monitor_by_processing_key.values()
+        },
+        name__in={
+            get_environment_name(checkin_mapping[processing_key][0])
+            for processing_key in monitor_by_processing_key
+        },
+    ).values_list("organization_id", "name", "id")
+    environment_ids = {
+        (organization_id, name): environment_id
+        for organization_id, name, environment_id in environments
+    }
+
+    monitor_environments = MonitorEnvironment.objects.filter(
+        monitor_id__in={monitor.id for monitor in monitor_by_processing_key.values()},
+        environment_id__in=set(environment_ids.values()),
+    )
+    monitor_environments_by_key = {
+        (monitor_environment.monitor_id, monitor_environment.environment_id): monitor_environment
+        for monitor_environment in monitor_environments
+    }
+
+    items = [item for group in checkin_mapping.values() for item in group]
+    is_limited = iter(
+        ratelimits.backend.is_limited_many(
+            [_get_ratelimit_key(item) for item in items],
+            limit=CHECKIN_QUOTA_LIMIT,
+            window=CHECKIN_QUOTA_WINDOW,
+        )
+    )
+
+    prefetched: dict[str, list[PrefetchedCheckin]] = {}
+    for processing_key, group in checkin_mapping.items():
+        monitor = monitor_by_processing_key.get(processing_key)
+        monitor_environment = None
+        if monitor is not None:
+            environment_id = environment_ids.get(
+                (monitor.organization_id, get_environment_name(group[0]))
+            )
+            monitor_environment = monitor_environments_by_key.get((monitor.id, environment_id))
+            if monitor_environment is not None:
+                monitor_environment.monitor = monitor
+
+        prefetched[processing_key] = [
+            PrefetchedCheckin(next(is_limited), monitor, monitor_environment),
+            *(PrefetchedCheckin(next(is_limited)) for _ in group[1:]),
+        ]
+
+    return prefetched
+
+
 def _ensure_monitor_with_config(
     project: Project,
     monitor_slug: str,
     config: dict[str, Any] | None,
+    monitor: Monitor | None = None,
 ) -> Monitor | None:
-    try:
-        monitor = Monitor.objects.get(
-            slug=monitor_slug,
-            project_id=project.id,
-            organization_id=project.organization_id,
-        )
-    except Monitor.DoesNotExist:
-        monitor = None
+    """
+    Retrieve the monitor of a check-in, creating or updating it from the
+    check-in's config. An already retrieved `monitor` may be passed in to
+    skip looking it up again.
+    """
+    if monitor is None:
+        try:
+            monitor = Monitor.objects.get(
+                slug=monitor_slug,
+                project_id=project.id,
+                organization_id=project.organization_id,
+            )
+        except Monitor.DoesNotExist:
+            monitor = None
 
     if not config:
         return monitor
@@ -192,21 +322,23 @@ def check_killswitch(
     return is_blocked
 
 
-def check_ratelimit(metric_kwargs: dict[str, str], item: CheckinItem) -> bool:
+def check_ratelimit(
+    metric_kwargs: dict[str, str],
+    item: CheckinItem,
+    is_blocked: bool | None = None,
+) -> bool:
     """
     Enforce check-in rate limits. Returns True if rate limit is enforced.
-    """
-    # Use the kafka message timestamp as part of the key to ensure we do not
-    # rate-limit during backlog processing.
-    ts = item.ts.replace(second=0, microsecond=0)
-
-    ratelimit_key = f"{item.processing_key}:{ts}"
 
-    is_blocked = ratelimits.backend.is_limited(
-        f"monitor-checkins:{ratelimit_key}",
-        limit=CHECKIN_QUOTA_LIMIT,
-        window=CHECKIN_QUOTA_WINDOW,
-    )
+    `is_blocked` may be passed when the rate limit was already checked for the
+    check-in, see `prefetch_checkins`.
+    """
+    if is_blocked is None:
+        is_blocked = ratelimits.backend.is_limited(
+            _get_ratelimit_key(item),
+            limit=CHECKIN_QUOTA_LIMIT,
+            window=CHECKIN_QUOTA_WINDOW,
+        )
 
     if is_blocked:
         metrics.incr(
@@ -415,7 +547,11 @@ def update_existing_check_in(
     existing_check_in.update(**updated_checkin)
 
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
+def _process_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    prefetched: PrefetchedCheckin | None = None,
+) -> None:
     params = item.payload
 
     # XXX: The start_time is when relay recieved the original envelope store
@@ -453,7 +589,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
         }
         raise ProcessingErrorsException([killswitch_error])
 
-    if check_ratelimit(metric_kwargs, item):
+    if check_ratelimit(metric_kwargs, item, prefetched.is_ratelimited if prefetched else None):
         track_outcome(
             org_id=project.organization_id,
             project_id=project.id,
@@ -561,6 +697,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
             project,
             monitor_slug,
             monitor_config,
+            prefetched.monitor if prefetched else None,
         )
     except ProcessingErrorsException as e:
         ensure_config_errors = list(e.processing_errors)
@@ -670,9 +807,16 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
     # 02
     # Retrieve or upsert monitor environment for this check-in
     try:
-        monitor_environment = MonitorEnvironment.objects.ensure_environment(
-            project, monitor, environment
-        )
+        if (
+            prefetched
+            and prefetched.monitor_environment
+            and prefetched.monitor_environment.monitor_id == monitor.id
+        ):
+            monitor_environment = prefetched.monitor_environment
+        else:
+            monitor_environment = MonitorEnvironment.objects.ensure_environment(
+                project, monitor, environment
+            )
     except MonitorEnvironmentLimitsExceeded as e:
         metrics.incr(
             "monitors.checkin.result",
@@ -932,7 +1076,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin(item: CheckinItem) -> None:
+def process_checkin(item: CheckinItem, prefetched: PrefetchedCheckin | None = None) -> None:
     """
     Process an individual check-in
     """
@@ -943,20 +1087,23 @@ def process_checkin(item: CheckinItem) -> None:
         ) as txn:
             # Deepcopy the checkin here so that it's not modified. We need the original when we get a
             # `ProcessingErrorsException`
-            _process_checkin(deepcopy(item), txn)
+            _process_checkin(deepcopy(item), txn, prefetched)
     except ProcessingErrorsException as e:
         handle_processing_errors(item, e)
     except Exception:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin_group(items: list[CheckinItem]) -> None:
+def process_checkin_group(
+    items: list[CheckinItem],
+    prefetched: list[PrefetchedCheckin] | None = None,
+) -> None:
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
     """
-    for item in items:
-        process_checkin(item)
+    for index, item in enumerate(items):
+        process_checkin(item, prefetched[index] if prefetched else None)
 
 
 def process_batch(
@@ -1008,8 +1155,17 @@ def process_batch(
 
     # Submit check-in groups for processing
     with sentry_sdk.start_transaction(op="process_batch", name="monitors.monitor_consumer"):
+        prefetched: dict[str, list[PrefetchedCheckin]] = {}
+        if options.get("crons.consumer.batch-prefetch"):
+            try:
+                prefetched = prefetch_checkins(checkin_mapping)
+            except Exception:
+                # Fall back to resolving each check-in individually
+                logger.exception("Failed to prefetch check-ins")
+
         futures = [
-            executor.submit(process_checkin_group, group) for group in checkin_mapping.values()
+            executor.submit(process_checkin_group, group, prefetched.get(processing_key))
+            for processing_key, group in checkin_mapping.items()
         ]
         wait(futures)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from datetime import datetime, timedelta
-from threading import local
+from threading import Lock, local
 from typing import Any
 
 import sentry_sdk
@@ -10,6 +10,7 @@ from django.core.cache import BaseCache, InvalidCacheBackendError, caches
 from django.utils.functional import cached_property
 
 from sentry import options
+from sentry.nodestore.local_cache import LocalNodeCache
 from sentry.utils import json, metrics
 from sentry.utils.services import Service
 
@@ -28,6 +29,31 @@ json_dumps = json.JSONEncoder(
 
 json_loads = json.loads
 
+_local_cache: LocalNodeCache | None = None
+_local_cache_lock = Lock()
+
+
+def get_local_cache() -> LocalNodeCache | None:
+    """
+    Return the per-process node cache, or `None` if it is disabled. The size
+    and TTLs are read once, when the cache is first created.
+    """
+    global _local_cache
+
+    if not options.get("nodestore.local-cache.enabled"):
+        return None
+
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalNodeCache(
+                    max_bytes=options.get("nodestore.local-cache.max-bytes"),
+                    ttl=options.get("nodestore.local-cache.ttl"),
+                    negative_ttl=options.get("nodestore.local-cache.negative-ttl"),
+                )
+
+    return _local_cache
+
 
 class NodeStorage(local, Service):
     """
@@ -147,7 +173,7 @@ class NodeStorage(local, Service):
                     return item_from_cache
 
             span.set_tag("subkey", str(subkey))
-            bytes_data = self._get_bytes(id)
+            bytes_data = self._get_bytes_locally_cached(id)
             rv = self._decode(bytes_data, subkey=subkey)
             if subkey is None:
                 # set cache item only after we know decoding did not fail
@@ -171,6 +197,34 @@ class NodeStorage(local, Service):
         """
         return {id: self._get_bytes(id) for id in id_list}
 
+    def _get_bytes_locally_cached(self, id: str) -> bytes | None:
+        local_cache = get_local_cache()
+        if local_cache is None:
+            return self._get_bytes(id)
+
+        cached = local_cache.get_many([id])
+        if id in cached:
+            return cached[id]
+
+        bytes_data = self._get_bytes(id)
+        local_cache.set_many({id: bytes_data})
+        return bytes_data
+
+    def _get_bytes_multi_locally_cached(self, id_list: list[str]) -> dict[str, bytes | None]:
+        local_cache = get_local_cache()
+        if local_cache is None:
+            return self._get_bytes_multi(id_list)
+
+        rv = local_cache.get_many(id_list)
+        missing_ids = [id for id in id_list if id not in rv]
+        if missing_ids:
+            fetched = self._get_bytes_multi(missing_ids)
+            # Not every backend returns an entry for ids it could not find.
+            local_cache.set_many({**dict.fromkeys(missing_ids), **fetched})
+            rv.update(fetched)
+
+        return rv
+
     def get_multi(self, id_list: list[str], subkey: str | None = None) -> dict[str, Any | None]:
         """
         >>> nodestore.get_multi(['key1', 'key2')
@@ -196,7 +250,7 @@ class NodeStorage(local, Service):
             with sentry_sdk.start_span(op="nodestore._get_bytes_multi_and_decode") as span:
                 items = {
                     id: self._decode(value, subkey=subkey)
-                    for id, value in self._get_bytes_multi(uncached_ids).items()
+                    for id, value in self._get_bytes_multi_locally_cached(uncached_ids).items()
                 }
             if subkey is None:
                 self._set_cache_items(items)
@@ -229,7 +283,12 @@ class NodeStorage(local, Service):
         >>> nodestore.set_bytes('key1', b"{'foo': 'bar'}")
         """
         metrics.distribution("nodestore.set_bytes", len(data))
-        return self._set_bytes(item_id, data, ttl)
+        try:
+            return self._set_bytes(item_id, data, ttl)
+        finally:
+            local_cache = get_local_cache()
+            if local_cache is not None:
+                local_cache.delete_many([item_id])
 
     def _set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         raise NotImplementedError
@@ -294,10 +353,18 @@ class NodeStorage(local, Service):
             self.cache.set_many(items)
 
     def _delete_cache_item(self, item_id: str) -> None:
+        local_cache = get_local_cache()
+        if local_cache is not None:
+            local_cache.delete_many([item_id])
+
         if self.cache:
             self.cache.delete(item_id)
 
     def _delete_cache_items(self, id_list: list[str]) -> None:
+        local_cache = get_local_cache()
+        if local_cache is not None:
+            local_cache.delete_many(id_list)
+
         if self.cache:
             self.cache.delete_many([item_id for item_id in id_list])
 
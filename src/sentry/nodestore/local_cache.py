@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from cachetools import TLRUCache
+
+from sentry.utils import metrics
+
+# Stored in place of a missing node so that repeated lookups for nodes which
+# do not exist (yet) are answered locally as well.
+_MISSING = b""
+
+
+class LocalNodeCache:
+    """
+    A per-process, byte-budgeted LRU cache of raw node bytes.
+
+    Raw bytes are cached rather than decoded payloads: they are immutable, so
+    callers cannot mutate each other's results, their size is known exactly,
+    and every subkey of a node can be served from the same entry.
+
+    Entries expire after `ttl` seconds, missing nodes are remembered for
+    `negative_ttl` seconds. Writes and deletes done through this process
+    invalidate entries immediately, writes from other processes become
+    visible once the entry expires.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        negative_ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._cache: TLRUCache[str, bytes] = TLRUCache(
+            maxsize=max_bytes,
+            ttu=self._get_expiry,
+            timer=timer,
+            # Count missing nodes as one byte so that they still take up room.
+            getsizeof=lambda value: len(value) or 1,
+        )
+
+    def _get_expiry(self, key: str, value: bytes, now: float) -> float:
+        return now + (self.ttl if value is not _MISSING else self.negative_ttl)
+
+    def get_many(self, id_list: Iterable[str]) -> dict[str, bytes | None]:
+        """
+        Return the cached bytes for every id that is in the cache, `None` for
+        ids known to be missing. Ids that are not cached are left out.
+        """
+        rv: dict[str, bytes | None] = {}
+        with self._lock:
+            for id in id_list:
+                value = self._cache.get(id)
+                if value is not None:
+                    rv[id] = value or None
+
+        hits = len(rv)
+        negative_hits = sum(1 for value in rv.values() if value is None)
+        metrics.incr("nodestore.local_cache.hit", amount=hits - negative_hits)
+        metrics.incr("nodestore.local_cache.negative_hit", amount=negative_hits)
+        return rv
+
+    def set_many(self, items: dict[str, bytes | None]) -> None:
+        metrics.incr("nodestore.local_cache.miss", amount=len(items))
+        with self._lock:
+            for id, value in items.items():
+                try:
+                    self._cache[id] = value or _MISSING
+                except ValueError:
+                    # The node alone exceeds the whole budget.
+                    metrics.incr("nodestore.local_cache.too_large")
+
+            metrics.gauge("nodestore.local_cache.bytes", self._cache.currsize)
+
+    def delete_many(self, id_list: Iterable[str]) -> None:
+        with self._lock:
+            for id in id_list:
+                self._cache.pop(id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -747,6 +747,13 @@ register("snuba.search.max-total-chunk-time-seconds", default=30.0, flags=FLAG_A
 register("snuba.search.hits-sample-size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.track-outcomes-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Run identical cached Snuba queries only once per process at a time
+register("snuba.query-single-flight.enabled", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Lease identical cached Snuba queries across processes for this many seconds, 0 to disable
+register("snuba.query-single-flight.lease-seconds", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Referrers which get a Snuba query thread pool of the given size to themselves
+register("snuba.query-thread-pool-sizes", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # The percentage of tagkeys that we want to cache. Set to 1.0 in order to cache everything, <=0.0 to stop caching
 register(
     "snuba.tagstore.cache-tagkeys-rate",
@@ -1412,6 +1419,14 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# An option to enable the per-process hot string and rate limited string cache in front of
+# the caching indexer
+register(
+    "sentry-metrics.indexer.local-cache.enabled",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Option to control sampling percentage of schema validation on the generic metrics pipeline
 # based on namespace.
 register(
@@ -1997,6 +2012,15 @@ register(
     "nodestore.set-subkeys.enable-set-cache-item", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
 
+# Per-process cache of raw node bytes in front of the nodestore backend. Size
+# and TTLs are only read when the cache is first used in a process.
+register("nodestore.local-cache.enabled", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+register(
+    "nodestore.local-cache.max-bytes", default=64 * 1024 * 1024, flags=FLAG_AUTOMATOR_MODIFIABLE
+)
+register("nodestore.local-cache.ttl", default=10.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+register("nodestore.local-cache.negative-ttl", default=1.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # === Backpressure related runtime options ===
 
 # Enables monitoring of services for backpressure management.
@@ -2120,6 +2144,15 @@ register(
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Resolve rate limits, monitors and monitor environments for a whole batch of
+# check-ins up front in the monitors consumer, instead of once per check-in.
+register(
+    "crons.consumer.batch-prefetch",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 
 # Sets the timeout for webhooks
 register(
@@ -3325,3 +3358,14 @@ register(
 # Orgs for which compression should be disabled in the chunk upload endpoint.
 # This is intended to circumvent sporadic 503 errors reported by some customers.
 register("chunk-upload.no-compression", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
+
+# Number of Discover batch fragments a data export fetches from Snuba concurrently.
+register("data-export.fetch-concurrency", default=1, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
+# Number of ready digests of a project delivered by one task, 1 delivers every digest on its own.
+register("digests.delivery.batch-size", default=1, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Number of threads a batched digest delivery task sends notifications with.
+register("digests.delivery.concurrency", default=1, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
+# Number of independent child relations a deletion task deletes concurrently.
+register("deletions.child-relations.concurrency", default=1, flags=FLAG_AUTOMATOR_MODIFIABLE)
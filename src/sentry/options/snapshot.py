@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import logging
+import threading
+from random import random
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from sentry_sdk.integrations.logging import ignore_logger
+
+if TYPE_CHECKING:
+    from sentry.options.store import OptionsStore
+
+OPTIONS_SNAPSHOT_LOGGER_NAME = "sentry.options_snapshot"
+
+logger = logging.getLogger(OPTIONS_SNAPSHOT_LOGGER_NAME)
+# Like the options store, this is used while options are looked up, so the
+# SDK logging integration must not pick it up.
+ignore_logger(OPTIONS_SNAPSHOT_LOGGER_NAME)
+
+# How long to wait before subscribing again after the subscription failed
+RESUBSCRIBE_INTERVAL = 10.0
+
+# Upper bound for blocking on the pubsub channel, so that stopping the
+# refresher does not take longer than this.
+POLL_TIMEOUT = 1.0
+
+
+class OptionsSnapshotRefresher:
+    """
+    Keeps the options snapshot of an `OptionsStore` up to date from a single
+    background thread.
+
+    Every `refresh_interval` seconds the options changed since the watermark
+    of the snapshot are loaded, and every `full_refresh_interval` seconds all
+    of them are, which drops deleted options. Both intervals are jittered so
+    that processes do not all hit the database at once.
+
+    In between, keys written by any process are published on a redis pubsub
+    channel and reloaded by every subscriber as soon as they arrive. Pubsub
+    delivery is best effort, missed messages are caught up on by the
+    periodic refreshes.
+    """
+
+    def __init__(
+        self,
+        store: OptionsStore,
+        cluster: str,
+        channel: str,
+        refresh_interval: float,
+        full_refresh_interval: float,
+    ) -> None:
+        self.store = store
+        self.cluster = cluster
+        self.channel = channel
+        self.refresh_interval = refresh_interval
+        self.full_refresh_interval = full_refresh_interval
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="options-snapshot-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def publish(self, name: str) -> None:
+        """
+        Let every subscribed process know that the option `name` changed.
+        """
+        try:
+            self._get_client().publish(self.channel, name)
+        except Exception:
+            logger.warning("options.snapshot.publish-failed", extra={"key": name}, exc_info=True)
+
+    def _get_client(self) -> Any:
+        from sentry.utils.redis import clusters
+
+        # Publishers and subscribers must agree on a single host
+        return clusters.get(self.cluster).get_local_client(0)
+
+    def _get_deadline(self, interval: float) -> float:
+        return monotonic() + interval * (0.5 + random())
+
+    def _subscribe(self) -> Any | None:
+        try:
+            pubsub = self._get_client().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.channel)
+        except Exception:
+            logger.warning("options.snapshot.subscribe-failed", exc_info=True)
+            return None
+        return pubsub
+
+    def _load(self, **kwargs: Any) -> bool:
+        try:
+            self.store.load_snapshot(**kwargs)
+        except Exception:
+            logger.warning("options.snapshot.load-failed", exc_info=True)
+            return False
+        return True
+
+    def _run(self) -> None:
+        pubsub = None
+        next_subscribe = 0.0
+        next_refresh = 0.0
+        next_full_refresh = 0.0
+
+        while not self._stopped.is_set():
+            if pubsub is None and monotonic() >= next_subscribe:
+                pubsub = self._subscribe()
+                if pubsub is None:
+                    next_subscribe = monotonic() + RESUBSCRIBE_INTERVAL
+                else:
+                    # Catch up on anything published while not subscribed
+                    next_full_refresh = 0.0
+
+            now = monotonic()
+            if now >= next_full_refresh:
+                if self._load(full=True):
+                    next_full_refresh = self._get_deadline(self.full_refresh_interval)
+                    next_refresh = self._get_deadline(self.refresh_interval)
+                else:
+                    next_full_refresh = self._get_deadline(self.refresh_interval)
+            elif now >= next_refresh:
+                self._load()
+                next_refresh = self._get_deadline(self.refresh_interval)
+
+            timeout = min(
+                max(0.0, min(next_refresh, next_full_refresh) - monotonic()), POLL_TIMEOUT
+            )
+
+            if pubsub is None:
+                self._stopped.wait(timeout)
+                continue
+
+            try:
+                names: set[str] = set()
+                message = pubsub.get_message(timeout=timeout)
+                while message is not None:
+                    names.add(message["data"].decode())
+                    message = pubsub.get_message()
+            except Exception:
+                logger.warning("options.snapshot.receive-failed", exc_info=True)
+                pubsub.close()
+                pubsub = None
+                next_subscribe = monotonic() + RESUBSCRIBE_INTERVAL
+                continue
+
+            if names:
+                self._load(keys=names)
+
+        if pubsub is not None:
+            pubsub.close()
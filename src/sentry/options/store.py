@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import os
+import threading
+from collections.abc import Collection, Mapping
+from datetime import datetime, timedelta
 from random import random
-from time import time
-from typing import Any
+from time import monotonic, time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
 from django.db.utils import OperationalError, ProgrammingError
@@ -14,6 +19,9 @@ from sentry_sdk.integrations.logging import ignore_logger
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.options.manager import UpdateChannel
 
+if TYPE_CHECKING:
+    from sentry.options.snapshot import OptionsSnapshotRefresher
+
 CACHE_FETCH_ERR = "Unable to fetch option cache for %s"
 CACHE_UPDATE_ERR = "Unable to update option cache for %s"
 
@@ -57,6 +65,32 @@ class Key:
         return False
 
 
+@dataclasses.dataclass(frozen=True)
+class OptionsSnapshot:
+    """
+    An immutable view of every option stored in the database.
+
+    Snapshots are never modified once published, changes are applied by
+    replacing the snapshot of the store as a whole. This lets readers use
+    the snapshot without any locking.
+    """
+
+    values: Mapping[str, Any]
+    # The latest `last_updated` of all loaded options
+    watermark: datetime | None
+    # When the snapshot was last brought up to date with the store, as
+    # returned by `time.monotonic`
+    refreshed_at: float
+
+    def is_fresh(self, max_age: float) -> bool:
+        return monotonic() - self.refreshed_at < max_age
+
+
+# Options changed shortly before the watermark are loaded again, so that
+# writes from hosts with a slightly skewed clock are not missed.
+SNAPSHOT_WATERMARK_OVERLAP = timedelta(seconds=60)
+
+
 def _make_cache_value(key, value):
     now = int(time())
     return (value, now + key.ttl, now + key.ttl + key.grace)
@@ -82,6 +116,11 @@ class OptionsStore:
         self.ttl = ttl
         self.flush_local_cache()
 
+        self._snapshot: OptionsSnapshot | None = None
+        self._snapshot_lock = threading.Lock()
+        self.snapshot_max_age = 0.0
+        self.snapshot_refresher: OptionsSnapshotRefresher | None = None
+
     @property
     def model(self):
         return self.model_cls()
@@ -99,6 +138,12 @@ class OptionsStore:
         """
         Fetches a value from the options store.
         """
+        snapshot = self._snapshot
+        if snapshot is not None and key.ttl > 0 and snapshot.is_fresh(self.snapshot_max_age):
+            # The snapshot holds every stored option, anything missing from
+            # it is not set in the store either.
+            return snapshot.values.get(key.name)
+
         result = self.get_cache(key, silent=silent)
         if result is not None:
             return result
@@ -256,6 +301,7 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.set_store(key, value, channel)
+        self._update_snapshot(key.name, value)
         return self.set_cache(key, value)
 
     def set_store(self, key, value, channel: UpdateChannel):
@@ -297,6 +343,7 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.delete_store(key)
+        self._update_snapshot(key.name, deleted=True)
         return self.delete_cache(key)
 
     def delete_store(self, key):
@@ -362,6 +409,113 @@ class OptionsStore:
         if random() < 0.25:
             self.clean_local_cache()
 
+    def enable_snapshot(
+        self,
+        cluster: str,
+        channel: str,
+        refresh_interval: float,
+        full_refresh_interval: float,
+        max_age: float,
+    ) -> None:
+        """
+        Start serving options from a snapshot of the store, kept up to date
+        by a background thread. Until the first snapshot is loaded, and
+        whenever it is older than `max_age` seconds, options are looked up
+        through the cache as before.
+        """
+        from sentry.options.snapshot import OptionsSnapshotRefresher
+
+        if self.snapshot_refresher is not None:
+            return
+
+        self.snapshot_max_age = max_age
+        self.snapshot_refresher = OptionsSnapshotRefresher(
+            self,
+            cluster=cluster,
+            channel=channel,
+            refresh_interval=refresh_interval,
+            full_refresh_interval=full_refresh_interval,
+        )
+        self.snapshot_refresher.start()
+        os.register_at_fork(after_in_child=self._restart_snapshot_refresher)
+
+    def _restart_snapshot_refresher(self) -> None:
+        # Threads do not survive a fork, and the lock may have been held by
+        # one of them at the time.
+        self._snapshot_lock = threading.Lock()
+        if self.snapshot_refresher is not None:
+            self.snapshot_refresher.start()
+
+    def load_snapshot(self, keys: Collection[str] | None = None, full: bool = False) -> None:
+        """
+        Bring the snapshot up to date with the store in a single query.
+
+        By default only options changed since the watermark of the current
+        snapshot are loaded. With `keys`, just those options are reloaded,
+        which also picks up their deletion. With `full`, or when there is no
+        snapshot yet, all options are loaded.
+        """
+        # Loads are serialized with each other and with local writes, so an
+        # older load can never overwrite the result of a newer one.
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            full = full or snapshot is None
+
+            queryset = self.model.objects.all()
+            if not full:
+                assert snapshot is not None
+                if keys is not None:
+                    queryset = queryset.filter(key__in=keys)
+                elif snapshot.watermark is not None:
+                    queryset = queryset.filter(
+                        last_updated__gte=snapshot.watermark - SNAPSHOT_WATERMARK_OVERLAP
+                    )
+
+            with in_test_hide_transaction_boundary():
+                rows = list(queryset.values_list("key", "value", "last_updated"))
+
+            values: dict[str, Any] = {}
+            watermark = None
+            refreshed_at = monotonic()
+            if snapshot is not None and not full:
+                values.update(snapshot.values)
+                watermark = snapshot.watermark
+                if keys is not None:
+                    # Only the given keys were loaded, the snapshot as a
+                    # whole is not any fresher than before.
+                    refreshed_at = snapshot.refreshed_at
+                    for name in keys:
+                        values.pop(name, None)
+
+            for name, value, last_updated in rows:
+                values[name] = value
+                if watermark is None or last_updated > watermark:
+                    watermark = last_updated
+
+            self._snapshot = OptionsSnapshot(
+                values=MappingProxyType(values),
+                watermark=watermark,
+                refreshed_at=refreshed_at,
+            )
+
+    def _update_snapshot(self, name: str, value: Any = None, deleted: bool = False) -> None:
+        """
+        Apply a write done through this store to the snapshot right away and
+        let every other process know about it.
+        """
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                values = dict(snapshot.values)
+                if deleted:
+                    values.pop(name, None)
+                else:
+                    values[name] = value
+                self._snapshot = dataclasses.replace(snapshot, values=MappingProxyType(values))
+
+        if self.snapshot_refresher is not None:
+            self.snapshot_refresher.publish(name)
+
     def close(self) -> None:
         self.clean_local_cache()
 
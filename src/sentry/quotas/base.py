@@ -305,6 +305,7 @@ class Quota(Service):
         "get_project_quota",
         "get_organization_quota",
         "is_rate_limited",
+        "is_rate_limited_many",
         "validate",
         "refund",
         "get_event_retention",
@@ -371,6 +372,15 @@ class Quota(Service):
         """
         return NotRateLimited()
 
+    def is_rate_limited_many(self, items, timestamp=None):
+        """
+        Batched variant of ``is_rate_limited`` for many items, given as
+        ``(project, key)`` tuples. Returns a rate limit for every item, in
+        order, with the same results as calling ``is_rate_limited`` for each
+        item in turn.
+        """
+        return [self.is_rate_limited(project, key=key) for project, key in items]
+
     def refund(self, project, key=None, timestamp=None, category=None, quantity=None):
         """
         Signals event rejection after ``quotas.is_rate_limited`` has been called
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from time import time
 
 import rb
@@ -20,6 +20,7 @@ from sentry.utils.redis import (
 )
 
 is_rate_limited = load_redis_script("quotas/is_rate_limited.lua")
+is_rate_limited_many = load_redis_script("quotas/is_rate_limited_many.lua")
 
 
 class RedisQuota(Quota):
@@ -234,31 +235,21 @@ class RedisQuota(Quota):
         """Return the timestamp when the next rate limit period begins for an interval."""
         return (((timestamp - shift) // interval) + 1) * interval + shift
 
-    def is_rate_limited(
-        self, project: Project, key: ProjectKey | None = None, timestamp: float | None = None
-    ) -> RateLimited | NotRateLimited:
-        # XXX: This is effectively deprecated and scheduled for removal. Event
-        # ingestion quotas are now enforced in Relay. This function will be
-        # deleted once the Python store endpoints are removed.
-
-        if timestamp is None:
-            timestamp = time()
-
+    def __get_error_quotas(self, project: Project, key: ProjectKey | None) -> list[QuotaConfig]:
         # Relay supports separate rate limiting per data category and and can
         # handle scopes explicitly. This function implements a simplified logic
         # that treats all events the same and ignores transaction rate limits.
         # Thus, we filter for (1) no categories, which implies this quota
         # affects all data, and (2) quotas that specify `error` events.
-        quotas = [
+        return [
             q
             for q in self.get_quotas(project, key=key)
             if not q.categories or DataCategory.ERROR in q.categories
         ]
 
-        # If there are no quotas to actually check, skip the trip to the database.
-        if not quotas:
-            return NotRateLimited()
-
+    def __get_script_args(
+        self, quotas: list[QuotaConfig], organization_id: int, timestamp: float
+    ) -> tuple[list[str], list[int]] | RateLimited:
         keys: list[str] = []
         args: list[int] = []
         for quota in quotas:
@@ -273,8 +264,8 @@ class RedisQuota(Quota):
 
             assert quota.should_track
 
-            shift: int = project.organization_id % quota.window
-            quota_key = self.__get_redis_key(quota, timestamp, shift, project.organization_id)
+            shift: int = organization_id % quota.window
+            quota_key = self.__get_redis_key(quota, timestamp, shift, organization_id)
             return_key = self.get_refunded_quota_key(quota_key)
             keys.extend((quota_key, return_key))
             expiry = self.get_next_period_start(quota.window, shift, timestamp) + self.grace
@@ -283,12 +274,15 @@ class RedisQuota(Quota):
             lua_quota = quota.limit if quota.limit is not None else -1
             args.extend((lua_quota, int(expiry)))
 
-        if not keys or not args:
-            return NotRateLimited()
-
-        client = self.__get_redis_client(str(project.organization_id))
-        rejections = is_rate_limited(keys, args, client)
+        return keys, args
 
+    def __get_rate_limit(
+        self,
+        quotas: list[QuotaConfig],
+        rejections: Sequence[bool],
+        organization_id: int,
+        timestamp: float,
+    ) -> RateLimited | NotRateLimited:
         if not any(rejections):
             return NotRateLimited()
 
@@ -297,9 +291,122 @@ class RedisQuota(Quota):
             if not rejected:
                 continue
 
-            shift = project.organization_id % quota.window
+            shift = organization_id % quota.window
             delay = self.get_next_period_start(quota.window, shift, timestamp) - timestamp
             if delay > worst_case[0]:
                 worst_case = (delay, quota.reason_code)
 
         return RateLimited(retry_after=worst_case[0], reason_code=worst_case[1])
+
+    def is_rate_limited(
+        self, project: Project, key: ProjectKey | None = None, timestamp: float | None = None
+    ) -> RateLimited | NotRateLimited:
+        # XXX: This is effectively deprecated and scheduled for removal. Event
+        # ingestion quotas are now enforced in Relay. This function will be
+        # deleted once the Python store endpoints are removed.
+
+        if timestamp is None:
+            timestamp = time()
+
+        quotas = self.__get_error_quotas(project, key)
+
+        # If there are no quotas to actually check, skip the trip to the database.
+        if not quotas:
+            return NotRateLimited()
+
+        script_args = self.__get_script_args(quotas, project.organization_id, timestamp)
+        if isinstance(script_args, RateLimited):
+            return script_args
+
+        keys, args = script_args
+        if not keys or not args:
+            return NotRateLimited()
+
+        client = self.__get_redis_client(str(project.organization_id))
+        rejections = is_rate_limited(keys, args, client)
+
+        return self.__get_rate_limit(quotas, rejections, project.organization_id, timestamp)
+
+    def is_rate_limited_many(
+        self,
+        items: Sequence[tuple[Project, ProjectKey | None]],
+        timestamp: float | None = None,
+    ) -> list[RateLimited | NotRateLimited]:
+        """
+        Batched variant of `is_rate_limited` which checks and consumes the
+        quotas of all items with a single script invocation per Redis shard.
+
+        Items are checked in order and results are the same as calling
+        `is_rate_limited` for each item in turn.
+        """
+        if timestamp is None:
+            timestamp = time()
+
+        results: list[RateLimited | NotRateLimited] = [NotRateLimited()] * len(items)
+        quotas_by_item: list[list[QuotaConfig]] = [[] for _ in items]
+        quotas_cache: dict[tuple[int, int | None], list[QuotaConfig]] = {}
+
+        # Keys of one organization share a hash tag, so they always live on
+        # the same shard. With Redis Cluster, all keys of a script must even
+        # be in the same slot, so only organizations are batched together.
+        batches: dict[int | str, tuple[list[str], list[int], list[int]]] = {}
+        for index, (project, key) in enumerate(items):
+            cache_key = (project.id, key.id if key else None)
+            quotas = quotas_cache.get(cache_key)
+            if quotas is None:
+                quotas = quotas_cache[cache_key] = self.__get_error_quotas(project, key)
+
+            if not quotas:
+                continue
+
+            script_args = self.__get_script_args(quotas, project.organization_id, timestamp)
+            if isinstance(script_args, RateLimited):
+                results[index] = script_args
+                continue
+
+            keys, args = script_args
+            if not keys or not args:
+                continue
+
+            quotas_by_item[index] = quotas
+            batch_keys, batch_args, batch_items = batches.setdefault(
+                self.__get_shard(project.organization_id), ([], [], [])
+            )
+            batch_keys.extend(keys)
+            for limit, expiry in zip(args[::2], args[1::2]):
+                batch_args.extend((limit, expiry, index))
+            batch_items.append(index)
+
+        for shard, (batch_keys, batch_args, batch_items) in batches.items():
+            client = self.__get_shard_client(shard)
+            rejections = is_rate_limited_many(batch_keys, batch_args, client)
+
+            offset = 0
+            for index in batch_items:
+                project, _ = items[index]
+                quotas = quotas_by_item[index]
+                results[index] = self.__get_rate_limit(
+                    quotas,
+                    rejections[offset : offset + len(quotas)],
+                    project.organization_id,
+                    timestamp,
+                )
+                offset += len(quotas)
+
+        return results
+
+    def __get_shard(self, organization_id: int) -> int | str:
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return str(organization_id)
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            return self.cluster.get_router().get_host_for_key(str(organization_id))
+        else:
+            raise AssertionError("unreachable")
+
+    def __get_shard_client(self, shard: int | str) -> RedisCluster | rb.RoutingClient:
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return self.cluster
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            return self.cluster.get_local_client(shard)
+        else:
+            raise AssertionError("unreachable")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from sentry.utils.services import Service
@@ -9,7 +10,13 @@ if TYPE_CHECKING:
 
 
 class RateLimiter(Service):
-    __all__ = ("is_limited", "validate", "current_value", "is_limited_with_value")
+    __all__ = (
+        "is_limited",
+        "is_limited_many",
+        "validate",
+        "current_value",
+        "is_limited_with_value",
+    )
 
     window = 60
 
@@ -19,6 +26,16 @@ class RateLimiter(Service):
         is_limited, _, _ = self.is_limited_with_value(key, limit, project=project, window=window)
         return is_limited
 
+    def is_limited_many(
+        self, keys: Sequence[str], limit: int, window: int | None = None
+    ) -> list[bool]:
+        """
+        Does a rate limit check for each of the keys in order, counting every
+        occurrence of a key. Backends may override this to check all keys at
+        once.
+        """
+        return [self.is_limited(key, limit, window=window) for key in keys]
+
     def current_value(
         self, key: str, project: Project | None = None, window: int | None = None
     ) -> int:
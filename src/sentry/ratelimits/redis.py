@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from time import time
 from typing import TYPE_CHECKING, Any
 
@@ -121,6 +122,31 @@ class RedisRateLimiter(RateLimiter):
 
         return result > limit, result, reset_time
 
+    def is_limited_many(
+        self, keys: Sequence[str], limit: int, window: int | None = None
+    ) -> list[bool]:
+        """
+        Does the rate limit checks of all keys with a single pipeline.
+        """
+        request_time = time()
+        if window is None or window == 0:
+            window = self.window
+
+        expiration = window - int(request_time % window)
+        try:
+            pipe = self.client.pipeline()
+            for key in keys:
+                redis_key = self._construct_redis_key(key, window=window, request_time=request_time)
+                pipe.incr(redis_key)
+                pipe.expire(redis_key, expiration)
+            # Every other result is the counter value, the rest are expires.
+            results = pipe.execute()[::2]
+        except RedisError:
+            logger.exception("Failed to retrieve current rate limit value from redis")
+            return [False] * len(keys)
+
+        return [result > limit for result in results]
+
     def reset(self, key: str, project: Project | None = None, window: int | None = None) -> None:
         redis_key = self._construct_redis_key(key, project=project, window=window)
         self.client.delete(redis_key)
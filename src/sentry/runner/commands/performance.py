@@ -75,18 +75,23 @@ def detect(filename: str, detector_class: str | None, verbose: int) -> None:
 
 @performance.command()
 @click.argument("filename", type=click.Path(exists=True))
-@click.option("-d", "--detector", "detector_class", help="Detector class", required=True)
+@click.option(
+    "-d",
+    "--detector",
+    "detector_class",
+    help="Detector class. Times all detectors in a single pass if omitted.",
+)
 @click.option(
     "-n", required=False, type=int, default=1000, help="Number of times to run detection."
 )
 @configuration
-def timeit(filename: str, detector_class: str, n: int) -> None:
+def timeit(filename: str, detector_class: str | None, n: int) -> None:
     """
     Runs timing on performance problem detection on event data in the supplied
     filename and report results.
     """
 
-    click.echo(f"Running timeit {n} times on {detector_class}")
+    click.echo(f"Running timeit {n} times on {detector_class or 'all detectors'}")
 
     import timeit
 
@@ -97,10 +102,14 @@ def timeit(filename: str, detector_class: str, n: int) -> None:
     with open(filename) as file:
         data = json.loads(file.read())
 
-    detector = performance_detection.__dict__[detector_class](settings, data)
+    if detector_class:
+        detector_classes = [performance_detection.__dict__[detector_class]]
+    else:
+        detector_classes = performance_detection.DETECTOR_CLASSES
 
     def detect() -> None:
-        performance_detection.run_detector_on_data(detector, data)
+        detectors = [cls(settings, data) for cls in detector_classes]
+        performance_detection.run_detectors_on_data(detectors, data)
 
     result = timeit.timeit(stmt=detect, number=n)
     click.echo(f"Average runtime: {result * 1000 / n} ms")
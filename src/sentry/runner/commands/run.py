@@ -313,6 +313,17 @@ def taskworker_scheduler(redis_cluster: str, **options: Any) -> None:
     help="The name of the processing pool being used",
     default="unknown",
 )
+@click.option(
+    "--process-type",
+    help="How child processes are started. forkserver forks them from a preloaded template process",
+    type=click.Choice(["spawn", "fork", "forkserver"]),
+    default="spawn",
+)
+@click.option(
+    "--fetch-batch-size",
+    help="The maximum number of tasks to fetch at once to keep child processes busy",
+    default=taskworker_constants.DEFAULT_FETCH_BATCH_SIZE,
+)
 @log_options()
 @configuration
 def taskworker(**options: Any) -> None:
@@ -336,6 +347,8 @@ def run_taskworker(
     result_queue_maxsize: int,
     rebalance_after: int,
     processing_pool_name: str,
+    fetch_batch_size: int,
+    process_type: str,
     **options: Any,
 ) -> None:
     """
@@ -354,6 +367,8 @@ def run_taskworker(
             result_queue_maxsize=result_queue_maxsize,
             rebalance_after=rebalance_after,
             processing_pool_name=processing_pool_name,
+            fetch_batch_size=fetch_batch_size,
+            process_type=process_type,
             **options,
         )
         exitcode = worker.start()
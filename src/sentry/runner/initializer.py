@@ -515,6 +515,16 @@ def bind_cache_to_option_store() -> None:
 
     default_store.set_cache_impl(default_cache)
 
+    snapshot_options = settings.SENTRY_OPTIONS_SNAPSHOT
+    if snapshot_options["enabled"]:
+        default_store.enable_snapshot(
+            cluster=snapshot_options["cluster"],
+            channel=snapshot_options["channel"],
+            refresh_interval=snapshot_options["refresh_interval"],
+            full_refresh_interval=snapshot_options["full_refresh_interval"],
+            max_age=snapshot_options["max_age"],
+        )
+
 
 def apply_legacy_settings(settings: Any) -> None:
     from sentry import options
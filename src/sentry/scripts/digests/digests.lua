@@ -309,6 +309,21 @@ local function digest_timeline(configuration, timeline_id, timeline_capacity)
     return results
 end
 
+local function digest_timelines(configuration, timeline_ids, timeline_capacity)
+    -- Timelines that are not in the ready state (most likely because another
+    -- worker already delivered them) are skipped rather than failing the
+    -- whole batch.
+    local results = {}
+    local i = 0
+    for _, timeline_id in ipairs(timeline_ids) do
+        if redis.call('ZSCORE', configuration:get_schedule_ready_key(), timeline_id) ~= false then
+            i = i + 1
+            results[i] = {timeline_id, digest_timeline(configuration, timeline_id, timeline_capacity)}
+        end
+    end
+    return results
+end
+
 local function close_digest(configuration, timeline_id, delay_minimum, record_ids)
     local timeline_key = configuration:get_timeline_key(timeline_id)
     local digest_key = configuration:get_timeline_digest_key(timeline_id)
@@ -439,6 +454,14 @@ local commands = {
         )(cursor, arguments)
         return digest_timeline(configuration, timeline_id, timeline_capacity)
     end,
+    DIGEST_OPEN_MANY = function (cursor, arguments)
+        local cursor, configuration, timeline_capacity, timeline_ids = multiple_argument_parser(
+            configuration_argument_parser,
+            argument_parser(tonumber),
+            variadic_argument_parser(argument_parser())
+        )(cursor, arguments)
+        return digest_timelines(configuration, timeline_ids, timeline_capacity)
+    end,
     DIGEST_CLOSE = function (cursor, arguments)
         local cursor, configuration, timeline_id, delay_minimum, record_ids = multiple_argument_parser(
             configuration_argument_parser,
@@ -0,0 +1,55 @@
+-- Batched variant of ``is_rate_limited.lua`` which checks the quotas of many
+-- items in a single invocation. Values provided as ``KEYS`` are the same
+-- counter and refund counter pairs, and values provided as ``ARGV`` specify
+-- the quota limit, the expiration time and the item each pair belongs to.
+-- Pairs of the same item must be adjacent.
+--
+-- For example, to check an item ``1`` against the quotas ``foo`` and ``bar``
+-- and an item ``2`` against the quota ``foo`` only, the ``KEYS`` and
+-- ``ARGV`` values would be as follows:
+--
+--   KEYS = {"foo", "subtract_from_foo", "bar", "subtract_from_bar", "foo", "subtract_from_foo"}
+--   ARGV = {10, 100, 1, 20, 100, 1, 10, 100, 2}
+--
+-- Items are checked in order, and every item is accepted or rejected
+-- atomically exactly like it is by ``is_rate_limited.lua``, so an accepted
+-- item counts against the quotas of all items after it. The result is the
+-- flattened list of rejections for every pair.
+assert(#KEYS * 3 == #ARGV * 2, "incorrect number of keys and arguments provided")
+assert(#KEYS % 2 == 0, "there must be an even number of keys")
+
+local results = {}
+local first = 1
+while first <= #KEYS do
+    local item = ARGV[(first - 1) / 2 * 3 + 3]
+    local last = first
+    while last + 2 <= #KEYS and ARGV[(last + 1) / 2 * 3 + 3] == item do
+        last = last + 2
+    end
+
+    local failed = false
+    for i=first, last, 2 do
+        local limit = tonumber(ARGV[(i - 1) / 2 * 3 + 1])
+        local rejected = false
+        -- limit=-1 means "no limit"
+        if limit >= 0 then
+            rejected = (redis.call('GET', KEYS[i]) or 0) - (redis.call('GET', KEYS[i + 1]) or 0) + 1 > limit
+        end
+
+        if rejected then
+            failed = true
+        end
+        results[(i + 1) / 2] = rejected
+    end
+
+    if not failed then
+        for i=first, last, 2 do
+            redis.call('INCR', KEYS[i])
+            redis.call('EXPIREAT', KEYS[i], ARGV[(i - 1) / 2 * 3 + 2])
+        end
+    end
+
+    first = last + 2
+end
+
+return results
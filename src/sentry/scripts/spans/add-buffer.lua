@@ -59,4 +59,4 @@ if has_root_span then
     redis.call("setex", has_root_span_key, set_timeout, "1")
 end
 
-return {redirect_depth, span_key, set_key, has_root_span}
+return {redirect_depth, span_key, set_key, has_root_span, redis.call("scard", set_key)}
@@ -1,5 +1,6 @@
 import logging
 import random
+import sys
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping, MutableMapping, MutableSequence
 from dataclasses import dataclass
@@ -114,6 +115,11 @@ class IndexerBatch:
         self.filtered_msg_meta: set[BrokerMeta] = set()
         self.parsed_payloads_by_meta: MutableMapping[BrokerMeta, ParsedMessage] = {}
 
+        # Decided once per batch, as it determines how values are held until reconstruction
+        self._serialize_with_orjson = in_random_rollout(
+            "sentry-metrics.indexer.reconstruct.enable-orjson"
+        )
+
         self._extract_messages()
 
     @metrics.wraps("process_messages.extract_messages")
@@ -196,8 +202,34 @@ class IndexerBatch:
             len(parsed_payload["value"]) if isinstance(parsed_payload["value"], Iterable) else 1,
         )
 
+        self._compact_message(parsed_payload)
         return parsed_payload
 
+    def _compact_message(self, parsed_payload: ParsedMessage) -> None:
+        """
+        Shrinks a parsed message for the time it is held by the batch.
+
+        Names and tags are interned, so the many messages of a batch sharing them hold a single
+        copy. Values are only passed through to the output, so when it is serialized with orjson
+        they are kept pre-serialized and spliced into the output as-is, rather than as a list of
+        Python numbers that is dumped again later.
+        """
+        parsed_payload["name"] = sys.intern(parsed_payload["name"])
+
+        tags = parsed_payload.get("tags")
+        if tags:
+            parsed_payload["tags"] = {
+                sys.intern(k) if isinstance(k, str) else k: (
+                    sys.intern(v) if isinstance(v, str) else v
+                )
+                for k, v in tags.items()
+            }
+
+        if self._serialize_with_orjson and isinstance(parsed_payload["value"], list):
+            parsed_payload["value"] = orjson.Fragment(  # type: ignore[typeddict-item]
+                orjson.dumps(parsed_payload["value"])
+            )
+
     def _extract_namespace(self, headers: Headers) -> str | None:
         for string, endcoded in headers:
             if string == "namespace":
@@ -432,7 +464,7 @@ class IndexerBatch:
                 if self.__should_index_tag_values:
                     # Metrics don't support gauges (which use dicts), so assert value type
                     value = old_payload_value["value"]
-                    assert isinstance(value, (int, float, list))
+                    assert isinstance(value, (int, float, list, orjson.Fragment))
                     new_payload_v1: Metric = {
                         "tags": cast(dict[str, int], new_tags),
                         # XXX: relay actually sends this value unconditionally
@@ -444,7 +476,7 @@ class IndexerBatch:
                         "timestamp": old_payload_value["timestamp"],
                         "project_id": old_payload_value["project_id"],
                         "type": old_payload_value["type"],
-                        "value": value,
+                        "value": value,  # type: ignore[typeddict-item]  # may be an orjson.Fragment
                         "sentry_received_timestamp": sentry_received_timestamp,
                     }
 
@@ -480,7 +512,7 @@ class IndexerBatch:
                 with metrics.timer(
                     "metrics_consumer.reconstruct_messages.build_new_payload.json_step"
                 ):
-                    if in_random_rollout("sentry-metrics.indexer.reconstruct.enable-orjson"):
+                    if self._serialize_with_orjson:
                         serialized_msg = orjson.dumps(new_payload_value)
                     else:
                         serialized_msg = rapidjson.dumps(new_payload_value).encode()
@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import logging
 import random
-from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable, Mapping, MutableMapping, Sequence
 from datetime import datetime, timedelta
 
+from cachetools import LRUCache, TTLCache
 from django.conf import settings
 from django.core.cache import caches
 
 from sentry import options
 from sentry.sentry_metrics.indexer.base import (
     FetchType,
+    FetchTypeExt,
     OrgId,
     StringIndexer,
     UseCaseKeyCollection,
@@ -33,6 +38,8 @@ _INDEXER_CACHE_RESOLVE_CACHE_REPLENISHMENT_METRIC = (
 _INDEXER_CACHE_DOUBLE_WRITE_METRIC = "sentry_metrics.indexer.memcache.double-write"
 _INDEXER_CACHE_DOUBLE_READ_METRIC = "sentry_metrics.indexer.memcache.new-schema-read"
 _INDEXER_CACHE_STALE_KEYS_METRIC = "sentry_metrics.indexer.memcache.stale-keys"
+_INDEXER_LOCAL_CACHE_METRIC = "sentry_metrics.indexer.local_cache"
+_INDEXER_LOCAL_CACHE_RATE_LIMITED_METRIC = "sentry_metrics.indexer.local_cache.rate_limited"
 
 # only used to compare to the older version of the PGIndexer
 _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
@@ -40,10 +47,18 @@ _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
 
 NAMESPACED_WRITE_FEAT_FLAG = "sentry-metrics.indexer.write-new-cache-namespace"
 NAMESPACED_READ_FEAT_FLAG = "sentry-metrics.indexer.read-new-cache-namespace"
+LOCAL_CACHE_FEAT_FLAG = "sentry-metrics.indexer.local-cache.enabled"
 
 BULK_RECORD_CACHE_NAMESPACE = "br"
 RESOLVE_CACHE_NAMESPACE = "res"
 
+LOCAL_CACHE_SIZE = 100_000
+LOCAL_CACHE_TTL = 600
+# How often a string has to be looked up before it is kept in the local cache.
+LOCAL_CACHE_ADMISSION_THRESHOLD = 2
+RATE_LIMITED_CACHE_SIZE = 10_000
+RATE_LIMITED_CACHE_TTL = 10
+
 
 class StringIndexerCache:
     def __init__(self, cache_name: str, partition_key: str):
@@ -205,10 +220,120 @@ class StringIndexerCache:
             )
 
 
+class LocalStringIndexerCache:
+    """
+    A per-process tier in front of `StringIndexerCache` for the few thousand
+    tag keys and values which show up in almost every batch.
+
+    Keys are formatted like "use_case_id:org_id:string". An assigned id never
+    changes, entries only expire to bound how long memory is held. A string is
+    only admitted once it has been looked up `admission_threshold` times, so
+    that one-off strings cannot push out hot ones.
+
+    Strings which were dropped by the writes limiter are remembered for
+    `rate_limited_ttl` seconds, so that a burst of them does not go to memcache
+    and postgres only to be rejected again.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = LOCAL_CACHE_SIZE,
+        ttl: float = LOCAL_CACHE_TTL,
+        admission_threshold: int = LOCAL_CACHE_ADMISSION_THRESHOLD,
+        rate_limited_maxsize: int = RATE_LIMITED_CACHE_SIZE,
+        rate_limited_ttl: float = RATE_LIMITED_CACHE_TTL,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.admission_threshold = admission_threshold
+        self._lock = threading.Lock()
+        self._cache: TTLCache[str, int] = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._lookups: LRUCache[str, int] = LRUCache(maxsize=maxsize)
+        self._rate_limited: TTLCache[str, FetchTypeExt | None] = TTLCache(
+            maxsize=rate_limited_maxsize, ttl=rate_limited_ttl, timer=timer
+        )
+
+    def get_many(
+        self, keys: Iterable[str]
+    ) -> tuple[dict[str, int], dict[str, FetchTypeExt | None]]:
+        """
+        Return the cached ids and the keys which were recently rate limited,
+        along with their `FetchTypeExt`. Keys in neither are left out.
+        """
+        ids: dict[str, int] = {}
+        rate_limited: dict[str, FetchTypeExt | None] = {}
+        with self._lock:
+            for key in keys:
+                id = self._cache.get(key)
+                if id is not None:
+                    ids[key] = id
+                elif key in self._rate_limited:
+                    rate_limited[key] = self._rate_limited[key]
+                else:
+                    self._lookups[key] = self._lookups.get(key, 0) + 1
+
+        return ids, rate_limited
+
+    def set_many(self, key_values: Mapping[str, int]) -> None:
+        with self._lock:
+            for key, id in key_values.items():
+                if self._lookups.get(key, 0) >= self.admission_threshold:
+                    self._cache[key] = id
+                    self._lookups.pop(key, None)
+
+    def set_rate_limited(self, keys: Mapping[str, FetchTypeExt | None]) -> None:
+        with self._lock:
+            for key, fetch_type_ext in keys.items():
+                self._rate_limited[key] = fetch_type_ext
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._lookups.clear()
+            self._rate_limited.clear()
+
+
+def _count_by_use_case(keys: Iterable[str]) -> Counter[str]:
+    return Counter(key.split(":", 1)[0] for key in keys)
+
+
 class CachingIndexer(StringIndexer):
-    def __init__(self, cache: StringIndexerCache, indexer: StringIndexer) -> None:
+    def __init__(
+        self,
+        cache: StringIndexerCache,
+        indexer: StringIndexer,
+        local_cache: LocalStringIndexerCache | None = None,
+    ) -> None:
         self.cache = cache
         self.indexer = indexer
+        self.local_cache = local_cache if local_cache is not None else LocalStringIndexerCache()
+
+    def _get_many_local(
+        self, cache_key_strs: Sequence[str]
+    ) -> tuple[dict[str, int], dict[str, FetchTypeExt | None]]:
+        local_hits, rate_limited = self.local_cache.get_many(cache_key_strs)
+
+        hits_by_use_case = _count_by_use_case(local_hits)
+        rate_limited_by_use_case = _count_by_use_case(rate_limited)
+        for use_case, total in _count_by_use_case(cache_key_strs).items():
+            hits = hits_by_use_case[use_case]
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_METRIC,
+                tags={"cache_hit": "true", "use_case": use_case},
+                amount=hits,
+            )
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_METRIC,
+                tags={"cache_hit": "false", "use_case": use_case},
+                amount=total - hits,
+            )
+            if rate_limited_by_use_case[use_case]:
+                metrics.incr(
+                    _INDEXER_LOCAL_CACHE_RATE_LIMITED_METRIC,
+                    tags={"use_case": use_case},
+                    amount=rate_limited_by_use_case[use_case],
+                )
+
+        return local_hits, rate_limited
 
     def bulk_record(
         self, strings: Mapping[UseCaseID, Mapping[OrgId, set[str]]]
@@ -216,7 +341,22 @@ class CachingIndexer(StringIndexer):
         cache_keys = UseCaseKeyCollection(strings)
         metrics.gauge("sentry_metrics.indexer.lookups_per_batch", value=cache_keys.size)
         cache_key_strs = cache_keys.as_strings()
-        cache_results = self.cache.get_many(BULK_RECORD_CACHE_NAMESPACE, cache_key_strs)
+
+        use_local_cache = options.get(LOCAL_CACHE_FEAT_FLAG)
+        local_hits: dict[str, int] = {}
+        rate_limited: dict[str, FetchTypeExt | None] = {}
+        if use_local_cache:
+            local_hits, rate_limited = self._get_many_local(cache_key_strs)
+            if local_hits or rate_limited:
+                cache_key_strs = [
+                    k for k in cache_key_strs if k not in local_hits and k not in rate_limited
+                ]
+
+        cache_results = (
+            self.cache.get_many(BULK_RECORD_CACHE_NAMESPACE, cache_key_strs)
+            if cache_key_strs
+            else {}
+        )
 
         hits = [k for k, v in cache_results.items() if v is not None]
 
@@ -239,14 +379,41 @@ class CachingIndexer(StringIndexer):
         )
 
         cache_key_results = UseCaseKeyResults()
+        cache_key_results.add_use_case_key_results(
+            [UseCaseKeyResult.from_string(k, v) for k, v in local_hits.items()],
+            FetchType.CACHE_HIT,
+        )
         cache_key_results.add_use_case_key_results(
             [UseCaseKeyResult.from_string(k, v) for k, v in cache_results.items() if v is not None],
             FetchType.CACHE_HIT,
         )
+        for k, fetch_type_ext in rate_limited.items():
+            use_case_id, org_id, string = k.split(":", 2)
+            cache_key_results.add_use_case_key_result(
+                UseCaseKeyResult(UseCaseID(use_case_id), int(org_id), string, None),
+                FetchType.RATE_LIMITED,
+                fetch_type_ext,
+            )
 
         db_record_keys = cache_key_results.get_unmapped_use_case_keys(cache_keys)
+        if rate_limited:
+            db_record_keys = UseCaseKeyCollection(
+                {
+                    use_case_id: {
+                        org_id: {
+                            s
+                            for s in org_strings
+                            if f"{use_case_id.value}:{org_id}:{s}" not in rate_limited
+                        }
+                        for org_id, org_strings in key_collection.mapping.items()
+                    }
+                    for use_case_id, key_collection in db_record_keys.mapping.items()
+                }
+            )
 
         if db_record_keys.size == 0:
+            if use_local_cache:
+                self.local_cache.set_many({k: v for k, v in cache_results.items() if v is not None})
             return cache_key_results
 
         db_record_key_results = self.indexer.bulk_record(
@@ -256,9 +423,25 @@ class CachingIndexer(StringIndexer):
             }
         )
 
-        self.cache.set_many(
-            BULK_RECORD_CACHE_NAMESPACE, db_record_key_results.get_mapped_strings_to_ints()
-        )
+        db_mapped_strings = db_record_key_results.get_mapped_strings_to_ints()
+        self.cache.set_many(BULK_RECORD_CACHE_NAMESPACE, db_mapped_strings)
+
+        if use_local_cache:
+            self.local_cache.set_many(
+                {
+                    **{k: v for k, v in cache_results.items() if v is not None},
+                    **db_mapped_strings,
+                }
+            )
+            self.local_cache.set_rate_limited(
+                {
+                    f"{use_case_id.value}:{org_id}:{string}": metadata.fetch_type_ext
+                    for use_case_id, org_metadata in db_record_key_results.get_fetch_metadata().items()
+                    for org_id, string_metadata in org_metadata.items()
+                    for string, metadata in string_metadata.items()
+                    if metadata.fetch_type is FetchType.RATE_LIMITED
+                }
+            )
 
         return cache_key_results.merge(db_record_key_results)
 
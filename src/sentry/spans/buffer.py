@@ -30,6 +30,11 @@ Segments are flushed out to `buffered-spans` topic under two conditions:
 * If the segment has a root span, it is flushed out after `span_buffer_root_timeout` seconds of inactivity.
 * Otherwise, it is flushed out after `span_buffer_timeout` seconds of inactivity.
 
+Independently of that, a segment that has grown to `max_segment_spans` spans is
+flushed out on the next flusher run, so that a single runaway trace cannot keep
+growing a set in Redis until it times out. Spans arriving for it afterwards
+start a new segment.
+
 Now how does that look like in Redis? For each incoming span, we:
 
 1. Try to figure out what the name of the respective span buffer is (`set_key` in `add-buffer.lua`)
@@ -141,17 +146,32 @@ class SpansBuffer:
         span_buffer_timeout_secs: int = 60,
         span_buffer_root_timeout_secs: int = 10,
         redis_ttl: int = 3600,
+        max_segment_spans: int = 1001,
     ):
         self.assigned_shards = list(assigned_shards)
         self.span_buffer_timeout_secs = span_buffer_timeout_secs
         self.span_buffer_root_timeout_secs = span_buffer_root_timeout_secs
         self.redis_ttl = redis_ttl
+        self.max_segment_spans = max_segment_spans
         self.add_buffer_sha: str | None = None
 
     @cached_property
     def client(self) -> RedisCluster[bytes] | StrictRedis[bytes]:
         return get_redis_client()
 
+    def for_shards(self, assigned_shards: list[int]) -> SpansBuffer:
+        """
+        Return a buffer with the same configuration that only flushes the
+        given subset of shards.
+        """
+        return SpansBuffer(
+            assigned_shards,
+            self.span_buffer_timeout_secs,
+            self.span_buffer_root_timeout_secs,
+            self.redis_ttl,
+            self.max_segment_spans,
+        )
+
     # make it pickleable
     def __reduce__(self):
         return (
@@ -161,6 +181,7 @@ class SpansBuffer:
                 self.span_buffer_timeout_secs,
                 self.span_buffer_root_timeout_secs,
                 self.redis_ttl,
+                self.max_segment_spans,
             ),
         )
 
@@ -174,6 +195,7 @@ class SpansBuffer:
         queue_keys = []
         is_root_span_count = 0
         has_root_span_count = 0
+        oversized_segment_count = 0
         min_redirect_depth = float("inf")
         max_redirect_depth = float("-inf")
 
@@ -221,9 +243,13 @@ class SpansBuffer:
 
             assert len(queue_keys) == len(results)
 
-            for queue_key, (redirect_depth, delete_item, add_item, has_root_span) in zip(
-                queue_keys, results
-            ):
+            for queue_key, (
+                redirect_depth,
+                delete_item,
+                add_item,
+                has_root_span,
+                segment_size,
+            ) in zip(queue_keys, results):
                 min_redirect_depth = min(min_redirect_depth, redirect_depth)
                 max_redirect_depth = max(max_redirect_depth, redirect_depth)
 
@@ -242,6 +268,12 @@ class SpansBuffer:
                 else:
                     offset = self.span_buffer_timeout_secs
 
+                # oversized segments are flushed out as soon as possible
+                # instead of waiting for them to time out.
+                if segment_size >= self.max_segment_spans:
+                    oversized_segment_count += 1
+                    offset = 0
+
                 zadd_items = queue_adds.setdefault(queue_key, {})
                 zadd_items[add_item] = now + offset
                 if delete_item != add_item:
@@ -262,6 +294,7 @@ class SpansBuffer:
         metrics.timing("spans.buffer.process_spans.num_spans", len(spans))
         metrics.timing("spans.buffer.process_spans.num_is_root_spans", is_root_span_count)
         metrics.timing("spans.buffer.process_spans.num_has_root_spans", has_root_span_count)
+        metrics.timing("spans.buffer.process_spans.num_oversized_segments", oversized_segment_count)
         metrics.gauge("spans.buffer.min_redirect_depth", min_redirect_depth)
         metrics.gauge("spans.buffer.max_redirect_depth", max_redirect_depth)
 
@@ -319,12 +352,14 @@ class SpansBuffer:
                         key, 0, cutoff, start=0 if max_segments else None, num=max_segments or None
                     )
                     p.zcard(key)
+                    p.zrange(key, 0, 0, withscores=True)
                     queue_keys.append(key)
 
                 result = iter(p.execute())
 
         segment_keys: list[tuple[QueueKey, SegmentKey]] = []
         queue_sizes = []
+        queue_lags = []
 
         with metrics.timer("spans.buffer.flush_segments.load_segment_data"):
             with self.client.pipeline(transaction=False) as p:
@@ -338,14 +373,23 @@ class SpansBuffer:
                     # ZCARD output
                     queue_sizes.append(next(result))
 
+                    # ZRANGE output: the segment that has been due the longest
+                    oldest = next(result)
+                    queue_lags.append(max(0, now - int(oldest[0][1])) if oldest else 0)
+
                 segments = p.execute()
 
-        for shard_i, queue_size in zip(self.assigned_shards, queue_sizes):
+        for shard_i, queue_size, queue_lag in zip(self.assigned_shards, queue_sizes, queue_lags):
             metrics.timing(
                 "spans.buffer.flush_segments.queue_size",
                 queue_size,
                 tags={"shard_i": shard_i},
             )
+            metrics.timing(
+                "spans.buffer.flush_segments.queue_lag",
+                queue_lag,
+                tags={"shard_i": shard_i},
+            )
 
         return_segments = {}
 
@@ -24,9 +24,15 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
     processed timestamps (from the producer timestamp of the incoming span
     message), which are then used as a clock to determine whether segments have expired.
 
+    The queue shards owned by this consumer are split across
+    `flusher_processes` processes, each of which only ever flushes its own
+    shards. Since the strategy is recreated on every rebalance, shard
+    ownership is recomputed whenever partitions are assigned.
+
     :param topic: The topic to send segments to.
     :param max_flush_segments: How many segments to flush at once in a single Redis call.
     :param produce_to_pipe: For unit-testing, produce to this multiprocessing Pipe instead of creating a kafka consumer.
+    :param flusher_processes: How many processes to split the assigned shards across.
     """
 
     def __init__(
@@ -35,6 +41,7 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
         max_flush_segments: int,
         produce_to_pipe: Callable[[KafkaPayload], None] | None,
         next_step: ProcessingStrategy[FilteredPayload | int],
+        flusher_processes: int = 1,
     ):
         self.buffer = buffer
         self.max_flush_segments = max_flush_segments
@@ -53,20 +60,25 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
             initializer = None
             make_process = threading.Thread
 
-        self.process = make_process(
-            target=SpanFlusher.main,
-            args=(
-                initializer,
-                self.stopped,
-                self.current_drift,
-                self.buffer,
-                self.max_flush_segments,
-                produce_to_pipe,
-            ),
-            daemon=True,
-        )
-
-        self.process.start()
+        self.processes: list[multiprocessing.Process | threading.Thread] = []
+        for process_index, shards in enumerate(
+            get_shard_assignment(self.buffer.assigned_shards, flusher_processes)
+        ):
+            process = make_process(
+                target=SpanFlusher.main,
+                args=(
+                    initializer,
+                    self.stopped,
+                    self.current_drift,
+                    self.buffer.for_shards(shards),
+                    self.max_flush_segments,
+                    produce_to_pipe,
+                    process_index,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self.processes.append(process)
 
     @staticmethod
     def main(
@@ -76,6 +88,7 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
         buffer: SpansBuffer,
         max_flush_segments: int,
         produce_to_pipe: Callable[[KafkaPayload], None] | None,
+        process_index: int = 0,
     ) -> None:
         try:
             if initializer:
@@ -98,8 +111,11 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
                 def produce(payload: KafkaPayload) -> None:
                     producer_futures.append(producer.produce(topic, payload))
 
+            metric_tags = {"process": str(process_index)}
+
             while not stopped.value:
-                now = int(time.time()) + current_drift.value
+                flush_start = time.time()
+                now = int(flush_start) + current_drift.value
                 flushed_segments = buffer.flush_segments(max_segments=max_flush_segments, now=now)
 
                 if not flushed_segments:
@@ -130,6 +146,12 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
 
                 buffer.done_flush_segments(flushed_segments)
 
+                metrics.timing(
+                    "sentry.spans.buffer.flusher.flush_latency",
+                    time.time() - flush_start,
+                    tags=metric_tags,
+                )
+
             if producer is not None:
                 producer.close()
         except KeyboardInterrupt:
@@ -159,8 +181,19 @@ class SpanFlusher(ProcessingStrategy[FilteredPayload | int]):
 
         self.next_step.join(timeout)
 
-        while self.process.is_alive() and (deadline is None or deadline > time.time()):
-            time.sleep(0.1)
+        for process in self.processes:
+            while process.is_alive() and (deadline is None or deadline > time.time()):
+                time.sleep(0.1)
 
-        if isinstance(self.process, multiprocessing.Process):
-            self.process.terminate()
+            if isinstance(process, multiprocessing.Process):
+                process.terminate()
+
+
+def get_shard_assignment(shards: list[int], num_processes: int) -> list[list[int]]:
+    """
+    Split `shards` into at most `num_processes` disjoint, non-empty groups.
+    There is always at least one group so that a flusher runs even without
+    any assigned shards.
+    """
+    num_processes = max(1, min(num_processes, len(shards)))
+    return [shards[i::num_processes] for i in range(num_processes)]
@@ -1,21 +1,30 @@
 import logging
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from django.db import connections
+
+from sentry import options
 from sentry.digests import get_option_key
-from sentry.digests.backends.base import InvalidState
-from sentry.digests.notifications import build_digest, split_key
+from sentry.digests.backends.base import InvalidState, ScheduleEntry
+from sentry.digests.notifications import DigestInfo, build_digest, build_digests, split_key
 from sentry.digests.types import Record
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
+from sentry.notifications.types import ActionTargetType, FallthroughChoiceType
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
 from sentry.taskworker.config import TaskworkerConfig
 from sentry.taskworker.namespaces import digests_tasks
-from sentry.utils import snuba
+from sentry.utils import metrics, snuba
+from sentry.utils.iterators import chunked
 
 logger = logging.getLogger(__name__)
 
+DigestTarget = tuple[Project, ActionTargetType, str | None, FallthroughChoiceType | None]
+
 
 @instrumented_task(
     name="sentry.tasks.digests.schedule_digests",
@@ -39,8 +48,27 @@ def schedule_digests() -> None:
     timeout = 300
     digests.backend.maintenance(deadline - timeout)
 
+    batch_size = options.get("digests.delivery.batch-size")
+    entries_by_project: dict[str, list[ScheduleEntry]] = defaultdict(list)
     for entry in digests.backend.schedule(deadline):
-        deliver_digest.delay(entry.key, entry.timestamp)
+        metrics.timing("digests.schedule.lag", deadline - entry.timestamp)
+        if batch_size > 1:
+            entries_by_project[_get_project_id(entry.key)].append(entry)
+        else:
+            deliver_digest.delay(entry.key, entry.timestamp)
+
+    # Digests of the same project are delivered together, so that their
+    # groups and rules are looked up once.
+    for entries in entries_by_project.values():
+        for batch in chunked(entries, batch_size):
+            deliver_digests.delay(
+                [entry.key for entry in batch], min(entry.timestamp for entry in batch)
+            )
+
+
+def _get_project_id(key: str) -> str:
+    # See `split_key`, keys start with `mail:p:<project_id>`.
+    return key.split(":", 3)[2]
 
 
 @instrumented_task(
@@ -58,7 +86,6 @@ def deliver_digest(
     notification_uuid: str | None = None,
 ) -> None:
     from sentry import digests
-    from sentry.mail import mail_adapter
 
     try:
         project, target_type, target_identifier, fallthrough_choice = split_key(key)
@@ -82,27 +109,128 @@ def deliver_digest(
             logger.info("Skipped digest delivery: %s", error, exc_info=True)
             return
 
-        if digest.digest:
-            mail_adapter.notify_digest(
-                project,
-                digest,
-                target_type,
-                target_identifier,
-                fallthrough_choice=fallthrough_choice,
-                notification_uuid=notification_uuid,
-            )
-        else:
-            logger.info(
-                "Skipped digest delivery due to empty digest",
-                extra={
-                    "project": project.id,
-                    "target_type": target_type.value,
-                    "target_identifier": target_identifier,
-                    "fallthrough_choice": fallthrough_choice.value if fallthrough_choice else None,
-                },
+        _notify_digest(
+            (project, target_type, target_identifier, fallthrough_choice),
+            digest,
+            notification_uuid,
+        )
+
+
+@instrumented_task(
+    name="sentry.tasks.digests.deliver_digests",
+    queue="digests.delivery",
+    silo_mode=SiloMode.REGION,
+    taskworker_config=TaskworkerConfig(
+        namespace=digests_tasks,
+        processing_deadline_duration=120,
+    ),
+)
+def deliver_digests(keys: list[str], schedule_timestamp: float | None = None) -> None:
+    """
+    Delivers the digests of several timelines of the same project, which are
+    opened together and built with shared group and rule lookups. The
+    notifications are then sent by up to `digests.delivery.concurrency`
+    threads.
+    """
+    from sentry import digests
+
+    if schedule_timestamp is not None:
+        metrics.timing("digests.delivery.lag", time.time() - schedule_timestamp)
+
+    targets: dict[str, DigestTarget] = {}
+    for key in keys:
+        try:
+            targets[key] = split_key(key)
+        except Project.DoesNotExist as error:
+            logger.info("Cannot deliver digest %s due to error: %s", key, error)
+            digests.backend.delete(key)
+
+    keys_by_project: dict[int, list[str]] = defaultdict(list)
+    for key, (project, _, _, _) in targets.items():
+        keys_by_project[project.id].append(key)
+
+    for project_keys in keys_by_project.values():
+        project = targets[project_keys[0]][0]
+        minimum_delay = ProjectOption.objects.get_value(
+            project, get_option_key("mail", "minimum_delay")
+        )
+
+        with snuba.options_override({"consistent": True}):
+            with digests.backend.digest_many(
+                project_keys, minimum_delay=minimum_delay
+            ) as records_by_key:
+                digest_infos = build_digests(project, records_by_key)
+                notification_uuids = {
+                    key: get_notification_uuid_from_records(records)
+                    for key, records in records_by_key.items()
+                }
+
+            metrics.incr("digests.delivery.skipped", amount=len(project_keys) - len(digest_infos))
+            _notify_digests(
+                {
+                    key: (targets[key], digest_infos[key], notification_uuids[key])
+                    for key in digest_infos
+                }
             )
 
 
+def _notify_digest(
+    target: DigestTarget,
+    digest: DigestInfo,
+    notification_uuid: str | None,
+) -> None:
+    from sentry.mail import mail_adapter
+
+    project, target_type, target_identifier, fallthrough_choice = target
+    if digest.digest:
+        mail_adapter.notify_digest(
+            project,
+            digest,
+            target_type,
+            target_identifier,
+            fallthrough_choice=fallthrough_choice,
+            notification_uuid=notification_uuid,
+        )
+    else:
+        logger.info(
+            "Skipped digest delivery due to empty digest",
+            extra={
+                "project": project.id,
+                "target_type": target_type.value,
+                "target_identifier": target_identifier,
+                "fallthrough_choice": fallthrough_choice.value if fallthrough_choice else None,
+            },
+        )
+
+
+def _notify_digests(
+    notifications: dict[str, tuple[DigestTarget, DigestInfo, str | None]],
+) -> None:
+    def notify(key: str) -> None:
+        # The digests have already been closed, so a failure only loses the
+        # digest it happened for, like it would for `deliver_digest`.
+        try:
+            _notify_digest(*notifications[key])
+        except Exception:
+            logger.exception("Failed to deliver digest", extra={"key": key})
+
+    max_workers = min(options.get("digests.delivery.concurrency"), len(notifications))
+    if max_workers <= 1:
+        for key in notifications:
+            notify(key)
+        return
+
+    def notify_in_thread(key: str) -> None:
+        try:
+            notify(key)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="digests") as executor:
+        for _ in executor.map(notify_in_thread, notifications):
+            pass
+
+
 def get_notification_uuid_from_records(records: list[Record]) -> str | None:
     for record in records:
         try:
@@ -172,6 +172,48 @@ class TaskworkerClient:
             return response.task
         return None
 
+    def get_tasks(self, namespace: str | None = None, max_tasks: int = 1) -> list[TaskActivation]:
+        """
+        Fetch up to `max_tasks` pending tasks.
+
+        The broker hands out a single task per GetTask call, so the calls are
+        issued concurrently and their responses gathered afterwards. This costs
+        a single round-trip instead of one per task. Errors are only raised if
+        no task could be fetched at all.
+        """
+        request = GetTaskRequest(namespace=namespace)
+        tasks: list[TaskActivation] = []
+        error: grpc.RpcError | None = None
+        with metrics.timer("taskworker.get_tasks.rpc"):
+            calls = []
+            for _ in range(max_tasks):
+                host, stub = self._get_cur_stub()
+                calls.append((host, stub.GetTask.future(request)))
+
+            for host, call in calls:
+                try:
+                    response = call.result()
+                except grpc.RpcError as err:
+                    metrics.incr(
+                        "taskworker.client.rpc_error",
+                        tags={"method": "GetTask", "status": err.code().name},
+                    )
+                    if err.code() != grpc.StatusCode.NOT_FOUND and error is None:
+                        error = err
+                    continue
+
+                if response.HasField("task"):
+                    metrics.incr(
+                        "taskworker.client.get_task",
+                        tags={"namespace": response.task.namespace},
+                    )
+                    self._task_id_to_host[response.task.id] = host
+                    tasks.append(response.task)
+
+        if error is not None and not tasks:
+            raise error
+        return tasks
+
     def update_task(
         self,
         task_id: str,
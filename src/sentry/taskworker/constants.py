@@ -21,3 +21,9 @@ DEFAULT_CHILD_TASK_COUNT = 10000
 The number of tasks a worker child process will process
 before being restarted.
 """
+
+DEFAULT_FETCH_BATCH_SIZE = 1
+"""
+The maximum number of tasks a worker fetches from the
+brokers at once to keep its child processes busy.
+"""
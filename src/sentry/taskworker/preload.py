@@ -0,0 +1,20 @@
+"""
+Preloaded by the fork server of taskworkers using the `forkserver` process
+type. Children are forked from the fork server, so configuring Sentry and
+importing the task modules here saves every child from doing it itself.
+
+The fork server only tolerates `ImportError` from preloaded modules, any
+other error would kill it and no child could start. Errors are logged
+instead, and children then configure themselves.
+"""
+
+import logging
+
+from sentry.taskworker.workerchild import child_worker_init
+
+logger = logging.getLogger("sentry.taskworker.worker")
+
+try:
+    child_worker_init("forkserver")
+except Exception:
+    logger.exception("taskworker.forkserver.preload_failed")
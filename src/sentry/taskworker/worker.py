@@ -7,7 +7,7 @@ import queue
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from multiprocessing.context import ForkContext, SpawnContext
+from multiprocessing.context import ForkContext, ForkServerContext, SpawnContext
 from multiprocessing.process import BaseProcess
 from typing import Any
 
@@ -16,7 +16,11 @@ from django.conf import settings
 from sentry_protos.taskbroker.v1.taskbroker_pb2 import FetchNextTask, TaskActivation
 
 from sentry.taskworker.client import TaskworkerClient
-from sentry.taskworker.constants import DEFAULT_REBALANCE_AFTER, DEFAULT_WORKER_QUEUE_SIZE
+from sentry.taskworker.constants import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    DEFAULT_REBALANCE_AFTER,
+    DEFAULT_WORKER_QUEUE_SIZE,
+)
 from sentry.taskworker.workerchild import ProcessingResult, child_process
 from sentry.utils import metrics
 
@@ -34,7 +38,7 @@ class TaskWorker:
     Taskworkers can be run with `sentry run taskworker`
     """
 
-    mp_context: ForkContext | SpawnContext
+    mp_context: ForkContext | SpawnContext | ForkServerContext
 
     def __init__(
         self,
@@ -48,17 +52,25 @@ class TaskWorker:
         rebalance_after: int = DEFAULT_REBALANCE_AFTER,
         processing_pool_name: str | None = None,
         process_type: str = "spawn",
+        fetch_batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
         **options: dict[str, Any],
     ) -> None:
         self.options = options
         self._max_child_task_count = max_child_task_count
         self._namespace = namespace
         self._concurrency = concurrency
+        self._fetch_batch_size = fetch_batch_size
+        self._child_tasks_queue_maxsize = child_tasks_queue_maxsize
         self.client = TaskworkerClient(rpc_host, num_brokers, rebalance_after)
         if process_type == "fork":
             self.mp_context = multiprocessing.get_context("fork")
         elif process_type == "spawn":
             self.mp_context = multiprocessing.get_context("spawn")
+        elif process_type == "forkserver":
+            self.mp_context = multiprocessing.get_context("forkserver")
+            # The fork server configures Sentry and imports the task modules
+            # once, children are forked from it warm instead of starting cold.
+            self.mp_context.set_forkserver_preload(["sentry.taskworker.preload"])
         else:
             raise ValueError(f"Invalid process type: {process_type}")
         self._process_type = process_type
@@ -144,25 +156,49 @@ class TaskWorker:
         if self._child_tasks.full():
             return False
 
+        if self._fetch_batch_size > 1:
+            tasks = self.fetch_tasks(self._get_prefetch_count())
+            for task in tasks:
+                self._put_child_task(task)
+            return bool(tasks)
+
         task = self.fetch_task()
         if task:
-            try:
-                start_time = time.monotonic()
-                self._child_tasks.put(task)
-                metrics.distribution(
-                    "taskworker.worker.child_task.put.duration",
-                    time.monotonic() - start_time,
-                    tags={"processing_pool": self._processing_pool_name},
-                )
-            except queue.Full:
-                logger.warning(
-                    "taskworker.add_task.child_task_queue_full",
-                    extra={"task_id": task.id, "processing_pool": self._processing_pool_name},
-                )
+            self._put_child_task(task)
             return True
         else:
             return False
 
+    def _get_prefetch_count(self) -> int:
+        """
+        The number of tasks to fetch so that every child process has one
+        buffered, but no more than `fetch_batch_size` at once. Tasks that
+        don't fit in the child tasks queue would wait in the parent while
+        their processing deadline runs, so the queue size caps it too.
+        """
+        try:
+            buffered = self._child_tasks.qsize()
+        except NotImplementedError:
+            # qsize() is not available on macOS.
+            buffered = 0
+        limit = min(self._fetch_batch_size, self._concurrency, self._child_tasks_queue_maxsize)
+        return max(1, limit - buffered)
+
+    def _put_child_task(self, task: TaskActivation) -> None:
+        try:
+            start_time = time.monotonic()
+            self._child_tasks.put(task)
+            metrics.distribution(
+                "taskworker.worker.child_task.put.duration",
+                time.monotonic() - start_time,
+                tags={"processing_pool": self._processing_pool_name},
+            )
+        except queue.Full:
+            logger.warning(
+                "taskworker.add_task.child_task_queue_full",
+                extra={"task_id": task.id, "processing_pool": self._processing_pool_name},
+            )
+
     def start_result_thread(self) -> None:
         """
         Start a thread that delivers results and fetches new tasks.
@@ -264,6 +300,17 @@ class TaskWorker:
             )
             return None
 
+    def _get_child_max_task_count(self, index: int, count: int) -> int | None:
+        """
+        Children spawned together get task limits spread over the upper half
+        of `max_child_task_count`, so that they are recycled one at a time
+        rather than all at once. Replacements for recycled children get the
+        full limit, which keeps the pool staggered.
+        """
+        if not self._max_child_task_count or count <= 1:
+            return self._max_child_task_count
+        return self._max_child_task_count - (self._max_child_task_count * index) // (2 * count)
+
     def start_spawn_children_thread(self) -> None:
         def spawn_children_thread() -> None:
             logger.debug("taskworker.worker.spawn_children_thread_started")
@@ -272,14 +319,15 @@ class TaskWorker:
                 if len(self._children) >= self._concurrency:
                     time.sleep(0.1)
                     continue
-                for i in range(self._concurrency - len(self._children)):
+                spawn_count = self._concurrency - len(self._children)
+                for i in range(spawn_count):
                     process = self.mp_context.Process(
                         target=child_process,
                         args=(
                             self._child_tasks,
                             self._processed_tasks,
                             self._shutdown_event,
-                            self._max_child_task_count,
+                            self._get_child_max_task_count(i, spawn_count),
                             self._processing_pool_name,
                             self._process_type,
                         ),
@@ -294,33 +342,77 @@ class TaskWorker:
         self._spawn_children_thread = threading.Thread(target=spawn_children_thread)
         self._spawn_children_thread.start()
 
-    def fetch_task(self) -> TaskActivation | None:
+    def _wait_for_fetch_backoff(self) -> None:
+        if not self._gettask_backoff_seconds:
+            return
+
         # Use the shutdown_event as a sleep mechanism
+        start_time = time.monotonic()
         self._shutdown_event.wait(self._gettask_backoff_seconds)
+        metrics.distribution(
+            "taskworker.worker.fetch_task.idle_duration",
+            time.monotonic() - start_time,
+            tags={"processing_pool": self._processing_pool_name},
+        )
+
+    def _on_fetch_failed(self, error: grpc.RpcError) -> None:
+        logger.info(
+            "taskworker.fetch_task.failed",
+            extra={"error": error, "processing_pool": self._processing_pool_name},
+        )
+
+        self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+
+    def _on_fetch_not_found(self) -> None:
+        metrics.incr(
+            "taskworker.worker.fetch_task.not_found",
+            tags={"processing_pool": self._processing_pool_name},
+        )
+        logger.debug(
+            "taskworker.fetch_task.not_found",
+            extra={"processing_pool": self._processing_pool_name},
+        )
+
+        self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+
+    def fetch_task(self) -> TaskActivation | None:
+        self._wait_for_fetch_backoff()
         try:
             activation = self.client.get_task(self._namespace)
         except grpc.RpcError as e:
-            logger.info(
-                "taskworker.fetch_task.failed",
-                extra={"error": e, "processing_pool": self._processing_pool_name},
-            )
-
-            self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+            self._on_fetch_failed(e)
             return None
 
         if not activation:
-            metrics.incr(
-                "taskworker.worker.fetch_task.not_found",
-                tags={"processing_pool": self._processing_pool_name},
-            )
-            logger.debug(
-                "taskworker.fetch_task.not_found",
-                extra={"processing_pool": self._processing_pool_name},
-            )
-
-            self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+            self._on_fetch_not_found()
             return None
 
         self._gettask_backoff_seconds = 0
         self._task_receive_timing[activation.id] = time.monotonic()
         return activation
+
+    def fetch_tasks(self, max_tasks: int) -> list[TaskActivation]:
+        """
+        Fetch up to `max_tasks` tasks in a single round-trip to the brokers.
+        """
+        self._wait_for_fetch_backoff()
+        try:
+            activations = self.client.get_tasks(self._namespace, max_tasks)
+        except grpc.RpcError as e:
+            self._on_fetch_failed(e)
+            return []
+
+        if not activations:
+            self._on_fetch_not_found()
+            return []
+
+        metrics.distribution(
+            "taskworker.worker.fetch_tasks.count",
+            len(activations),
+            tags={"processing_pool": self._processing_pool_name},
+        )
+        self._gettask_backoff_seconds = 0
+        received = time.monotonic()
+        for activation in activations:
+            self._task_receive_timing[activation.id] = received
+        return activations
@@ -46,12 +46,15 @@ def child_worker_init(process_type: str) -> None:
     Configure django and load task modules for workers
     Child worker processes are spawned and don't inherit db
     connections or configuration from the parent process.
+
+    Children of a fork server inherit both from it (see
+    `sentry.taskworker.preload`), which makes this a no-op for them.
     """
     from django.conf import settings
 
     from sentry.runner import configure
 
-    if process_type == "spawn":
+    if process_type in ("spawn", "forkserver"):
         configure()
 
     for module in settings.TASKWORKER_IMPORTS:
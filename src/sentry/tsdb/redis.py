@@ -197,12 +197,7 @@ class RedisTSDB(BaseTSDB):
 
         Returns a 2-tuple that contains the hash key and the hash field.
         """
-        model_key = self.get_model_key(key)
-
-        if isinstance(model_key, int):
-            vnode = model_key % self.vnodes
-        else:
-            vnode = _crc32(force_bytes(model_key)) % self.vnodes
+        vnode, hash_field = self.get_counter_vnode_and_field(key, environment_id)
 
         return (
             "{prefix}{model}:{epoch}:{vnode}".format(
@@ -211,9 +206,25 @@ class RedisTSDB(BaseTSDB):
                 epoch=self.normalize_to_rollup(timestamp, rollup),
                 vnode=vnode,
             ),
-            self.add_environment_parameter(model_key, environment_id),
+            hash_field,
         )
 
+    def get_counter_vnode_and_field(
+        self, key: int | str | bytes, environment_id: int | None
+    ) -> tuple[int, str | int]:
+        """
+        Return the vnode and the hash field a counter key is stored under.
+        Both are independent of the rollup and timestamp.
+        """
+        model_key = self.get_model_key(key)
+
+        if isinstance(model_key, int):
+            vnode = model_key % self.vnodes
+        else:
+            vnode = _crc32(force_bytes(model_key)) % self.vnodes
+
+        return vnode, self.add_environment_parameter(model_key, environment_id)
+
     def get_model_key(self, key: int | str | bytes) -> int | str:
         # We specialize integers so that a pure int-map can be optimized by
         # Redis, whereas long strings (say tag values) will store in a more
@@ -340,27 +351,36 @@ class RedisTSDB(BaseTSDB):
         self.validate_arguments([model], [environment_id])
 
         rollup, series = self.get_optimal_rollup_series(start, end, rollup)
-        _series = [to_datetime(item) for item in series]
+        epochs = [self.normalize_to_rollup(timestamp, rollup) for timestamp in series]
+
+        # Counters of keys on the same vnode share one hash per rollup epoch,
+        # so rather than issuing one HGET per key and timestamp, collect the
+        # fields of every hash and read each hash with a single HMGET. The
+        # position of every field in the output is recorded alongside it.
+        output: dict[TSDBKey, list[tuple[int, int]]] = {}
+        fields_by_hash_key: dict[str, list[tuple[TSDBKey, int, str | int]]] = defaultdict(list)
+        for key in keys:
+            if key in output:
+                continue
+
+            output[key] = [(timestamp, 0) for timestamp in series]
+            vnode, hash_field = self.get_counter_vnode_and_field(key, environment_id)
+            for index, epoch in enumerate(epochs):
+                hash_key = f"{self.prefix}{model.value}:{epoch}:{vnode}"
+                fields_by_hash_key[hash_key].append((key, index, hash_field))
 
-        results = []
         cluster, _ = self.get_cluster(environment_id)
         with cluster.map() as client:
-            for key in keys:
-                for timestamp in _series:
-                    hash_key, hash_field = self.make_counter_key(
-                        model, rollup, timestamp, key, environment_id
-                    )
-                    results.append(
-                        (int(timestamp.timestamp()), key, client.hget(hash_key, hash_field))
-                    )
+            promises = [
+                (fields, client.hmget(hash_key, [hash_field for _, _, hash_field in fields]))
+                for hash_key, fields in fields_by_hash_key.items()
+            ]
 
-        results_by_key: dict[TSDBKey, dict[int, int]] = defaultdict(dict)
-        for epoch, key, count in results:
-            results_by_key[key][epoch] = int(count.value or 0)
+        for fields, promise in promises:
+            for (key, index, _), count in zip(fields, promise.value):
+                if count:
+                    output[key][index] = (series[index], int(count))
 
-        output = {}
-        for key, points in results_by_key.items():
-            output[key] = sorted(points.items())
         return output
 
     def merge(
@@ -6,6 +6,7 @@ import re
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Any, ClassVar, TypedDict
 from urllib.parse import parse_qs, urlparse
 
@@ -215,6 +216,12 @@ def fingerprint_spans(spans: list[Span], unique_only: bool = False):
     return hashlib.sha1(joined_hashes.encode("utf8")).hexdigest()
 
 
+# The number of distinct inputs whose fingerprint or parameterized URL is kept around per process.
+# Spans repeat heavily across transactions (the same queries, the same endpoints) and several
+# detectors compute these for the same span.
+SPAN_FEATURE_CACHE_SIZE = 10_000
+
+
 # Creates a stable fingerprint given the same span details using sha1.
 def fingerprint_span(span: Span):
     op = span.get("op", None)
@@ -222,7 +229,12 @@ def fingerprint_span(span: Span):
     if not description or not op:
         return None
 
-    signature = (str(op) + str(description)).encode("utf-8")
+    return _fingerprint_span_signature(str(op), str(description))
+
+
+@lru_cache(maxsize=SPAN_FEATURE_CACHE_SIZE)
+def _fingerprint_span_signature(op: str, description: str) -> str:
+    signature = (op + description).encode("utf-8")
     full_fingerprint = hashlib.sha1(signature).hexdigest()
     fingerprint = full_fingerprint[
         :20
@@ -294,7 +306,12 @@ ASSET_HASH_REGEX = re.compile(r"[a-f0-9]{16,64}", re.I)
 
 # Creates a stable fingerprint for resource spans from their description (url), removing common cache busting tokens.
 def fingerprint_resource_span(span: Span):
-    url = urlparse(span.get("description") or "")
+    return _fingerprint_resource_url(span.get("description") or "")
+
+
+@lru_cache(maxsize=SPAN_FEATURE_CACHE_SIZE)
+def _fingerprint_resource_url(description: str) -> str:
+    url = urlparse(description)
     path = url.path
     path = UUID_REGEX.sub("*", path)
     path = CHUNK_HASH_REGEX.sub(".*.chunk", path)
@@ -357,6 +374,7 @@ def parameterize_url_with_result(url: str) -> ParameterizedUrl:
     )
 
 
+@lru_cache(maxsize=SPAN_FEATURE_CACHE_SIZE)
 def parameterize_url(url: str) -> str:
     return parameterize_url_with_result(url).get("url", "")
 
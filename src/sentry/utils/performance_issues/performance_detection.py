@@ -365,11 +365,8 @@ def _detect_performance_problems(
             if detector_class.is_detection_allowed_for_system()
         ]
 
-    for detector in detectors:
-        with sentry_sdk.start_span(
-            op="function", name=f"run_detector_on_data.{detector.type.value}"
-        ):
-            run_detector_on_data(detector, data)
+    with sentry_sdk.start_span(op="function", name="run_detectors_on_data"):
+        run_detectors_on_data(detectors, data)
 
     with sentry_sdk.start_span(op="function", name="report_metrics_for_detectors"):
         # Metrics reporting only for detection, not created issues.
@@ -427,6 +424,25 @@ def run_detector_on_data(detector: PerformanceDetector, data: dict[str, Any]) ->
     detector.on_complete()
 
 
+def run_detectors_on_data(detectors: Sequence[PerformanceDetector], data: dict[str, Any]) -> None:
+    """
+    Runs all `detectors` on the event in a single walk over its spans, rather than one walk per
+    detector. Every detector still sees all spans in order, followed by `on_complete`.
+    """
+    eligible_detectors = [detector for detector in detectors if detector.is_event_eligible(data)]
+    if not eligible_detectors:
+        return
+
+    visitors = [detector.visit_span for detector in eligible_detectors]
+    spans = data.get("spans", [])
+    for span in spans:
+        for visit_span in visitors:
+            visit_span(span)
+
+    for detector in eligible_detectors:
+        detector.on_complete()
+
+
 def build_tree(spans: Sequence[dict[str, Any]]) -> tuple[dict[str, Any], str | None]:
     span_tree: dict[str, tuple[dict[str, Any], list[dict[str, Any]]]] = {}
     segment_id = None
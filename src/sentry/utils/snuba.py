@@ -6,10 +6,11 @@ import logging
 import math
 import os
 import re
+import threading
 import time
 from collections import namedtuple
 from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -26,6 +27,7 @@ from django.core.cache import cache
 from snuba_sdk import DeleteQuery, MetricsQuery, Request
 from snuba_sdk.legacy import json_to_snql
 
+from sentry import options
 from sentry.models.environment import Environment
 from sentry.models.group import Group
 from sentry.models.grouprelease import GroupRelease
@@ -554,6 +556,30 @@ _snuba_pool = connection_from_url(
     maxsize=10,
 )
 _query_thread_pool = ThreadPoolExecutor(max_workers=10)
+_referrer_query_thread_pools: dict[str, tuple[int, ThreadPoolExecutor]] = {}
+_referrer_query_thread_pools_lock = threading.Lock()
+
+
+def _get_query_thread_pool(referrer: str | None) -> ThreadPoolExecutor:
+    """
+    Returns the thread pool to run queries for the given referrer on.
+
+    Referrers listed in `snuba.query-thread-pool-sizes` get a pool of the
+    configured size to themselves, so they can neither starve nor be starved
+    by other referrers. All other referrers share one pool.
+    """
+    size = options.get("snuba.query-thread-pool-sizes").get(referrer) if referrer else None
+    if not size:
+        return _query_thread_pool
+
+    with _referrer_query_thread_pools_lock:
+        pool_size, pool = _referrer_query_thread_pools.get(referrer, (None, None))
+        if pool is None or pool_size != size:
+            # A resized pool is not shut down, as other threads may still be
+            # submitting to it. Its workers exit once it has been collected.
+            pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"snuba-{referrer}")
+            _referrer_query_thread_pools[referrer] = (size, pool)
+        return pool
 
 
 epoch_naive = datetime(1970, 1, 1, tzinfo=None)
@@ -1123,7 +1149,9 @@ def _apply_cache_and_build_results(
         for query_pos, snuba_request in snuba_requests_list:
             to_query.append((query_pos, snuba_request, None))
 
-    if to_query:
+    if to_query and use_cache and options.get("snuba.query-single-flight.enabled"):
+        results.extend(_single_flight_bulk_snuba_query(to_query))
+    elif to_query:
         query_results = _bulk_snuba_query([item[1] for item in to_query])
         for result, (query_pos, _, opt_cache_key) in zip(query_results, to_query):
             if opt_cache_key:
@@ -1140,6 +1168,137 @@ def _apply_cache_and_build_results(
     return [result[1] for result in results]
 
 
+class _InFlightQueries:
+    """
+    The cached Snuba queries this process is running, by cache key. Each one
+    has a future which resolves to the serialized result.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future[str]] = {}
+
+    def join(self, cache_key: str) -> tuple[Future[str], bool]:
+        """
+        Returns the future of the query with this cache key, and whether the
+        caller is the one that has to run it.
+        """
+        with self._lock:
+            future = self._futures.get(cache_key)
+            if future is not None:
+                return future, False
+
+            future = self._futures[cache_key] = Future()
+            return future, True
+
+    def leave(self, cache_key: str, future: Future[str]) -> None:
+        with self._lock:
+            if self._futures.get(cache_key) is future:
+                del self._futures[cache_key]
+
+
+_in_flight_queries = _InFlightQueries()
+
+
+def _wait_for_cached_result(cache_key: str, timeout: float) -> str | None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+        time.sleep(0.05)
+
+    return None
+
+
+def _single_flight_bulk_snuba_query(
+    to_query: Sequence[tuple[int, SnubaRequest, str | None]],
+) -> list[tuple[int, Any]]:
+    """
+    Runs and caches the given queries like `_apply_cache_and_build_results`
+    does, but only one query per cache key is in flight in this process at a
+    time. Identical queries wait for and share its result.
+
+    If `snuba.query-single-flight.lease-seconds` is set, the query is also
+    leased across processes. Other processes wait up to that long for the
+    result to show up in the cache before running the query themselves.
+    """
+    from sentry.locks import locks
+    from sentry.utils.locking import UnableToAcquireLock
+
+    leading: list[tuple[int, SnubaRequest, str, Future[str]]] = []
+    waiting: list[tuple[int, SnubaRequest, Future[str]]] = []
+    for query_pos, snuba_request, cache_key in to_query:
+        assert cache_key is not None
+        future, is_leader = _in_flight_queries.join(cache_key)
+        if is_leader:
+            leading.append((query_pos, snuba_request, cache_key, future))
+        else:
+            waiting.append((query_pos, snuba_request, future))
+
+    results: list[tuple[int, Any]] = []
+    lease_seconds = options.get("snuba.query-single-flight.lease-seconds")
+    leases = []
+    try:
+        to_run = []
+        for query_pos, snuba_request, cache_key, future in leading:
+            if lease_seconds > 0:
+                lease = locks.get(
+                    f"{cache_key}:lease", duration=lease_seconds, name="snuba_query_single_flight"
+                )
+                try:
+                    lease.acquire()
+                except UnableToAcquireLock:
+                    cached_result = _wait_for_cached_result(cache_key, lease_seconds)
+                    if cached_result is not None:
+                        metrics.incr(
+                            "snuba.query_single_flight.leased",
+                            tags={"referrer": snuba_request.referrer or "unknown"},
+                        )
+                        future.set_result(cached_result)
+                        results.append((query_pos, json.loads(cached_result)))
+                        continue
+                else:
+                    leases.append(lease)
+
+            to_run.append((query_pos, snuba_request, cache_key, future))
+
+        if to_run:
+            query_results = _bulk_snuba_query([item[1] for item in to_run])
+            for result, (query_pos, _, cache_key, future) in zip(query_results, to_run):
+                serialized_result = json.dumps(result)
+                cache.set(cache_key, serialized_result, settings.SENTRY_SNUBA_CACHE_TTL_SECONDS)
+                future.set_result(serialized_result)
+                results.append((query_pos, result))
+    except BaseException as error:
+        for _, _, _, future in leading:
+            if not future.done():
+                future.set_exception(error)
+        raise
+    finally:
+        for lease in leases:
+            lease.release()
+        for _, _, cache_key, future in leading:
+            _in_flight_queries.leave(cache_key, future)
+
+    # Queries this call runs itself have finished by now, so waiting cannot
+    # deadlock on a duplicate query within the same call.
+    for query_pos, snuba_request, future in waiting:
+        metrics.incr(
+            "snuba.query_single_flight.coalesced",
+            tags={"referrer": snuba_request.referrer or "unknown"},
+        )
+        try:
+            serialized_result = future.result(timeout=settings.SENTRY_SNUBA_TIMEOUT)
+        except TimeoutError:
+            results.append((query_pos, _bulk_snuba_query([snuba_request])[0]))
+        else:
+            # Every caller gets its own copy, as results are mutated downstream.
+            results.append((query_pos, json.loads(serialized_result)))
+
+    return results
+
+
 def _is_rejected_query(body: Any) -> bool:
     return (
         "quota_allowance" in body
@@ -1156,8 +1315,12 @@ def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
         span.set_tag("snuba.num_queries", len(snuba_requests_list))
 
         if len(snuba_requests_list) > 1:
+            referrers = {snuba_request.referrer for snuba_request in snuba_requests_list}
+            query_thread_pool = _get_query_thread_pool(
+                referrers.pop() if len(referrers) == 1 else None
+            )
             query_results = list(
-                _query_thread_pool.map(
+                query_thread_pool.map(
                     _snuba_query,
                     [
                         (
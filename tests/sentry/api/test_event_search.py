@@ -8,6 +8,7 @@ from django.test import SimpleTestCase
 from django.utils import timezone
 
 from sentry.api.event_search import (
+    PARSE_TREE_NODE_BYTES,
     AggregateFilter,
     AggregateKey,
     ParenExpression,
@@ -15,8 +16,10 @@ from sentry.api.event_search import (
     SearchFilter,
     SearchKey,
     SearchValue,
+    _parse_tree_cache,
     _RecursiveList,
     default_config,
+    event_search_grammar,
     flatten,
     parse_search_query,
     translate_wildcard_as_clickhouse_pattern,
@@ -1055,3 +1058,55 @@ def test_translate_wildcard_as_clickhouse_pattern(pattern, clickhouse):
 def test_invalid_translate_wildcard_as_clickhouse_pattern(pattern):
     with pytest.raises(InvalidSearchQuery):
         assert translate_wildcard_as_clickhouse_pattern(pattern)
+
+
+def test_parse_tree_is_cached():
+    _parse_tree_cache.clear()
+    query = "user.email:foo@example.com OR transaction:/api/0/*"
+
+    with (
+        patch.object(event_search_grammar, "parse", wraps=event_search_grammar.parse) as parse,
+        patch("sentry.api.event_search.metrics.incr") as incr,
+    ):
+        first = parse_search_query(query)
+        assert parse_search_query(query) == first
+        assert parse.call_count == 1
+        assert [
+            c.kwargs["tags"]["result"]
+            for c in incr.call_args_list
+            if c.args[0] == "event_search.parse_tree_cache"
+        ] == ["miss", "hit"]
+
+        # Tokens still follow the config even though the tree is shared
+        no_boolean_config = SearchConfig.create_from(default_config, allow_boolean=False)
+        with pytest.raises(InvalidSearchQuery):
+            parse_search_query(query, config=no_boolean_config)
+        assert parse.call_count == 1
+
+
+def test_parse_tree_cache_is_sized_by_node_count():
+    _parse_tree_cache.clear()
+    query = "user.email:foo@example.com"
+    parse_search_query(query)
+
+    tree = _parse_tree_cache[query]
+    nodes = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        nodes += 1
+        stack.extend(node.children)
+
+    assert _parse_tree_cache.currsize == nodes * PARSE_TREE_NODE_BYTES
+
+
+@freeze_time("2024-01-01T12:00:00")
+def test_parse_tree_cache_resolves_relative_dates_per_call():
+    _parse_tree_cache.clear()
+    query = "timestamp:-24h"
+
+    first = parse_search_query(query)
+    with freeze_time("2024-01-02T12:00:00"):
+        second = parse_search_query(query)
+
+    assert second[0].value.raw_value - first[0].value.raw_value == timedelta(days=1)
@@ -83,6 +83,40 @@ class TestRedisBuffer:
         client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
         assert client.zrange("b:p", 0, -1) == []
 
+    @mock.patch("sentry.buffer.redis.process_incr")
+    def test_process_pending_in_chunks(self, process_incr):
+        self.buf.incr_batch_size = 2
+        self.buf.pending_chunk_size = 2
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        client.zadd("b:p", {"foo": 1, "bar": 2, "baz": 3})
+        self.buf.process_pending()
+        assert process_incr.apply_async.mock_calls == [
+            mock.call(kwargs={"batch_keys": ["foo", "bar"]}, headers=mock.ANY),
+            mock.call(kwargs={"batch_keys": ["baz"]}, headers=mock.ANY),
+        ]
+        assert client.zrange("b:p", 0, -1) == []
+
+    @mock.patch("sentry.buffer.redis.process_incr")
+    def test_process_pending_adapts_batch_size(self, process_incr):
+        self.buf.incr_batch_size = 1
+        self.buf.max_incr_batch_size = 10
+        self.buf.pending_target_tasks = 2
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        client.zadd("b:p", {f"key{i}": i for i in range(6)})
+        self.buf.process_pending()
+        assert process_incr.apply_async.mock_calls == [
+            mock.call(kwargs={"batch_keys": ["key0", "key1", "key2"]}, headers=mock.ANY),
+            mock.call(kwargs={"batch_keys": ["key3", "key4", "key5"]}, headers=mock.ANY),
+        ]
+
+    def test_get_incr_batch_size(self):
+        self.buf.incr_batch_size = 2
+        self.buf.max_incr_batch_size = 100
+        self.buf.pending_target_tasks = 1000
+        assert self.buf._get_incr_batch_size(10) == 2
+        assert self.buf._get_incr_batch_size(10_000) == 10
+        assert self.buf._get_incr_batch_size(1_000_000) == 100
+
     @mock.patch("sentry.buffer.redis.RedisBuffer._make_key", mock.Mock(return_value="foo"))
     @mock.patch("sentry.buffer.base.Buffer.process")
     def test_process_does_bubble_up_json(self, process):
@@ -628,6 +662,59 @@ class TestRedisBuffer:
         # signal_only should not increment the times_seen column
         assert group.times_seen == orig_times_seen
 
+    def test_incr_aggregation(self):
+        self.buf.incr_aggregation_window = 60
+        self.buf.incr_aggregation_max_keys = 2
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        now = datetime.datetime(2017, 5, 3, 6, 6, 6, tzinfo=datetime.UTC)
+        key = self.buf._make_key(model, filters={"pk": 1})
+
+        self.buf.incr(model, {"times_seen": 1}, {"pk": 1}, extra={"foo": "bar"})
+        self.buf.incr(model, {"times_seen": 2}, {"pk": 1}, extra={"foo": "baz"}, signal_only=True)
+        self.buf.incr(model, {"times_seen": 3}, {"pk": 1}, extra={"datetime": now})
+
+        # Nothing is written until the window passes or enough keys are pending
+        assert self.buf.get(model, ["times_seen"], filters={"pk": 1}) == {"times_seen": 0}
+        assert not client.zrange("b:p", 0, -1)
+
+        hook = mock.Mock()
+        redis_buffer_registry.add_handler(BufferHookEvent.INCR_FLUSH, hook)
+        try:
+            self.buf.incr(model, {"times_seen": 1}, {"pk": 2})
+        finally:
+            del redis_buffer_registry._registry[BufferHookEvent.INCR_FLUSH]
+
+        assert hook.call_count == 1
+        assert self.buf.get(model, ["times_seen"], filters={"pk": 1}) == {"times_seen": 6}
+        assert self.buf.get(model, ["times_seen"], filters={"pk": 2}) == {"times_seen": 1}
+
+        result = _hgetall_decode_keys(client, key, self.buf.is_redis_cluster)
+        if self.buf.is_redis_cluster:
+
+            def load_value(x):
+                return self.buf._load_value(json.loads(x))
+
+        else:
+            load_value = pickle.loads
+        assert load_value(result["e+foo"]) == "baz"
+        assert load_value(result["e+datetime"]) == now
+        assert result["s"] in ("1", b"1")
+        assert len(client.zrange("b:p", 0, -1)) == 2
+
+    def test_flush_pending_incrs(self):
+        self.buf.incr_aggregation_window = 60
+        model = mock.Mock()
+        model.__name__ = "Mock"
+
+        self.buf.incr(model, {"times_seen": 1}, {"pk": 1})
+        self.buf.incr(model, {"times_seen": 1}, {"pk": 1})
+        assert self.buf.get(model, ["times_seen"], filters={"pk": 1}) == {"times_seen": 0}
+
+        self.buf.flush_pending_incrs()
+        assert self.buf.get(model, ["times_seen"], filters={"pk": 1}) == {"times_seen": 2}
+
 
 @pytest.mark.parametrize(
     "value",
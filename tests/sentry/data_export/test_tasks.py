@@ -10,6 +10,7 @@ from sentry.models.files.file import File
 from sentry.search.events.constants import TIMEOUT_ERROR_MESSAGE
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.samples import load_data
 from sentry.utils.snuba import (
     DatasetSelectionError,
@@ -653,6 +654,35 @@ class AssembleDownloadLargeTest(TestCase, SnubaTestCase):
 
         assert emailer.called
 
+    @patch("sentry.data_export.tasks.MAX_BATCH_SIZE", 200)
+    @patch("sentry.snuba.discover.query")
+    @patch("sentry.data_export.models.ExportedData.email_success")
+    def test_discover_concurrent_fetch(self, emailer, mock_query):
+        rows = [{"title": f"/event/{i:03d}/"} for i in range(50)]
+        mock_query.side_effect = lambda offset, limit, **kwargs: {
+            "data": [dict(row) for row in rows[offset : offset + limit]]
+        }
+
+        contents = []
+        for concurrency in (1, 4):
+            de = ExportedData.objects.create(
+                user_id=self.user.id,
+                organization=self.org,
+                query_type=ExportQueryType.DISCOVER,
+                query_info={"project": [self.project.id], "field": ["title"], "query": ""},
+            )
+            with override_options({"data-export.fetch-concurrency": concurrency}):
+                with self.tasks():
+                    assemble_download(de.id, batch_size=3)
+            de = ExportedData.objects.get(id=de.id)
+            with de._get_file().getfile() as f:
+                contents.append(f.read())
+
+        assert contents[0] == contents[1]
+        assert contents[1].strip().split(b"\r\n") == [b"title"] + [
+            row["title"].encode() for row in rows
+        ]
+
     @patch("sentry.data_export.models.ExportedData.email_success")
     def test_character_escape(self, emailer):
         strings = [
@@ -1,4 +1,7 @@
-from sentry import eventstore
+
+from sentry import deletions, eventstore
+from sentry.deletions.base import _plan_relation_stages
+from sentry.deletions.defaults.project import ProjectDeletionTask
 from sentry.deletions.tasks.scheduled import run_scheduled_deletions
 from sentry.incidents.models.alert_rule import AlertRule
 from sentry.incidents.models.incident import Incident
@@ -16,6 +19,7 @@ from sentry.models.groupopenperiod import GroupOpenPeriod
 from sentry.models.groupresolution import GroupResolution
 from sentry.models.groupseen import GroupSeen
 from sentry.models.project import Project
+from sentry.models.projectcodeowners import ProjectCodeOwners
 from sentry.models.release import Release
 from sentry.models.releasecommit import ReleaseCommit
 from sentry.models.repository import Repository
@@ -28,10 +32,11 @@ from sentry.monitors.models import (
     MonitorEnvironment,
     ScheduleType,
 )
-from sentry.sentry_apps.models.servicehook import ServiceHook
+from sentry.sentry_apps.models.servicehook import ServiceHook, ServiceHookProject
 from sentry.snuba.models import QuerySubscription, SnubaQuery
 from sentry.testutils.cases import TransactionTestCase
 from sentry.testutils.helpers.datetime import before_now
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.hybrid_cloud import HybridCloudTestMixin
 from sentry.testutils.skips import requires_snuba
 from sentry.types.activity import ActivityType
@@ -251,6 +256,37 @@ class DeleteProjectTest(BaseWorkflowTest, TransactionTestCase, HybridCloudTestMi
             id=project_uptime_subscription.id
         ).exists()
 
+    @override_options({"deletions.child-relations.concurrency": 4})
+    def test_simple_concurrent(self):
+        self.test_simple()
+
+    def test_plan_relation_stages(self):
+        from sentry.integrations.models.repository_project_path_config import (
+            RepositoryProjectPathConfig,
+        )
+
+        relations = ProjectDeletionTask(deletions.get_manager(), Project, {}).get_child_relations(
+            self.project
+        )
+        stages = _plan_relation_stages(relations)
+
+        # every relation is planned exactly once
+        assert sorted(map(id, relations)) == sorted(id(r) for stage in stages for r in stage)
+
+        stage_by_model = {
+            relation.params["model"]: index
+            for index, stage in enumerate(stages)
+            for relation in stage
+        }
+        assert stage_by_model[GroupOpenPeriod] < stage_by_model[Activity]
+        assert stage_by_model[ProjectCodeOwners] < stage_by_model[RepositoryProjectPathConfig]
+        assert stage_by_model[ServiceHookProject] < stage_by_model[ServiceHook]
+        assert stage_by_model[GroupSeen] == stage_by_model[GroupAssignee]
+        # relations which are not deleted in bulk always run on their own
+        assert stages[stage_by_model[Group]] == [
+            r for r in relations if r.params.get("model") is Group
+        ]
+
 
 class DeleteWorkflowEngineModelsTest(DeleteProjectTest):
     def setUp(self):
@@ -158,3 +158,32 @@ class RedisBackendTestCase(TestCase):
 
         with backend.digest("timeline", 0) as records:
             assert len(records) == n
+
+    def test_digest_many(self):
+        backend = RedisBackend()
+
+        for timeline in ("timeline:1", "timeline:2", "timeline:3"):
+            backend.add(timeline, Record("record:1", self.notification, time.time()))
+
+        # Closing moves the first timeline back to the waiting state, so the
+        # batch below skips it.
+        with backend.digest("timeline:1", 0):
+            pass
+
+        with backend.digest_many(["timeline:1", "timeline:2", "timeline:3"], 0) as digests:
+            assert {
+                key: [record.key for record in records] for key, records in digests.items()
+            } == {
+                "timeline:2": ["record:1"],
+                "timeline:3": ["record:1"],
+            }
+            # A timeline removed from the batch is left open.
+            del digests["timeline:3"]
+
+        with backend.digest("timeline:3", 0) as records:
+            assert [record.key for record in records] == ["record:1"]
+
+        # The second timeline has been closed and is back in the waiting state.
+        with pytest.raises(InvalidState):
+            with backend.digest("timeline:2", 0):
+                raise AssertionError("unreachable")
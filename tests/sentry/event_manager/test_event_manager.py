@@ -31,6 +31,8 @@ from sentry.dynamic_sampling import (
 from sentry.event_manager import (
     EventManager,
     _get_event_instance,
+    _get_or_create_release_many,
+    _pull_out_data,
     get_event_type,
     has_pending_commit_resolution,
     materialize_metadata,
@@ -3624,3 +3626,26 @@ def test_cogs_event_manager(
     # We cannot assert for exact length because manager save method adds some extra fields. So we
     # assert that the length is at least greater than the expected length.
     assert formatted["amount"] >= expected_len
+
+
+class GetOrCreateReleaseManyTest(TestCase):
+    def test_job_without_release_does_not_skip_later_jobs(self) -> None:
+        jobs: list[Any] = []
+        for data in (make_event(), make_event(release="1.0")):
+            manager = EventManager(data)
+            manager.normalize()
+            jobs.append(
+                {
+                    "data": manager.get_data(),
+                    "project_id": self.project.id,
+                    "raw": False,
+                    "start_time": time(),
+                }
+            )
+        projects = {self.project.id: self.project}
+        _pull_out_data(jobs, projects)
+
+        _get_or_create_release_many(jobs, projects)
+
+        assert jobs[0]["release"] is None
+        assert jobs[1]["release"].version == "1.0"
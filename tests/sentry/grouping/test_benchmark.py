@@ -1,10 +1,20 @@
+from os import path
+
 import pytest
 
+from sentry.grouping.parameterization import (
+    DEFAULT_PARAMETERIZATION_REGEXES_MAP,
+    Parameterizer,
+    UniqueIdExperiment,
+)
 from sentry.grouping.strategies.configurations import CONFIGURATIONS
 from tests.sentry.grouping import GROUPING_INPUTS_DIR, GroupingInput, get_grouping_inputs
 
 GROUPING_INPUTS = get_grouping_inputs(GROUPING_INPUTS_DIR)
 
+with open(path.join(path.dirname(__file__), "parameterization_corpus.txt")) as f:
+    PARAMETERIZATION_CORPUS = f.read().splitlines()
+
 
 def benchmark_available() -> bool:
     try:
@@ -37,3 +47,16 @@ def run_configuration(grouping_input: GroupingInput, config_name: str) -> None:
     event.project = None  # type: ignore[assignment]
 
     event.get_hashes()
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+def test_benchmark_parameterization(benchmark):
+    def run() -> None:
+        parameterizer = Parameterizer(
+            regex_pattern_keys=tuple(DEFAULT_PARAMETERIZATION_REGEXES_MAP),
+            experiments=(UniqueIdExperiment,),
+        )
+        for message in PARAMETERIZATION_CORPUS:
+            parameterizer.parameterize_all(message)
+
+    benchmark(run)
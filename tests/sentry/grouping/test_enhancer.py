@@ -459,6 +459,54 @@ def test_app_no_matches(frame):
     assert frame.get("in_app") is True
 
 
+def test_from_base64_string_is_cached():
+    enhancements_str = Enhancements.from_rules_text("function:foo -app").base64_string
+
+    enhancements = Enhancements.from_base64_string(enhancements_str)
+    assert Enhancements.from_base64_string(enhancements_str) is enhancements
+    assert Enhancements.from_base64_string(enhancements_str.encode("ascii")) is enhancements
+
+    other_str = Enhancements.from_rules_text("function:bar -app").base64_string
+    assert Enhancements.from_base64_string(other_str) is not enhancements
+
+
+def test_create_match_frame_is_memoized():
+    frame = {"function": "Foo::bar", "abs_path": "C:\\Foo\\Bar.cpp", "in_app": True}
+
+    match_frame = create_match_frame(frame, "native")
+    assert match_frame["path"] == b"c:/foo/bar.cpp"
+
+    # Mutating a returned frame must not leak into later results
+    match_frame["path"] = b"oops"
+    assert create_match_frame(frame, "native")["path"] == b"c:/foo/bar.cpp"
+
+    # `True` and `1` hash the same but must not share an entry
+    assert create_match_frame({**frame, "in_app": 1}, "native")["in_app"] == 1
+
+
+def test_apply_category_and_updated_in_app_to_frames_is_memoized():
+    enhancements = Enhancements.from_rules_text("function:foo -app")
+
+    with mock.patch.object(
+        enhancements,
+        "rust_enhancements",
+        wraps=enhancements.rust_enhancements,
+    ) as rust_enhancements:
+        for _ in range(2):
+            frames = [{"function": "foo", "in_app": True}, {"function": "bar", "in_app": True}]
+            enhancements.apply_category_and_updated_in_app_to_frames(frames, "native", {})
+            assert [frame["in_app"] for frame in frames] == [False, True]
+
+        assert rust_enhancements.apply_modifications_to_frames.call_count == 1
+
+        # A different exception can match different rules
+        frames = [{"function": "foo", "in_app": True}]
+        enhancements.apply_category_and_updated_in_app_to_frames(
+            frames, "native", {"type": "ValueError"}
+        )
+        assert rust_enhancements.apply_modifications_to_frames.call_count == 2
+
+
 def test_cached_with_kwargs():
     """Order of kwargs should not matter"""
 
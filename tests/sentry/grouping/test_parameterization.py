@@ -6,6 +6,7 @@ from sentry.grouping.parameterization import (
     ParameterizationRegexExperiment,
     Parameterizer,
     UniqueIdExperiment,
+    _UniqueId,
 )
 
 
@@ -268,6 +269,33 @@ def test_parameterize_regex_experiment_cached_compiled():
     mocked_pattern.assert_called_once()
 
 
+def test_parameterizers_share_compiled_regex():
+    keys = ("uuid", "int")
+    assert (
+        Parameterizer(regex_pattern_keys=keys)._parameterization_regex
+        is Parameterizer(regex_pattern_keys=list(keys))._parameterization_regex
+    )
+
+    with pytest.raises(KeyError):
+        Parameterizer(regex_pattern_keys=("not_a_pattern",))
+
+
+def test_uniq_id_verdicts_cached():
+    _UniqueId.has_uniq_id_token_ratio.cache_clear()
+
+    with mock.patch.object(
+        _UniqueId, "num_tokens_from_string", wraps=_UniqueId.num_tokens_from_string
+    ) as num_tokens_from_string:
+        for _ in range(3):
+            assert (
+                _UniqueId.replace_uniq_ids_in_str("fbtrace_id Aba64NMEPMmBwi_cPLaGeeK blah")[0]
+                == "fbtrace_id <uniq_id> blah"
+            )
+
+    # Each of the three tokens is only tokenized once
+    assert num_tokens_from_string.call_count == 3
+
+
 # These are test cases that we should fix
 @pytest.mark.xfail()
 @pytest.mark.parametrize(
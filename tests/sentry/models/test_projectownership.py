@@ -77,6 +77,37 @@ class ProjectOwnershipTestCase(TestCase):
         ProjectOwnership.objects.create(project_id=self.project.id, fallthrough=True)
         assert ProjectOwnership.get_owners(self.project.id, {}) == ([], None)
 
+    def test_get_matcher_index_cached_per_schema(self):
+        rule_a = Rule(Matcher("path", "*.py"), [Owner("team", self.team.slug)])
+        rule_b = Rule(Matcher("path", "*.js"), [Owner("team", self.team.slug)])
+
+        index = ProjectOwnership.get_matcher_index(dump_schema([rule_a]))
+        assert ProjectOwnership.get_matcher_index(dump_schema([rule_a])) is index
+        assert index.rules == [rule_a]
+
+        changed_index = ProjectOwnership.get_matcher_index(dump_schema([rule_a, rule_b]))
+        assert changed_index is not index
+        assert changed_index.rules == [rule_a, rule_b]
+
+    def test_get_owners_does_not_hash_cached_schema(self):
+        rule_a = Rule(Matcher("path", "*.py"), [Owner("team", self.team.slug)])
+        ownership = ProjectOwnership.objects.create(
+            project_id=self.project.id, schema=dump_schema([rule_a]), fallthrough=True
+        )
+        data = {"stacktrace": {"frames": [{"filename": "foo.py"}]}}
+        assert ProjectOwnership.get_owners(self.project.id, data)[1] == [rule_a]
+
+        with patch("sentry.models.projectownership.md5_text") as md5_text:
+            assert ProjectOwnership.get_owners(self.project.id, data)[1] == [rule_a]
+        assert not md5_text.called
+
+        # saving a new schema recomputes its key
+        rule_b = Rule(Matcher("path", "*.js"), [Owner("team", self.team.slug)])
+        ownership.schema = dump_schema([rule_b])
+        ownership.save()
+        data = {"stacktrace": {"frames": [{"filename": "foo.js"}]}}
+        assert ProjectOwnership.get_owners(self.project.id, data)[1] == [rule_b]
+
     def test_get_owners_no_record(self):
         assert ProjectOwnership.get_owners(self.project.id, {}) == ([], None)
         ProjectOwnership.objects.create(project_id=self.project.id, fallthrough=True)
@@ -11,6 +11,7 @@ from sentry.constants import ObjectStatus
 from sentry.monitors.clock_tasks.check_missed import (
     dispatch_check_missing,
     mark_environment_missing,
+    mark_environments_missing,
 )
 from sentry.monitors.clock_tasks.producer import MONITORS_CLOCK_TASKS_CODEC
 from sentry.monitors.models import (
@@ -742,3 +743,79 @@ class MonitorClockTasksCheckMissingTest(TestCase):
         assert not MonitorCheckIn.objects.filter(
             monitor_environment=monitor_environment.id, status=CheckInStatus.MISSED
         ).exists()
+
+    def create_missed_environment(self, ts, next_checkin_latest, config=None):
+        monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            config=config
+            or {
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "* * * * *",
+                "max_runtime": None,
+                "checkin_margin": None,
+            },
+        )
+        return MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.environment.id,
+            last_checkin=ts - timedelta(minutes=2),
+            next_checkin=ts - timedelta(minutes=1),
+            next_checkin_latest=next_checkin_latest,
+            status=MonitorStatus.OK,
+        )
+
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.CHECK_MISSING_PAGE_SIZE", 2)
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_dispatch_pages_most_overdue_first(self, mock_produce_task):
+        ts = timezone.now().replace(second=0, microsecond=0)
+
+        monitor_environments = [
+            self.create_missed_environment(ts, ts),
+            self.create_missed_environment(ts, ts - timedelta(minutes=1)),
+            self.create_missed_environment(ts, ts),
+            self.create_missed_environment(ts, ts - timedelta(minutes=2)),
+        ]
+        # Not missed yet
+        self.create_missed_environment(ts, ts + timedelta(minutes=1))
+
+        dispatch_check_missing(ts)
+
+        assert [call.args[0].key for call in mock_produce_task.mock_calls] == [
+            str(monitor_environment.id).encode()
+            for monitor_environment in [
+                monitor_environments[3],
+                monitor_environments[1],
+                *sorted([monitor_environments[0], monitor_environments[2]], key=lambda e: e.id),
+            ]
+        ]
+
+    def test_mark_environments_missing(self):
+        ts = timezone.now().replace(second=0, microsecond=0)
+
+        missed = self.create_missed_environment(ts, ts)
+        # XXX: The invalid schedule causes an exception which must not stop
+        # the rest of the batch from being marked missing
+        failing = self.create_missed_environment(
+            ts,
+            ts,
+            config={
+                "schedule_type": ScheduleType.INTERVAL,
+                "schedule": [-2, "minute"],
+                "checkin_margin": None,
+                "max_runtime": None,
+            },
+        )
+        not_missed = self.create_missed_environment(ts, ts + timedelta(minutes=1))
+
+        mark_environments_missing([failing.id, missed.id, not_missed.id], ts)
+
+        assert MonitorEnvironment.objects.filter(id=missed.id, status=MonitorStatus.ERROR).exists()
+        assert MonitorEnvironment.objects.get(id=missed.id).next_checkin == ts
+        assert (
+            MonitorCheckIn.objects.filter(
+                monitor_environment__in=[missed.id, failing.id], status=CheckInStatus.MISSED
+            ).count()
+            == 2
+        )
+        assert not MonitorCheckIn.objects.filter(monitor_environment=not_missed.id).exists()
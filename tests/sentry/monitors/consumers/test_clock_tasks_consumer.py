@@ -15,8 +15,8 @@ from sentry.monitors.consumers.clock_tasks_consumer import (
 partition = Partition(Topic("test"), 0)
 
 
-def create_consumer() -> ProcessingStrategy[KafkaPayload]:
-    factory = MonitorClockTasksStrategyFactory()
+def create_consumer(**kwargs) -> ProcessingStrategy[KafkaPayload]:
+    factory = MonitorClockTasksStrategyFactory(**kwargs)
     commit = mock.Mock()
     return factory.create_with_partitions(commit, {partition: 0})
 
@@ -88,3 +88,44 @@ def test_dispatch_mark_unknown(mock_mark_checkin_unknown):
 
     assert mock_mark_checkin_unknown.call_count == 1
     assert mock_mark_checkin_unknown.mock_calls[0] == mock.call(1, ts)
+
+
+@mock.patch("sentry.monitors.consumers.clock_tasks_consumer.mark_checkin_timeout")
+@mock.patch("sentry.monitors.consumers.clock_tasks_consumer.mark_environments_missing")
+def test_dispatch_batched(mock_mark_environments_missing, mock_mark_checkin_timeout):
+    ts = timezone.now().replace(second=0, microsecond=0)
+
+    consumer = create_consumer(mode="batched", max_batch_size=4)
+    for monitor_environment_id in (1, 2):
+        send_task(
+            consumer,
+            ts,
+            {
+                "type": "mark_missing",
+                "ts": ts.timestamp(),
+                "monitor_environment_id": monitor_environment_id,
+            },
+        )
+    send_task(
+        consumer,
+        ts,
+        {
+            "type": "mark_timeout",
+            "ts": ts.timestamp(),
+            "monitor_environment_id": 1,
+            "checkin_id": 1,
+        },
+    )
+    send_task(
+        consumer,
+        ts,
+        {"type": "mark_missing", "ts": ts.timestamp(), "monitor_environment_id": 3},
+    )
+    consumer.poll()
+
+    # Missed environments are marked together, but not across other tasks
+    assert mock_mark_environments_missing.mock_calls == [
+        mock.call([1, 2], ts),
+        mock.call([3], ts),
+    ]
+    assert mock_mark_checkin_timeout.mock_calls == [mock.call(1, ts)]
@@ -1,5 +1,6 @@
 import contextlib
 import uuid
+from collections import defaultdict
 from collections.abc import Generator, Mapping, Sequence
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -19,7 +20,12 @@ from sentry.constants import ObjectStatus
 from sentry.db.models import BoundedPositiveIntegerField
 from sentry.models.environment import Environment
 from sentry.monitors.constants import TIMEOUT, PermitCheckInStatus
-from sentry.monitors.consumers.monitor_consumer import StoreMonitorCheckInStrategyFactory
+from sentry.monitors.consumers.monitor_consumer import (
+    PrefetchedCheckin,
+    StoreMonitorCheckInStrategyFactory,
+    prefetch_checkins,
+    process_checkin_group,
+)
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -249,6 +255,71 @@ class MonitorConsumerTest(TestCase):
         # The last group is monitor_2 but with a diff environment
         assert group_3[0].payload.get("environment") == "test"
 
+    def test_prefetch_checkins(self) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        monitor_environment = MonitorEnvironment.objects.ensure_environment(
+            self.project, monitor, "production"
+        )
+        now = datetime.now()
+
+        def make_item(monitor_slug: str) -> CheckinItem:
+            payload = {
+                "monitor_slug": monitor_slug,
+                "status": "ok",
+                "check_in_id": uuid.uuid4().hex,
+                "environment": "production",
+            }
+            wrapper: CheckIn = {
+                "message_type": "check_in",
+                "start_time": now.timestamp(),
+                "project_id": self.project.id,
+                "payload": json.dumps(payload).encode(),
+                "sdk": "test/1.0",
+                "retention_days": 90,
+            }
+            return CheckinItem(now, self.partition.index, wrapper, payload)
+
+        checkin_mapping: dict[str, list[CheckinItem]] = defaultdict(list)
+        for item in [
+            make_item("my-monitor"),
+            make_item("my-monitor"),
+            make_item("my-monitor"),
+            make_item("new-monitor"),
+        ]:
+            checkin_mapping[item.processing_key].append(item)
+        existing_key, new_key = checkin_mapping.keys()
+
+        with mock.patch("sentry.monitors.consumers.monitor_consumer.CHECKIN_QUOTA_LIMIT", 2):
+            prefetched = prefetch_checkins(checkin_mapping)
+
+        # Only the first check-in of a group has its monitor resolved
+        existing = prefetched[existing_key]
+        assert [p.is_ratelimited for p in existing] == [False, False, True]
+        assert existing[0].monitor == monitor
+        assert existing[0].monitor_environment == monitor_environment
+        assert existing[1].monitor is None
+        assert existing[1].monitor_environment is None
+
+        assert prefetched[new_key] == [PrefetchedCheckin(is_ratelimited=False)]
+
+        with (
+            mock.patch.object(
+                MonitorEnvironment.objects,
+                "ensure_environment",
+                wraps=MonitorEnvironment.objects.ensure_environment,
+            ) as ensure_environment,
+            mock.patch(
+                "sentry.monitors.consumers.monitor_consumer.handle_processing_errors"
+            ) as handle_processing_errors,
+        ):
+            process_checkin_group(checkin_mapping[existing_key], existing)
+
+        # The prefetched monitor environment is used for the first check-in,
+        # the last check-in is dropped by the prefetched rate limit
+        assert ensure_environment.call_count == 1
+        assert handle_processing_errors.call_count == 1
+        assert MonitorCheckIn.objects.filter(monitor_environment=monitor_environment).count() == 2
+
     def test_passing(self) -> None:
         monitor = self._create_monitor(slug="my-monitor")
         self.send_checkin(monitor.slug)
@@ -0,0 +1,88 @@
+from unittest import mock
+
+import pytest
+
+from sentry.nodestore import base
+from sentry.nodestore.local_cache import LocalNodeCache
+from sentry.testutils.helpers import override_options
+from tests.sentry.nodestore.bigtable.test_backend import MockedBigtableNodeStorage
+
+
+def test_get_many_returns_hits_and_negative_hits() -> None:
+    cache = LocalNodeCache(max_bytes=1024, ttl=60, negative_ttl=60)
+    cache.set_many({"a": b"node a", "b": None})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"node a", "b": None}
+
+
+def test_evicts_by_size() -> None:
+    cache = LocalNodeCache(max_bytes=10, ttl=60, negative_ttl=60)
+    cache.set_many({"a": b"aaaaaa"})
+    cache.set_many({"b": b"bbbbbb"})
+
+    assert cache.get_many(["a", "b"]) == {"b": b"bbbbbb"}
+
+    # Nodes larger than the budget are never cached.
+    cache.set_many({"c": b"c" * 11})
+    assert cache.get_many(["c"]) == {}
+
+
+def test_expiry() -> None:
+    now = 100.0
+    cache = LocalNodeCache(max_bytes=1024, ttl=10, negative_ttl=1, timer=lambda: now)
+    cache.set_many({"a": b"node a", "b": None})
+
+    now = 105.0
+    assert cache.get_many(["a", "b"]) == {"a": b"node a"}
+
+    now = 111.0
+    assert cache.get_many(["a", "b"]) == {}
+
+
+def test_delete_many() -> None:
+    cache = LocalNodeCache(max_bytes=1024, ttl=60, negative_ttl=60)
+    cache.set_many({"a": b"node a", "b": b"node b"})
+    cache.delete_many(["a"])
+
+    assert cache.get_many(["a", "b"]) == {"b": b"node b"}
+
+
+@pytest.fixture
+def ns():
+    with mock.patch.object(base, "_local_cache", None):
+        yield MockedBigtableNodeStorage(project="test")
+
+
+@override_options(
+    {
+        "nodestore.local-cache.enabled": True,
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+    }
+)
+def test_nodestore_reads_through_local_cache(ns) -> None:
+    ns.set_subkeys("a" * 32, {None: {"foo": "a"}, "other": {"foo": "b"}})
+
+    with mock.patch.object(ns, "cache", None):
+        assert ns.get("a" * 32) == {"foo": "a"}
+
+        with (
+            mock.patch.object(ns, "_get_bytes") as get_bytes,
+            mock.patch.object(ns, "_get_bytes_multi") as get_bytes_multi,
+        ):
+            assert ns.get("a" * 32) == {"foo": "a"}
+            assert ns.get("a" * 32, subkey="other") == {"foo": "b"}
+            assert ns.get_multi(["a" * 32]) == {"a" * 32: {"foo": "a"}}
+            assert get_bytes.call_count == 0
+            assert get_bytes_multi.call_count == 0
+
+        # Writes and deletes invalidate the local cache.
+        ns.set("a" * 32, {"foo": "c"})
+        assert ns.get("a" * 32) == {"foo": "c"}
+
+        ns.delete("a" * 32)
+        assert ns.get("a" * 32) is None
+
+        # Missing nodes are cached as well.
+        with mock.patch.object(ns, "_get_bytes") as get_bytes:
+            assert ns.get("a" * 32) is None
+            assert get_bytes.call_count == 0
@@ -1,11 +1,14 @@
+from datetime import timedelta
 from functools import cached_property
-from unittest.mock import patch
+from time import monotonic
+from unittest.mock import Mock, call, patch
 from uuid import uuid1
 
 import pytest
 from django.conf import settings
 from django.core.cache.backends.locmem import LocMemCache
 from django.test import override_settings
+from django.utils import timezone
 
 from sentry.models.options.option import Option
 from sentry.options.manager import OptionsManager, UpdateChannel
@@ -176,3 +179,73 @@ class OptionsStoreTest(TestCase):
         mocked_time.return_value = 26
         store.clean_local_cache()
         assert not store._local_cache
+
+    def test_snapshot(self):
+        store, key = self.store, self.key
+        store.snapshot_max_age = 60
+        store.snapshot_refresher = Mock()
+
+        store.set(key, "bar", UpdateChannel.CLI)
+        store.load_snapshot()
+
+        with (
+            patch.object(store, "get_cache") as get_cache,
+            patch.object(store, "get_store") as get_store,
+        ):
+            assert store.get(key) == "bar"
+            # Missing from the snapshot means not stored at all
+            assert store.get(self.make_key()) is None
+
+            # Writes through the store are applied to the snapshot right away
+            store.set(key, "baz", UpdateChannel.CLI)
+            assert store.get(key) == "baz"
+            store.delete(key)
+            assert store.get(key) is None
+
+        assert not get_cache.called
+        assert not get_store.called
+        assert store.snapshot_refresher.publish.call_args_list == [
+            call(key.name),
+            call(key.name),
+            call(key.name),
+        ]
+
+    def test_load_snapshot(self):
+        store = self.store
+        store.snapshot_max_age = 60
+        key, old_key = self.make_key(), self.make_key()
+
+        store.load_snapshot()
+        assert store.get(key) is None
+
+        # Options written by other processes are loaded from the watermark
+        Option.objects.create(key=key.name, value="foo")
+        store.load_snapshot()
+        assert store.get(key) == "foo"
+
+        Option.objects.create(
+            key=old_key.name, value="bar", last_updated=timezone.now() - timedelta(hours=1)
+        )
+        store.load_snapshot()
+        assert store.get(old_key) is None
+        store.load_snapshot(full=True)
+        assert store.get(old_key) == "bar"
+
+        # Deletions are picked up when reloading the key
+        Option.objects.filter(key=key.name).delete()
+        store.load_snapshot()
+        assert store.get(key) == "foo"
+        store.load_snapshot(keys=[key.name])
+        assert store.get(key) is None
+
+    def test_snapshot_stale(self):
+        store, key = self.store, self.key
+        store.snapshot_max_age = 60
+
+        store.load_snapshot()
+        Option.objects.create(key=key.name, value="foo")
+        assert store.get(key) is None
+
+        # A stale snapshot is bypassed
+        with patch("sentry.options.store.monotonic", return_value=monotonic() + 120):
+            assert store.get(key) == "foo"
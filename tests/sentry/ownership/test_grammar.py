@@ -5,6 +5,7 @@ import pytest
 
 from sentry.ownership.grammar import (
     Matcher,
+    MatcherIndex,
     Owner,
     Rule,
     convert_codeowners_syntax,
@@ -1088,6 +1089,36 @@ def test_codeowners_select_in_app_frames_only(
     _assert_matcher(Matcher("codeowners", "test.py"), path_details, expected)
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"request": {"url": "http://google.com/foo"}},
+        {"tags": [["foo", "bar"]]},
+        {
+            "platform": "python",
+            "stacktrace": {
+                "frames": [
+                    {"filename": "src/sentry/models/group.py", "module": "foo.bar"},
+                    {"filename": "src/components/button.jsx", "in_app": False},
+                    {"abs_path": "/app/frontend/index.ts", "filename": "frontend/index.ts"},
+                    {"filename": "static/app.js"},
+                ]
+            },
+        },
+        {"exception": {"values": [{"stacktrace": {"frames": [{"filename": "foo.py"}]}}]}},
+    ],
+)
+def test_matcher_index_matches_rules_in_order(data: Mapping[str, Any]) -> None:
+    rules = parse_rules(fixture_data)
+    munged_data = Matcher.munge_if_needed(data)
+    expected = [rule for rule in rules if rule.test(data, munged_data)]
+
+    index = MatcherIndex(rules)
+    # The second pass is served from the per-value cache
+    assert index.matching_rules(data, munged_data) == expected
+    assert index.matching_rules(data, munged_data) == expected
+
+
 def test_convert_schema_to_rules_text() -> None:
     assert (
         convert_schema_to_rules_text(
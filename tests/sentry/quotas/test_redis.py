@@ -6,7 +6,7 @@ import pytest
 
 from sentry.constants import DataCategory
 from sentry.quotas.base import QuotaConfig, QuotaScope, build_metric_abuse_quotas
-from sentry.quotas.redis import RedisQuota, is_rate_limited
+from sentry.quotas.redis import RedisQuota, is_rate_limited, is_rate_limited_many
 from sentry.sentry_metrics.use_case_id_registry import CARDINALITY_LIMIT_USE_CASES, UseCaseID
 from sentry.testutils.cases import TestCase
 from sentry.utils.redis import clusters
@@ -65,6 +65,45 @@ def test_is_rate_limited_script():
     assert list(map(bool, is_rate_limited(("orange", "apple"), (1, now + 60), client))) == [False]
 
 
+def test_is_rate_limited_many_script():
+    now = int(time.time())
+
+    cluster = clusters.get("default")
+    client = cluster.get_local_client(next(iter(cluster.hosts)))
+
+    # The first item consumes "many:foo", so the second one is rejected by it
+    # and must not consume "many:bar". The third item only checks "many:bar".
+    keys = (
+        "many:foo",
+        "r:many:foo",
+        "many:bar",
+        "r:many:bar",
+        "many:foo",
+        "r:many:foo",
+        "many:bar",
+        "r:many:bar",
+        "many:bar",
+        "r:many:bar",
+    )
+    args = (1, now + 60, 0, 2, now + 120, 0, 1, now + 60, 1, 2, now + 120, 1, 2, now + 120, 2)
+    assert list(map(bool, is_rate_limited_many(keys, args, client))) == [
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+    assert client.get("many:foo") == b"1"
+    assert 59 <= client.ttl("many:foo") <= 60
+
+    assert client.get("many:bar") == b"2"
+    assert 119 <= client.ttl("many:bar") <= 120
+
+    assert client.get("r:many:foo") is None
+    assert client.get("r:many:bar") is None
+
+
 class RedisQuotaTest(TestCase):
     @cached_property
     def quota(self):
@@ -560,3 +599,24 @@ class RedisQuotaTest(TestCase):
             0,  # unlimited quota was not consumed
             0,  # dummy quota was not consumed
         ]
+
+    def test_is_rate_limited_many(self):
+        timestamp = time.time()
+
+        self.get_project_quota.return_value = (3, 60)
+        self.get_organization_quota.return_value = (300, 60)
+        self.get_monitor_quota.return_value = (15, 60)
+
+        other_project = self.create_project(organization=self.create_organization())
+        items = [(self.project, None), (other_project, None)] * 4
+
+        results = self.quota.is_rate_limited_many(items, timestamp=timestamp)
+        assert [result.is_limited for result in results] == [False] * 6 + [True] * 2
+        assert results[-1].reason_code == "project_quota"
+
+        # the batch consumed the same quotas as checking every item in turn
+        assert self.quota.is_rate_limited(self.project, timestamp=timestamp).is_limited
+        usage = self.quota.get_usage(
+            self.project.organization_id, self.quota.get_quotas(self.project), timestamp=timestamp
+        )
+        assert usage == [3, 3, 0]
@@ -19,6 +19,18 @@ class RedisRateLimiterTest(TestCase):
             assert not self.backend.is_limited("foo", 1)
             assert self.backend.is_limited("foo", 1)
 
+    def test_is_limited_many(self):
+        with freeze_time("2000-01-01"):
+            assert not self.backend.is_limited("foo", 2)
+            assert self.backend.is_limited_many(["foo", "bar", "foo", "bar"], 2) == [
+                False,
+                False,
+                True,
+                False,
+            ]
+            assert self.backend.current_value("foo") == 3
+            assert self.backend.current_value("bar") == 2
+
     def test_correct_current_value(self):
         """Ensure that current_value get the correct value after the counter in incremented"""
 
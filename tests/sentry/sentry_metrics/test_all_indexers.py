@@ -14,6 +14,7 @@ from sentry.sentry_metrics.indexer.base import FetchType, FetchTypeExt, Metadata
 from sentry.sentry_metrics.indexer.cache import (
     BULK_RECORD_CACHE_NAMESPACE,
     CachingIndexer,
+    LocalStringIndexerCache,
     StringIndexerCache,
 )
 from sentry.sentry_metrics.indexer.mock import RawSimpleIndexer
@@ -294,6 +295,39 @@ def test_resolve_and_reverse_resolve(indexer, indexer_cache, use_case_id):
         assert indexer.reverse_resolve(use_case_id=use_case_id, org_id=org1_id, id=1234) is None
 
 
+def test_local_cache(indexer, indexer_cache, use_case_id) -> None:
+    """
+    Test that hot strings are served from the local cache once admitted, with
+    the same results and fetch metadata as a memcache hit.
+    """
+    with override_options(
+        {
+            "sentry-metrics.indexer.read-new-cache-namespace": False,
+            "sentry-metrics.indexer.write-new-cache-namespace": False,
+            "sentry-metrics.indexer.local-cache.enabled": True,
+        }
+    ):
+        org_id = 1
+        caching_indexer = CachingIndexer(
+            indexer_cache, indexer, LocalStringIndexerCache(admission_threshold=2)
+        )
+        strings = {use_case_id: {org_id: {"a", "b"}}}
+
+        first = caching_indexer.bulk_record(strings)
+        second = caching_indexer.bulk_record(strings)
+
+        # the strings were admitted after the second lookup, so the third one
+        # must not reach memcache at all
+        indexer_cache.cache.clear()
+        third = caching_indexer.bulk_record(strings)
+
+        assert first[use_case_id][org_id] == second[use_case_id][org_id]
+        assert third[use_case_id][org_id] == first[use_case_id][org_id]
+        assert_fetch_type_for_tag_string_set(
+            third.get_fetch_metadata()[use_case_id][org_id], FetchType.CACHE_HIT, {"a", "b"}
+        )
+
+
 def test_already_created_plus_written_results(indexer, indexer_cache, use_case_id) -> None:
     """
     Test that we correctly combine db read results with db write results
@@ -559,6 +593,48 @@ def test_rate_limited(indexer, use_case_id, writes_limiter_option_name):
     assert len(rate_limited_strings - rate_limited_strings2) == 2
 
 
+def test_rate_limited_local_cache(indexer, indexer_cache, use_case_id, writes_limiter_option_name):
+    """
+    Test that strings dropped by the writes limiter are answered from the
+    local cache until it expires, with the same fetch metadata.
+    """
+    if isinstance(indexer, RawSimpleIndexer):
+        pytest.skip("mock indexer does not support rate limiting")
+
+    caching_indexer = CachingIndexer(indexer_cache, indexer)
+
+    with override_options(
+        {
+            f"{writes_limiter_option_name}.per-org": [
+                {"window_seconds": 10, "granularity_seconds": 10, "limit": 1}
+            ],
+            "sentry-metrics.indexer.read-new-cache-namespace": False,
+            "sentry-metrics.indexer.local-cache.enabled": True,
+        }
+    ):
+        caching_indexer.bulk_record({use_case_id: {1: {"a"}}})
+        results = caching_indexer.bulk_record({use_case_id: {1: {"b"}}})
+
+    assert results[use_case_id][1] == {"b": None}
+    rate_limited = caching_indexer.local_cache.get_many([f"{use_case_id.value}:1:b"])[1]
+    assert rate_limited == {f"{use_case_id.value}:1:b": FetchTypeExt(is_global=False)}
+
+    with override_options(
+        {
+            "sentry-metrics.indexer.read-new-cache-namespace": False,
+            "sentry-metrics.indexer.local-cache.enabled": True,
+        }
+    ):
+        results = caching_indexer.bulk_record({use_case_id: {1: {"b"}}})
+
+    assert results[use_case_id][1] == {"b": None}
+    assert results.get_fetch_metadata()[use_case_id][1]["b"] == Metadata(
+        id=None,
+        fetch_type=FetchType.RATE_LIMITED,
+        fetch_type_ext=FetchTypeExt(is_global=False),
+    )
+
+
 def test_bulk_reverse_resolve(indexer):
     """
     Tests reverse resolve properly returns the corresponding strings
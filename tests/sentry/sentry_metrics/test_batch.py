@@ -1881,3 +1881,51 @@ def test_aggregation_options():
         assert get_aggregation_options("c:spans/count@none") == {
             AggregationOption.DISABLE_PERCENTILES: TimeWindow.NINETY_DAYS
         }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("should_index_tag_values", [True, False])
+def test_orjson_output_matches_rapidjson(should_index_tag_values):
+    """
+    With orjson, values are kept pre-serialized between extraction and reconstruction and spliced
+    into the output. The output must be the same as when re-dumping whole messages with rapidjson.
+    """
+    payloads = [
+        (counter_payload, counter_headers),
+        (distribution_payload, distribution_headers),
+        (set_payload, set_headers),
+    ]
+    strings = extracted_string_output[UseCaseID.SESSIONS][1]
+    mapping = {UseCaseID.SESSIONS: {1: {s: i for i, s in enumerate(sorted(strings), 1)}}}
+    bulk_record_meta = {
+        UseCaseID.SESSIONS: {
+            1: {
+                s: Metadata(id=i, fetch_type=FetchType.CACHE_HIT)
+                for i, s in enumerate(sorted(strings), 1)
+            }
+        }
+    }
+
+    outputs = []
+    for rollout in (0.0, 1.0):
+        with override_options({"sentry-metrics.indexer.reconstruct.enable-orjson": rollout}):
+            batch = IndexerBatch(
+                _construct_outer_message(payloads),
+                should_index_tag_values,
+                False,
+                tags_validator=ReleaseHealthTagsValidator().is_allowed,
+                schema_validator=MetricsSchemaValidator(
+                    INGEST_CODEC, RELEASE_HEALTH_SCHEMA_VALIDATION_RULES_OPTION_NAME
+                ).validate,
+            )
+            assert batch.extract_strings() == extracted_string_output
+            outputs.append(
+                _deconstruct_messages(
+                    batch.reconstruct_messages(mapping, bulk_record_meta).data,
+                    "snuba-metrics" if should_index_tag_values else "snuba-generic-metrics",
+                )
+            )
+
+    rapidjson_output, orjson_output = outputs
+    assert len(orjson_output) == 3
+    assert orjson_output == rapidjson_output
@@ -4,7 +4,8 @@ import pytest
 from django.conf import settings
 from django.utils import timezone
 
-from sentry.sentry_metrics.indexer.cache import StringIndexerCache
+from sentry.sentry_metrics.indexer.base import FetchTypeExt
+from sentry.sentry_metrics.indexer.cache import LocalStringIndexerCache, StringIndexerCache
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.testutils.helpers.options import override_options
 from sentry.utils.cache import cache
@@ -240,3 +241,31 @@ def test_is_valid_timestamp() -> None:
 
     assert not indexer_cache._is_valid_timestamp(str(stale_ts))
     assert indexer_cache._is_valid_timestamp(str(new_ts))
+
+
+def test_local_cache_admission_and_expiry() -> None:
+    now = 0.0
+    local_cache = LocalStringIndexerCache(
+        maxsize=10, ttl=60, admission_threshold=2, rate_limited_ttl=5, timer=lambda: now
+    )
+
+    # seen once, not admitted yet
+    assert local_cache.get_many(["sessions:1:a"]) == ({}, {})
+    local_cache.set_many({"sessions:1:a": 10})
+    assert local_cache.get_many(["sessions:1:a"]) == ({}, {})
+
+    # seen twice, admitted
+    local_cache.set_many({"sessions:1:a": 10})
+    assert local_cache.get_many(["sessions:1:a", "sessions:1:b"]) == ({"sessions:1:a": 10}, {})
+
+    local_cache.set_rate_limited({"sessions:1:b": FetchTypeExt(is_global=True)})
+    assert local_cache.get_many(["sessions:1:b"]) == (
+        {},
+        {"sessions:1:b": FetchTypeExt(is_global=True)},
+    )
+
+    now = 10.0
+    assert local_cache.get_many(["sessions:1:a", "sessions:1:b"]) == ({"sessions:1:a": 10}, {})
+
+    now = 61.0
+    assert local_cache.get_many(["sessions:1:a"]) == ({}, {})
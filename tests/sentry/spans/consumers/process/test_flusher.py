@@ -0,0 +1,43 @@
+import pytest
+from arroyo.processing.strategies.noop import Noop
+
+from sentry.spans.buffer import SpansBuffer
+from sentry.spans.consumers.process.flusher import SpanFlusher, get_shard_assignment
+
+
+@pytest.mark.parametrize(
+    ("shards", "num_processes", "expected"),
+    [
+        ([], 4, [[]]),
+        ([0, 1, 2], 1, [[0, 1, 2]]),
+        ([0, 1, 2], 2, [[0, 2], [1]]),
+        ([0, 1], 4, [[0], [1]]),
+    ],
+)
+def test_get_shard_assignment(shards, num_processes, expected):
+    assert get_shard_assignment(shards, num_processes) == expected
+
+
+def test_flusher_processes_own_disjoint_shards(monkeypatch):
+    flushed_shards = set()
+
+    def flush_segments(self, now, max_segments=0):
+        flushed_shards.add(tuple(self.assigned_shards))
+        if len(flushed_shards) == 2:
+            flusher.stopped.value = True
+        return {}
+
+    monkeypatch.setattr(SpansBuffer, "flush_segments", flush_segments)
+    monkeypatch.setattr("time.sleep", lambda _: None)
+
+    flusher = SpanFlusher(
+        SpansBuffer(assigned_shards=[0, 1, 2, 3]),
+        max_flush_segments=10,
+        produce_to_pipe=lambda payload: None,
+        next_step=Noop(),
+        flusher_processes=2,
+    )
+    flusher.join()
+
+    assert len(flusher.processes) == 2
+    assert flushed_shards == {(0, 2), (1, 3)}
@@ -496,3 +496,39 @@ def test_flush_rebalance(buffer: SpansBuffer):
     assert not rv
 
     assert_clean(buffer.client)
+
+
+def test_flush_oversized_segment_early(buffer: SpansBuffer):
+    buffer.max_segment_spans = 3
+
+    spans = [
+        Span(
+            payload=_payload(span_id.encode("ascii")),
+            trace_id="a" * 32,
+            span_id=span_id,
+            parent_span_id="a" * 16,
+            project_id=1,
+        )
+        for span_id in ("b" * 16, "c" * 16, "d" * 16)
+    ]
+
+    process_spans(spans, buffer, now=0)
+    assert_ttls(buffer.client)
+
+    # The segment has no root span, but it hit the size limit and does not
+    # wait for span_buffer_timeout_secs.
+    rv = buffer.flush_segments(now=0)
+    _normalize_output(rv)
+    assert rv == {
+        _segment_id(1, "a" * 32, "a" * 16): FlushedSegment(
+            queue_key=mock.ANY,
+            spans=[
+                _output_segment(b"b" * 16, b"a" * 16, False),
+                _output_segment(b"c" * 16, b"a" * 16, False),
+                _output_segment(b"d" * 16, b"a" * 16, False),
+            ],
+        ),
+    }
+
+    buffer.done_flush_segments(rv)
+    assert_clean(buffer.client)
@@ -9,9 +9,10 @@ from sentry.digests.backends.redis import RedisBackend
 from sentry.digests.notifications import event_to_record
 from sentry.models.projectownership import ProjectOwnership
 from sentry.models.rule import Rule
-from sentry.tasks.digests import deliver_digest
+from sentry.tasks.digests import deliver_digest, deliver_digests, schedule_digests
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.datetime import before_now
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.skips import requires_snuba
 
 pytestmark = [requires_snuba]
@@ -77,3 +78,69 @@ class DeliverDigestTest(TestCase):
     def test_no_records(self):
         # This shouldn't error if no records are present
         deliver_digest(f"mail:p:{self.project.id}:IssueOwners:")
+
+
+class DeliverDigestsTest(TestCase):
+    def add_records(self, backend: RedisBackend, key: str) -> None:
+        rule = Rule.objects.create(project=self.project, label="Test Rule", data={})
+        for fingerprint in ("group-1", "group-2"):
+            event = self.store_event(
+                data={"timestamp": before_now(days=1).isoformat(), "fingerprint": [fingerprint]},
+                project_id=self.project.id,
+            )
+            backend.add(
+                key,
+                event_to_record(event, [rule], str(uuid.uuid4())),
+                increment_delay=0,
+                maximum_delay=0,
+            )
+
+    def test_deliver_digests(self):
+        member = self.create_user()
+        self.create_member(user=member, organization=self.organization, teams=[self.team])
+        keys = [
+            f"mail:p:{self.project.id}:Member:{self.user.id}",
+            f"mail:p:{self.project.id}:Member:{member.id}",
+        ]
+
+        with mock.patch.object(sentry, "digests") as digests:
+            backend = RedisBackend()
+            digests.backend.digest_many = backend.digest_many
+            for key in keys:
+                self.add_records(backend, key)
+
+            with self.tasks(), override_options({"digests.delivery.concurrency": 1}):
+                deliver_digests(keys)
+
+        assert len(mail.outbox) == 2
+        assert all("2 new alerts since" in message.subject for message in mail.outbox)
+
+    @override_options({"digests.delivery.batch-size": 2})
+    def test_schedule_digests_in_batches(self):
+        other_project = self.create_project()
+        rule = Rule.objects.create(project=self.project, label="Test Rule", data={})
+        backend = RedisBackend()
+        keys = [
+            f"mail:p:{self.project.id}:IssueOwners::",
+            f"mail:p:{self.project.id}:Member:{self.user.id}",
+            f"mail:p:{self.project.id}:Member:{self.user.id + 1}",
+            f"mail:p:{other_project.id}:IssueOwners::",
+        ]
+        for key in keys:
+            backend.add(key, event_to_record(self.event, [rule]), increment_delay=0)
+            # Closing the digest moves the timeline to the waiting state, from
+            # which the next schedule picks it up.
+            with backend.digest(key, 0):
+                pass
+
+        with (
+            mock.patch.object(sentry, "digests") as digests,
+            mock.patch("sentry.tasks.digests.deliver_digests.delay") as delay,
+        ):
+            digests.backend = backend
+            schedule_digests()
+
+        batches = [call.args[0] for call in delay.call_args_list]
+        assert sorted(len(batch) for batch in batches) == [1, 1, 2]
+        assert sorted(key for batch in batches for key in batch) == sorted(keys)
+        assert [keys[3]] in batches
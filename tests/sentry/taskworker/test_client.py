@@ -53,6 +53,12 @@ class MockServiceMethod:
             raise res.response
         return res.response
 
+    def future(self, *args, **kwargs):
+        try:
+            return MockServiceFuture(self(*args, **kwargs))
+        except grpc.RpcError as err:
+            return err
+
     def with_call(self, *args, **kwargs):
         res = self.responses[0]
         if res.metadata:
@@ -62,6 +68,14 @@ class MockServiceMethod:
         return (res.response, None)
 
 
+@dataclasses.dataclass
+class MockServiceFuture:
+    response: Any
+
+    def result(self):
+        return self.response
+
+
 class MockChannel:
     def __init__(self):
         self._responses = defaultdict(list)
@@ -218,6 +232,53 @@ def test_get_task_failure():
             client.get_task()
 
 
+@django_db_all
+def test_get_tasks():
+    channel = MockChannel()
+    for task_id in ("abc123", "def456"):
+        channel.add_response(
+            "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+            GetTaskResponse(
+                task=TaskActivation(
+                    id=task_id,
+                    namespace="testing",
+                    taskname="do_thing",
+                    parameters="",
+                    headers={},
+                    processing_deadline_duration=10,
+                )
+            ),
+        )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+        MockGrpcError(grpc.StatusCode.NOT_FOUND, "no pending task found"),
+    )
+    with patch("sentry.taskworker.client.grpc.insecure_channel") as mock_channel:
+        mock_channel.return_value = channel
+        client = TaskworkerClient("localhost:50051", 1)
+        result = client.get_tasks(namespace="testing", max_tasks=3)
+
+        assert [task.id for task in result] == ["abc123", "def456"]
+        assert client._task_id_to_host == {
+            "abc123": "localhost-0:50051",
+            "def456": "localhost-0:50051",
+        }
+
+
+@django_db_all
+def test_get_tasks_failure():
+    channel = MockChannel()
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+        MockGrpcError(grpc.StatusCode.INTERNAL, "something bad"),
+    )
+    with patch("sentry.taskworker.client.grpc.insecure_channel") as mock_channel:
+        mock_channel.return_value = channel
+        client = TaskworkerClient("localhost:50051", 1)
+        with pytest.raises(grpc.RpcError):
+            client.get_tasks(max_tasks=2)
+
+
 @django_db_all
 def test_update_task_ok_with_next():
     channel = MockChannel()
@@ -1,3 +1,4 @@
+import importlib
 import queue
 import time
 from multiprocessing import Event
@@ -127,6 +128,95 @@ class TestTaskWorker(TestCase):
             mock_get.assert_called_once()
         assert task is None
 
+    def test_fetch_tasks(self) -> None:
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            process_type="fork",
+            concurrency=4,
+            fetch_batch_size=3,
+        )
+        with mock.patch.object(taskworker.client, "get_tasks") as mock_get:
+            mock_get.return_value = [SIMPLE_TASK, RETRY_TASK]
+
+            assert taskworker._add_task()
+            mock_get.assert_called_once_with(None, 3)
+
+        assert taskworker._child_tasks.get(timeout=1).id == SIMPLE_TASK.id
+        assert taskworker._child_tasks.get(timeout=1).id == RETRY_TASK.id
+        assert set(taskworker._task_receive_timing) == {SIMPLE_TASK.id, RETRY_TASK.id}
+
+    def test_fetch_tasks_capped_by_child_queue_size(self) -> None:
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            process_type="fork",
+            concurrency=16,
+            fetch_batch_size=16,
+            child_tasks_queue_maxsize=5,
+        )
+        with mock.patch.object(taskworker.client, "get_tasks") as mock_get:
+            mock_get.return_value = [SIMPLE_TASK]
+
+            assert taskworker._add_task()
+            mock_get.assert_called_once_with(None, 5)
+
+    def test_fetch_tasks_none_found(self) -> None:
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            process_type="fork",
+            fetch_batch_size=3,
+        )
+        with mock.patch.object(taskworker.client, "get_tasks") as mock_get:
+            mock_get.return_value = []
+
+            assert not taskworker._add_task()
+            mock_get.assert_called_once_with(None, 1)
+
+        assert taskworker._gettask_backoff_seconds == 1
+
+    def test_forkserver_process_type(self) -> None:
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051", num_brokers=1, process_type="forkserver"
+        )
+        assert taskworker.mp_context.get_start_method() == "forkserver"
+
+    def test_forkserver_preload_survives_init_errors(self) -> None:
+        import sentry.taskworker.preload
+
+        with (
+            mock.patch(
+                "sentry.taskworker.workerchild.child_worker_init",
+                side_effect=RuntimeError("boom"),
+            ) as init,
+            self.assertLogs("sentry.taskworker.worker", level="ERROR") as logs,
+        ):
+            importlib.reload(sentry.taskworker.preload)
+
+        init.assert_called_once_with("forkserver")
+        assert logs.records[0].getMessage() == "taskworker.forkserver.preload_failed"
+
+    def test_child_max_task_count_staggered(self) -> None:
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            process_type="fork",
+            concurrency=4,
+        )
+        assert [taskworker._get_child_max_task_count(i, 4) for i in range(4)] == [
+            100,
+            88,
+            75,
+            63,
+        ]
+        # A single replacement child gets the full limit.
+        assert taskworker._get_child_max_task_count(0, 1) == 100
+
     def test_run_once_no_next_task(self) -> None:
         max_runtime = 5
         taskworker = TaskWorker(
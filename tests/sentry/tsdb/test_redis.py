@@ -1,5 +1,6 @@
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from unittest import mock
 
 import pytest
 
@@ -67,6 +68,28 @@ class RedisTSDBTest(TestCase):
         result = self.db.make_counter_key(TSDBModel.project, 1, to_datetime(1368889980), "foo", 1)
         assert result == ("ts:1:1368889980:46", str(self.db.get_model_key("foo")) + "?e=1")
 
+    def test_get_range_many_keys(self):
+        now = datetime.now(timezone.utc) - timedelta(hours=4)
+        dts = [now + timedelta(hours=i) for i in range(4)]
+
+        # 1 and 65 land on the same vnode, "foo" is hashed to another one
+        keys = [1, 65, "foo"]
+        for key in keys:
+            self.db.incr(TSDBModel.group, key, dts[1], count=2)
+
+        results = self.db.get_range(TSDBModel.group, keys + [1], dts[0], dts[-1])
+        assert list(results) == keys
+        for key in keys:
+            assert [count for _, count in results[key]] == [0, 2, 0, 0]
+
+        with mock.patch.object(
+            self.db, "get_counter_vnode_and_field", wraps=self.db.get_counter_vnode_and_field
+        ) as get_counter_vnode_and_field:
+            self.db.get_range(TSDBModel.group, keys, dts[0], dts[-1])
+
+        # Keys are hashed once, not once per timestamp.
+        assert get_counter_vnode_and_field.call_count == len(keys)
+
     def test_get_model_key(self):
         result = self.db.get_model_key(1)
         assert result == 1
@@ -13,16 +13,19 @@ from sentry.issues.grouptype import (
 )
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers import override_options
-from sentry.testutils.performance_issues.event_generators import get_event
+from sentry.testutils.performance_issues.event_generators import EVENTS, get_event
 from sentry.utils.performance_issues.base import DetectorType, total_span_time
 from sentry.utils.performance_issues.detectors.n_plus_one_db_span_detector import (
     NPlusOneDBSpanDetector,
 )
 from sentry.utils.performance_issues.performance_detection import (
+    DETECTOR_CLASSES,
     EventPerformanceProblem,
     _detect_performance_problems,
     detect_performance_problems,
     get_detection_settings,
+    run_detector_on_data,
+    run_detectors_on_data,
 )
 from sentry.utils.performance_issues.performance_problem import PerformanceProblem
 
@@ -697,3 +700,20 @@ class EventPerformanceProblemTest(TestCase):
 )
 def test_total_span_time(spans, duration):
     assert total_span_time(spans) == pytest.approx(duration, 0.01)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("event_name", sorted(EVENTS))
+def test_run_detectors_on_data_matches_separate_runs(event_name):
+    settings = get_detection_settings()
+    event = get_event(event_name)
+
+    separate_detectors = [cls(settings, event) for cls in DETECTOR_CLASSES]
+    for detector in separate_detectors:
+        run_detector_on_data(detector, event)
+
+    fused_detectors = [cls(settings, event) for cls in DETECTOR_CLASSES]
+    run_detectors_on_data(fused_detectors, event)
+
+    for separate, fused in zip(separate_detectors, fused_detectors):
+        assert fused.stored_problems == separate.stored_problems, separate.type
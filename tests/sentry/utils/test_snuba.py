@@ -1,3 +1,4 @@
+import threading
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
@@ -12,12 +13,16 @@ from sentry.models.project import Project
 from sentry.models.release import Release
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.snuba import (
     ROUND_UP,
     RetrySkipTimeout,
     SnubaQueryParams,
     UnqualifiedQueryError,
+    _get_query_thread_pool,
     _prepare_query_params,
+    _query_thread_pool,
+    _single_flight_bulk_snuba_query,
     get_json_type,
     get_query_params_to_update_for_projects,
     get_snuba_column_name,
@@ -412,6 +417,74 @@ class QuantizeTimeTest(unittest.TestCase):
         assert i != j
 
 
+class SingleFlightTest(TestCase):
+    def test_coalesces_identical_queries(self):
+        request = mock.Mock(referrer="test")
+        started = threading.Event()
+        coalesced = threading.Event()
+
+        def bulk_snuba_query(requests):
+            started.set()
+            assert coalesced.wait(5)
+            return [{"data": [{"count": 1}]}]
+
+        def incr(key, *args, **kwargs):
+            if key == "snuba.query_single_flight.coalesced":
+                coalesced.set()
+
+        results = {}
+
+        def run(name, query_pos):
+            results[name] = _single_flight_bulk_snuba_query([(query_pos, request, "cache-key")])
+
+        with (
+            mock.patch(
+                "sentry.utils.snuba._bulk_snuba_query", side_effect=bulk_snuba_query
+            ) as bulk_mock,
+            mock.patch("sentry.utils.snuba.metrics.incr", side_effect=incr),
+        ):
+            leader = threading.Thread(target=run, args=("leader", 0))
+            leader.start()
+            assert started.wait(5)
+            waiter = threading.Thread(target=run, args=("waiter", 1))
+            waiter.start()
+            leader.join(5)
+            waiter.join(5)
+
+        assert bulk_mock.call_count == 1
+        assert results["leader"] == [(0, {"data": [{"count": 1}]})]
+        assert results["waiter"] == [(1, {"data": [{"count": 1}]})]
+        assert results["leader"][0][1] is not results["waiter"][0][1]
+
+    def test_leader_error_is_shared(self):
+        request = mock.Mock(referrer="test")
+        with (
+            mock.patch("sentry.utils.snuba._bulk_snuba_query", side_effect=ValueError),
+            pytest.raises(ValueError),
+        ):
+            _single_flight_bulk_snuba_query([(0, request, "cache-key")])
+
+        # A failed query is not left in flight.
+        with mock.patch(
+            "sentry.utils.snuba._bulk_snuba_query", return_value=[{"data": []}]
+        ) as bulk_mock:
+            assert _single_flight_bulk_snuba_query([(0, request, "cache-key")]) == [
+                (0, {"data": []})
+            ]
+        assert bulk_mock.call_count == 1
+
+    @override_options({"snuba.query-thread-pool-sizes": {"search": 2}})
+    def test_referrer_query_thread_pool(self):
+        pool = _get_query_thread_pool("search")
+        assert pool is not _query_thread_pool
+        assert pool is _get_query_thread_pool("search")
+        assert _get_query_thread_pool("api.organization-events") is _query_thread_pool
+        assert _get_query_thread_pool(None) is _query_thread_pool
+
+        with override_options({"snuba.query-thread-pool-sizes": {"search": 4}}):
+            assert _get_query_thread_pool("search") is not pool
+
+
 class FakeConnectionPool(HTTPConnectionPool):
     def __init__(self, connection, **kwargs):
         self.connection = connection